@@ -1,8 +1,12 @@
 from flask import Flask
 from dotenv import load_dotenv
+from .compression import init_compression
 from .config import Config
-from .routes import register_routes
 from .models import db
+from .profiling import init_profiling
+from .query_budget import init_query_tracking
+from .templating import init_templates
+from .uploads import SpooledUploadRequest
 import os
 
 
@@ -11,24 +15,43 @@ load_dotenv()
 
 def create_app(config_object=None):
     app = Flask(__name__, template_folder="../templates", static_folder="../static")
+    app.request_class = SpooledUploadRequest
 
     if config_object:
         app.config.from_object(config_object)
     else:
         app.config.from_object(Config)
 
-    upload_folder = app.config.get("UPLOAD_FOLDER", "uploads")
+    app.config.setdefault("UPLOAD_SPOOL_MAX_SIZE", Config.UPLOAD_SPOOL_MAX_SIZE)
+    upload_folder = app.config.setdefault("UPLOAD_FOLDER", "uploads")
     os.makedirs(upload_folder, exist_ok=True)
 
     db.init_app(app)
+    init_templates(app)
 
     from .extensions import init_ai_providers
 
     init_ai_providers(app)
 
+    # Registered before the routes' hooks so they cover all of them
+    init_profiling(app)
+    init_query_tracking(app)
+
+    # Imported here so that `import app.exceptions` (done by utils) does not
+    # pull in every route, service and parser module
+    from .routes import register_routes
+
     register_routes(app)
+    init_compression(app)
+
+    from .cli import register_commands
+
+    register_commands(app)
 
-    with app.app_context():
-        db.create_all()
+    # Creating the schema is a deploy step (`flask init-db`), not something
+    # every worker should do while booting
+    if app.config.get("CREATE_SCHEMA_ON_STARTUP", False):
+        with app.app_context():
+            db.create_all()
 
     return app
@@ -0,0 +1,139 @@
+import sys
+import click
+from flask.cli import AppGroup, with_appcontext
+from .models import db
+from .repositories import (
+    AnalyticsRepository,
+    ArchiveRepository,
+    DocumentRepository,
+    ExportRepository,
+    SearchRepository,
+    SessionRepository,
+)
+from .services import ExportService, SessionService
+
+
+sessions_cli = AppGroup("sessions", help="Maintenance commands for interview sessions.")
+search_cli = AppGroup("search", help="Manage the full-text search index.")
+analytics_cli = AppGroup(
+    "analytics", help="Manage the materialized progress analytics."
+)
+
+
+def register_commands(app):
+    app.cli.add_command(init_db)
+    app.cli.add_command(sessions_cli)
+    app.cli.add_command(search_cli)
+    app.cli.add_command(analytics_cli)
+
+
+@click.command("init-db")
+@with_appcontext
+def init_db():
+    """Create any missing tables and indexes. Safe to run on every deploy."""
+    db.create_all()
+    # create_all() skips tables that already exist, so indexes added to an
+    # existing table's model (e.g. sessions.user_id) are created here
+    for table in db.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(db.engine, checkfirst=True)
+    click.echo("Database schema is up to date.")
+
+
+@sessions_cli.command("purge")
+@click.option(
+    "--older-than-days",
+    type=click.IntRange(min=0),
+    required=True,
+    help="Delete sessions created more than this many days ago.",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=SessionRepository.DELETE_BATCH_SIZE,
+    show_default=True,
+    help="Sessions deleted per transaction.",
+)
+def purge_sessions(older_than_days, batch_size):
+    """Delete old sessions with their messages and feedback."""
+    session_service = SessionService(SessionRepository())
+    purged = session_service.purge_sessions(older_than_days, batch_size=batch_size)
+    orphans = DocumentRepository().delete_unreferenced()
+    click.echo(f"Purged {purged} session(s) and {orphans} unreferenced document(s).")
+
+
+@sessions_cli.command("archive")
+@click.option(
+    "--older-than-days",
+    type=click.IntRange(min=0),
+    required=True,
+    help="Archive completed sessions created more than this many days ago.",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=ArchiveRepository.ARCHIVE_BATCH_SIZE,
+    show_default=True,
+    help="Sessions archived per transaction.",
+)
+def archive_sessions(older_than_days, batch_size):
+    """Move completed sessions into the compressed archive."""
+    session_repo = SessionRepository()
+    session_service = SessionService(session_repo, ArchiveRepository(session_repo))
+    archived = session_service.archive_sessions(older_than_days, batch_size=batch_size)
+    orphans = DocumentRepository().delete_unreferenced()
+    click.echo(
+        f"Archived {archived} session(s) and removed {orphans} unreferenced document(s)."
+    )
+
+
+@sessions_cli.command("export")
+@click.option(
+    "--since",
+    type=click.DateTime(),
+    default=None,
+    help="Only sessions created at or after this time.",
+)
+@click.option(
+    "--until",
+    type=click.DateTime(),
+    default=None,
+    help="Only sessions created before this time.",
+)
+@click.option("--gzip", "compress", is_flag=True, help="Gzip-compress the output.")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True, allow_dash=True),
+    default="-",
+    show_default=True,
+    help="File to write to; '-' writes to stdout.",
+)
+def export_sessions(since, until, compress, output):
+    """Stream sessions, transcripts and feedback as NDJSON."""
+    chunks = ExportService(ExportRepository()).stream_ndjson(
+        since=since, until=until, compress=compress
+    )
+    if output == "-":
+        for chunk in chunks:
+            sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+        return
+
+    with open(output, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+
+@search_cli.command("reindex")
+def reindex_search():
+    """Rebuild the search index from sessions, messages, feedback and the archive."""
+    indexed = SearchRepository().rebuild()
+    click.echo(f"Indexed {indexed} entries.")
+
+
+@analytics_cli.command("rebuild")
+def rebuild_analytics():
+    """Recompute per-user progress from every completed session."""
+    rows = AnalyticsRepository().rebuild()
+    click.echo(f"Rebuilt {rows} progress row(s).")
@@ -0,0 +1,74 @@
+import gzip
+import brotli
+from flask import Response, current_app, request
+from .config import Config
+
+
+# Text responses worth compressing; everything else is already compressed
+# (PDF, DOCX, images) or served precompressed (/assets/)
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/javascript",
+    "text/plain",
+}
+
+
+def compress_response(response: Response) -> Response:
+    """Compress a buffered text response with brotli or gzip.
+
+    Skipped for streamed and file responses, for responses that are already
+    encoded and for bodies under COMPRESS_MIN_SIZE bytes, where the framing
+    costs more than it saves.
+    """
+    config = current_app.config
+    if (
+        not config["COMPRESS_ENABLED"]
+        or response.status_code != 200
+        or response.is_streamed
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_TYPES
+    ):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    if response.content_length is None or (
+        response.content_length < config["COMPRESS_MIN_SIZE"]
+    ):
+        return response
+
+    accept = request.accept_encodings
+    data = response.get_data()
+    if accept.quality("br") > 0:
+        encoding = "br"
+        data = brotli.compress(
+            data, mode=brotli.MODE_TEXT, quality=config["COMPRESS_BROTLI_QUALITY"]
+        )
+    elif accept.quality("gzip") > 0:
+        encoding = "gzip"
+        data = gzip.compress(data, compresslevel=config["COMPRESS_GZIP_LEVEL"])
+    else:
+        return response
+
+    response.set_data(data)
+    response.headers["Content-Encoding"] = encoding
+    # Another encoding is another representation; a weak validator still
+    # matches it for conditional requests
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app) -> None:
+    for key in (
+        "COMPRESS_ENABLED",
+        "COMPRESS_MIN_SIZE",
+        "COMPRESS_GZIP_LEVEL",
+        "COMPRESS_BROTLI_QUALITY",
+    ):
+        app.config.setdefault(key, getattr(Config, key))
+    app.after_request(compress_response)
@@ -8,9 +8,91 @@ class Config:
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
     UPLOAD_FOLDER = os.getenv("UPLOAD_FOLDER", "uploads")
     MAX_CONTENT_LENGTH = int(os.getenv("MAX_CONTENT_LENGTH", 16 * 1024 * 1024))
+    # Uploads are parsed from memory; only larger files spill to UPLOAD_FOLDER
+    UPLOAD_SPOOL_MAX_SIZE = int(os.getenv("UPLOAD_SPOOL_MAX_SIZE", 1024 * 1024))
 
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL", "sqlite:///dev.db")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Off in production: run `flask init-db` once per deploy instead
+    CREATE_SCHEMA_ON_STARTUP = (
+        os.getenv("CREATE_SCHEMA_ON_STARTUP", "false").lower() == "true"
+    )
+
+    # Parse uploads in a separate, resource-limited process pool
+    PARSER_SANDBOX_ENABLED = (
+        os.getenv("PARSER_SANDBOX_ENABLED", "true").lower() == "true"
+    )
+    PARSER_WORKERS = int(os.getenv("PARSER_WORKERS", 2))
+    PARSER_TIMEOUT = float(os.getenv("PARSER_TIMEOUT", 30))
+    PARSER_MEMORY_LIMIT_MB = int(os.getenv("PARSER_MEMORY_LIMIT_MB", 1024))
+    PARSER_MAX_PAGES = int(os.getenv("PARSER_MAX_PAGES", 100))
+    PARSER_MAX_JOBS_PER_WORKER = int(os.getenv("PARSER_MAX_JOBS_PER_WORKER", 50))
+
+    # Stop parsing a CV after this many characters (prompts use ~2000); 0 = all
+    CV_CHAR_BUDGET = int(os.getenv("CV_CHAR_BUDGET", 6000))
+    # Finish parsing budget-truncated CVs in a background thread, then pick
+    # the CV's sections again from the full text
+    CV_BACKGROUND_FULL_PARSE = (
+        os.getenv("CV_BACKGROUND_FULL_PARSE", "true").lower() == "true"
+    )
+    BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", 2))
+    # Parse CV uploads in a background job and poll for the result
+    UPLOAD_ASYNC = os.getenv("UPLOAD_ASYNC", "true").lower() == "true"
+    # Upload jobs without progress for this long are reported as failed
+    UPLOAD_JOB_TIMEOUT = float(os.getenv("UPLOAD_JOB_TIMEOUT", 120))
+
+    # Parsed uploads kept in each worker's memory; misses fall back to the DB
+    PARSE_CACHE_SIZE = int(os.getenv("PARSE_CACHE_SIZE", 128))
+
+    # Compiled templates are cached on disk (keyed by source checksum) so new
+    # workers skip compiling them; empty = a per-user temp directory
+    TEMPLATE_BYTECODE_CACHE = (
+        os.getenv("TEMPLATE_BYTECODE_CACHE", "true").lower() == "true"
+    )
+    TEMPLATE_CACHE_DIR = os.getenv("TEMPLATE_CACHE_DIR", "")
+    # Compile every template in create_app() rather than on first use
+    TEMPLATE_WARMUP = os.getenv("TEMPLATE_WARMUP", "false").lower() == "true"
+
+    # Rendered feedback and finished interview pages kept in each worker's
+    # memory; with RENDER_CACHE_SHARED they are also stored for all workers
+    RENDER_CACHE_SIZE = int(os.getenv("RENDER_CACHE_SIZE", 256))
+    RENDER_CACHE_SHARED = os.getenv("RENDER_CACHE_SHARED", "false").lower() == "true"
+
+    # Browser tokens and session owners kept in each worker's memory
+    OWNERSHIP_CACHE_SIZE = int(os.getenv("OWNERSHIP_CACHE_SIZE", 4096))
+
+    # Memoize repository reads within a request (see app/container.py)
+    REQUEST_CACHE_ENABLED = os.getenv("REQUEST_CACHE_ENABLED", "true").lower() == "true"
+
+    # Compress text responses of at least COMPRESS_MIN_SIZE bytes; levels are
+    # tuned for per-request compression, not for the prebuilt /assets/ files
+    COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "true").lower() == "true"
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", 500))
+    COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", 6))
+    COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", 4))
+
+    # Count and time each request's SQL statements (see app/query_budget.py);
+    # views over their @query_budget are logged, or fail with
+    # QUERY_BUDGET_RAISE, and repeated statements are logged as likely N+1s
+    QUERY_TRACKING_ENABLED = (
+        os.getenv("QUERY_TRACKING_ENABLED", "true").lower() == "true"
+    )
+    # Send the counts in a Server-Timing header even outside debug and testing
+    QUERY_TIMING_HEADER = os.getenv("QUERY_TIMING_HEADER", "false").lower() == "true"
+    QUERY_BUDGET_RAISE = os.getenv("QUERY_BUDGET_RAISE", "false").lower() == "true"
+    QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", 5))
+
+    # Bearer token for /admin endpoints; they are disabled while it is empty
+    ADMIN_API_TOKEN = os.getenv("ADMIN_API_TOKEN", "")
+
+    # Sampling profiler for single requests, served from /admin/profiles. A
+    # request is profiled if it sends X-Profile-Token: <ADMIN_API_TOKEN> or
+    # is picked at PROFILE_SAMPLE_RATE; when disabled no hook is installed
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+    PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", 0.0))
+    PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", 2))
+    PROFILE_MAX_STORED = int(os.getenv("PROFILE_MAX_STORED", 50))
+    PROFILE_RETENTION_SECONDS = int(os.getenv("PROFILE_RETENTION_SECONDS", 3600))
 
     OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY", "")
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
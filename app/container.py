@@ -0,0 +1,224 @@
+from functools import cached_property
+from flask import current_app, g
+from .jobs import get_background_jobs
+from .repositories import (
+    AnalyticsRepository,
+    ArchiveRepository,
+    ExportRepository,
+    FeedbackRepository,
+    FileRepository,
+    MessageRepository,
+    OwnershipRepository,
+    ParseCacheRepository,
+    RenderCacheRepository,
+    SearchRepository,
+    SessionRepository,
+    UploadJobRepository,
+    UserRepository,
+)
+from .repositories.ownership_repository import OwnershipMemory
+from .repositories.parse_cache_repository import ParseCacheMemory
+from .repositories.render_cache_repository import RenderCacheMemory
+from .repositories.request_cache import NullCache, RequestCache
+from .services import (
+    AnalyticsService,
+    DocumentService,
+    ExportService,
+    FeedbackService,
+    InterviewService,
+    SearchService,
+    SessionService,
+)
+
+
+class ServiceContainer:
+    """Builds repositories and services once per request and shares them
+    between every blueprint handling that request."""
+
+    def __init__(self, app):
+        self.app = app
+        if app.config.get("REQUEST_CACHE_ENABLED", True):
+            self.cache = RequestCache()
+        else:
+            self.cache = NullCache()
+
+    @cached_property
+    def search_repository(self) -> SearchRepository:
+        return SearchRepository()
+
+    @cached_property
+    def render_cache_repository(self) -> RenderCacheRepository:
+        return RenderCacheRepository(
+            get_render_cache_memory(self.app),
+            shared=self.app.config.get("RENDER_CACHE_SHARED", False),
+        )
+
+    @cached_property
+    def session_repository(self) -> SessionRepository:
+        return SessionRepository(
+            cache=self.cache,
+            search_repository=self.search_repository,
+            render_cache=self.render_cache_repository,
+        )
+
+    @cached_property
+    def message_repository(self) -> MessageRepository:
+        return MessageRepository(
+            cache=self.cache, search_repository=self.search_repository
+        )
+
+    @cached_property
+    def analytics_repository(self) -> AnalyticsRepository:
+        return AnalyticsRepository()
+
+    @cached_property
+    def feedback_repository(self) -> FeedbackRepository:
+        return FeedbackRepository(
+            cache=self.cache,
+            search_repository=self.search_repository,
+            analytics_repository=self.analytics_repository,
+            render_cache=self.render_cache_repository,
+        )
+
+    @cached_property
+    def user_repository(self) -> UserRepository:
+        return UserRepository()
+
+    @cached_property
+    def archive_repository(self) -> ArchiveRepository:
+        return ArchiveRepository(self.session_repository)
+
+    @cached_property
+    def file_repository(self) -> FileRepository:
+        return FileRepository(
+            self.app.config["UPLOAD_FOLDER"],
+            self.app.config["UPLOAD_SPOOL_MAX_SIZE"],
+        )
+
+    @cached_property
+    def parse_cache_repository(self) -> ParseCacheRepository:
+        return ParseCacheRepository(get_parse_cache_memory(self.app))
+
+    @cached_property
+    def ownership_repository(self) -> OwnershipRepository:
+        return OwnershipRepository(get_ownership_memory(self.app))
+
+    @cached_property
+    def session_service(self) -> SessionService:
+        return SessionService(
+            self.session_repository,
+            self.archive_repository,
+            self.user_repository,
+            self.ownership_repository,
+        )
+
+    @cached_property
+    def document_service(self) -> DocumentService:
+        return DocumentService(
+            self.session_repository,
+            self.file_repository,
+            self.parse_cache_repository,
+            get_document_parser(self.app),
+            char_budget=self.app.config.get("CV_CHAR_BUDGET") or None,
+            background_jobs=get_background_jobs(self.app),
+            upload_job_repository=(
+                UploadJobRepository()
+                if self.app.config.get("UPLOAD_ASYNC", False)
+                else None
+            ),
+            background_full_parse=self.app.config.get(
+                "CV_BACKGROUND_FULL_PARSE", True
+            ),
+            upload_job_timeout=self.app.config.get("UPLOAD_JOB_TIMEOUT", 120),
+        )
+
+    @cached_property
+    def export_service(self) -> ExportService:
+        return ExportService(ExportRepository())
+
+    @cached_property
+    def search_service(self) -> SearchService:
+        return SearchService(self.search_repository)
+
+    @cached_property
+    def analytics_service(self) -> AnalyticsService:
+        return AnalyticsService(self.analytics_repository)
+
+    @cached_property
+    def interview_service(self) -> InterviewService:
+        from .extensions import get_ai_client
+
+        return InterviewService(
+            self.session_repository, self.message_repository, get_ai_client()
+        )
+
+    @cached_property
+    def feedback_service(self) -> FeedbackService:
+        from .extensions import get_ai_client
+
+        return FeedbackService(
+            self.session_repository,
+            self.message_repository,
+            self.feedback_repository,
+            get_ai_client(),
+            self.archive_repository,
+        )
+
+
+def get_parse_cache_memory(app) -> ParseCacheMemory:
+    """The worker-wide LRU tier of the parse cache, created on first use"""
+    if "parse_cache" not in app.extensions:
+        app.extensions["parse_cache"] = ParseCacheMemory(
+            app.config.get("PARSE_CACHE_SIZE", 128)
+        )
+    return app.extensions["parse_cache"]
+
+
+def get_ownership_memory(app) -> OwnershipMemory:
+    """The worker-wide LRU in front of browser and session ownership lookups"""
+    if "ownership_cache" not in app.extensions:
+        app.extensions["ownership_cache"] = OwnershipMemory(
+            app.config.get("OWNERSHIP_CACHE_SIZE", 4096)
+        )
+    return app.extensions["ownership_cache"]
+
+
+def get_render_cache_memory(app) -> RenderCacheMemory:
+    """The worker-wide LRU tier of the render cache, created on first use"""
+    if "render_cache" not in app.extensions:
+        app.extensions["render_cache"] = RenderCacheMemory(
+            app.config.get("RENDER_CACHE_SIZE", 256)
+        )
+    return app.extensions["render_cache"]
+
+
+def get_document_parser(app):
+    """The worker-wide sandboxed parser pool, or the in-process parser when
+    PARSER_SANDBOX_ENABLED is off"""
+    # utils imports app.exceptions, so importing it at module level is circular
+    from utils.document_parser import InProcessParser
+    from utils.parser_pool import SandboxedParser
+
+    if "document_parser" in app.extensions:
+        return app.extensions["document_parser"]
+    if not app.config.get("PARSER_SANDBOX_ENABLED", False):
+        app.extensions["document_parser"] = InProcessParser(
+            max_pages=app.config.get("PARSER_MAX_PAGES", 100),
+            # Uploads may be large; keep their copies with the other spills
+            spool_dir=app.config.get("UPLOAD_FOLDER"),
+        )
+    else:
+        app.extensions["document_parser"] = SandboxedParser(
+            workers=app.config["PARSER_WORKERS"],
+            timeout=app.config["PARSER_TIMEOUT"],
+            memory_limit_mb=app.config["PARSER_MEMORY_LIMIT_MB"],
+            max_pages=app.config["PARSER_MAX_PAGES"],
+            max_jobs_per_worker=app.config["PARSER_MAX_JOBS_PER_WORKER"],
+        )
+    return app.extensions["document_parser"]
+
+
+def get_container() -> ServiceContainer:
+    if "container" not in g:
+        g.container = ServiceContainer(current_app._get_current_object())
+    return g.container
@@ -16,3 +16,7 @@ class DocumentParsingError(InterviewSimulatorException):
 
 class AIServiceError(InterviewSimulatorException):
     pass
+
+
+class QueryBudgetExceeded(InterviewSimulatorException):
+    pass
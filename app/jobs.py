@@ -0,0 +1,42 @@
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundJobs:
+    """Runs work after the response in a small per-process thread pool.
+
+    Each job gets its own application context, and with it its own database
+    session and service container.
+    """
+
+    def __init__(self, app, max_workers: int = 2):
+        self.app = app
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="background-job"
+        )
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        return self._executor.submit(self._run, fn, args, kwargs)
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, fn, args, kwargs):
+        with self.app.app_context():
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                logger.exception(f"Background job {fn.__name__} failed")
+                raise
+
+
+def get_background_jobs(app) -> BackgroundJobs:
+    """The worker-wide job pool, created on first use"""
+    if "background_jobs" not in app.extensions:
+        app.extensions["background_jobs"] = BackgroundJobs(
+            app, app.config.get("BACKGROUND_WORKERS", 2)
+        )
+    return app.extensions["background_jobs"]
@@ -0,0 +1,87 @@
+"""Process lifecycle hooks for pre-forking servers (gunicorn with preload_app).
+
+The master process builds the app once and calls `prepare_for_fork`, which
+loads everything that is read-only and expensive: compiled templates,
+parser and prompt modules, the provider SDK modules. Workers then share
+those pages copy-on-write. Anything that owns a socket, a thread, a lock
+or a child process must not cross the fork, so each worker calls
+`after_fork` to drop it and build its own.
+"""
+
+import importlib
+import logging
+
+from .models import db
+from .templating import warm_templates
+
+
+logger = logging.getLogger(__name__)
+
+# Modules workers would otherwise import on their first upload or question
+WARM_MODULES = (
+    "utils.cv_structure",
+    "utils.document_parser",
+    "utils.docx_extractor",
+    "utils.parser_pool",
+    "utils.pdf_extractor",
+    "utils.prompt_templates",
+    "pypdf",
+)
+PROVIDER_SDK_MODULES = {
+    "GEMINI_API_KEY": "google.genai",
+    "OPENROUTER_API_KEY": "requests",
+}
+
+# app.extensions entries holding pools, threads or locks; their getters
+# recreate them on first use in the worker
+PER_PROCESS_EXTENSIONS = (
+    "background_jobs",
+    "document_parser",
+    "ownership_cache",
+    "parse_cache",
+    "profiles",
+    "render_cache",
+)
+
+
+def prepare_for_fork(app) -> None:
+    """Load shared read-only state in the master, once, before any fork"""
+    warm_templates(app)
+
+    modules = list(WARM_MODULES)
+    modules += [
+        module for key, module in PROVIDER_SDK_MODULES.items() if app.config.get(key)
+    ]
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            logger.warning(f"Could not preload {module}: {e}")
+
+    before_fork(app)
+
+
+def before_fork(app) -> None:
+    """Make sure no pooled database connection is inherited by a worker"""
+    with app.app_context():
+        db.engine.dispose()
+
+
+def after_fork(app) -> None:
+    """Give a freshly forked worker its own connections, pools and clients"""
+    from utils.pdf_extractor import PdfExtractor
+
+    from .extensions import init_ai_providers
+
+    with app.app_context():
+        # close=False: the connections belong to the parent, only forget them
+        db.engine.dispose(close=False)
+
+    for name in PER_PROCESS_EXTENSIONS:
+        # Never shut these down here; their threads and processes are the
+        # parent's
+        app.extensions.pop(name, None)
+    PdfExtractor._pool = None
+
+    # New provider objects, so no HTTP client or SDK session is shared
+    init_ai_providers(app)
@@ -17,17 +17,47 @@ class User(db.Model):
     )
 
 
+class BrowserSession(db.Model):
+    """Server side of a session cookie, which carries only the opaque `id`"""
+
+    __tablename__ = "browser_sessions"
+
+    id = db.Column(db.String(64), primary_key=True)
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id"), nullable=False, index=True
+    )
+    created_at = db.Column(db.DateTime, default=datetime.now)
+
+
 class Session(db.Model):
     __tablename__ = "sessions"
+    # Archived sessions keep their id, so SQLite must never hand it out again
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    is_archived = False
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=True)
+    # The owner; ownership checks and the dashboard look sessions up by it
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id"), nullable=True, index=True
+    )
     job_title = db.Column(db.String(200), nullable=False)
     company_name = db.Column(db.String(200), nullable=False)
-    cv_text = db.Column(db.Text, nullable=True)
-    job_description_text = db.Column(db.Text, nullable=True)
+    cv_document_id = db.Column(db.Integer, db.ForeignKey("documents.id"), nullable=True)
+    job_description_document_id = db.Column(
+        db.Integer, db.ForeignKey("documents.id"), nullable=True
+    )
+    # Cheap readiness flags so hot paths never have to touch document text
+    has_cv = db.Column(db.Boolean, nullable=False, default=False)
+    has_job_description = db.Column(db.Boolean, nullable=False, default=False)
     created_at = db.Column(db.DateTime, default=datetime.now)
 
+    cv_document = db.relationship(
+        "Document", foreign_keys=[cv_document_id], lazy="select"
+    )
+    job_description_document = db.relationship(
+        "Document", foreign_keys=[job_description_document_id], lazy="select"
+    )
     messages = db.relationship(
         "Message", backref="session", lazy=True, cascade="all, delete-orphan"
     )
@@ -39,6 +69,91 @@ class Session(db.Model):
         cascade="all, delete-orphan",
     )
 
+    @property
+    def cv_text(self) -> str | None:
+        """Loads the CV text on first access; only prompt-building paths need it"""
+        return self.cv_document.content if self.cv_document else None
+
+    @property
+    def cv_sections(self) -> list[dict] | None:
+        return self.cv_document.sections if self.cv_document else None
+
+    @property
+    def job_description_text(self) -> str | None:
+        if not self.job_description_document:
+            return None
+        return self.job_description_document.content
+
+
+class Document(db.Model):
+    """Content-addressed document text, shared by every session that uploads it"""
+
+    __tablename__ = "documents"
+
+    id = db.Column(db.Integer, primary_key=True)
+    content_hash = db.Column(db.String(64), unique=True, nullable=False)
+    content = db.Column(db.Text, nullable=False)
+    # CV sections from CvStructurer; None for job descriptions and older rows
+    sections = db.Column(db.JSON, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+
+
+class ParseCacheEntry(db.Model):
+    """Maps the SHA-256 of an uploaded file to the text it parsed into"""
+
+    __tablename__ = "parse_cache"
+    __table_args__ = (db.UniqueConstraint("content_hash", "parser_version"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    content_hash = db.Column(db.String(64), nullable=False)
+    # Parser version plus file extension, so a parser change invalidates entries
+    parser_version = db.Column(db.String(32), nullable=False)
+    document_id = db.Column(db.Integer, db.ForeignKey("documents.id"), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+
+    document = db.relationship("Document", lazy="joined")
+
+
+class RenderedPage(db.Model):
+    """Shared tier of the render cache: a page's HTML, zlib-compressed.
+
+    `key` names the page and the version it was rendered from, so a new
+    version never reads an old entry. Not a foreign key, since archived
+    sessions have no `sessions` row; deleting a session deletes its pages.
+    """
+
+    __tablename__ = "rendered_pages"
+
+    session_id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    key = db.Column(db.String(128), primary_key=True)
+    html = db.Column(db.LargeBinary, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+
+
+class UploadJob(db.Model):
+    """Progress of a CV upload parsed in the background, polled by the upload page"""
+
+    __tablename__ = "upload_jobs"
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    DONE = "done"
+    FAILED = "failed"
+
+    id = db.Column(db.Integer, primary_key=True)
+    session_id = db.Column(
+        db.Integer, db.ForeignKey("sessions.id"), nullable=False, index=True
+    )
+    filename = db.Column(db.String(255), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default=PENDING)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.now)
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in (self.PENDING, self.PROCESSING)
+
 
 class Message(db.Model):
     __tablename__ = "messages"
@@ -60,3 +175,65 @@ class Feedback(db.Model):
     weaknesses = db.Column(db.Text, nullable=True)
     cv_improvements = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.now)
+
+
+class UserProgress(db.Model):
+    """Score aggregates per user and job title.
+
+    Maintained incrementally as feedback is created, so the progress dashboard
+    reads a handful of rows instead of scanning sessions and feedback.
+    """
+
+    __tablename__ = "user_progress"
+    __table_args__ = (db.UniqueConstraint("user_id", "job_title"),)
+
+    RECENT_LIMIT = 10
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    job_title = db.Column(db.String(200), nullable=False)
+    completed_count = db.Column(db.Integer, nullable=False, default=0)
+    scored_count = db.Column(db.Integer, nullable=False, default=0)
+    mean_score = db.Column(db.Float, nullable=True)
+    best_score = db.Column(db.Integer, nullable=True)
+    recent_scores = db.Column(db.JSON, nullable=False, default=list)  # oldest first
+    updated_at = db.Column(db.DateTime, default=datetime.now, onupdate=datetime.now)
+
+    def record(self, score: int | None) -> None:
+        """Fold one completed session's score into the aggregates"""
+        self.completed_count = (self.completed_count or 0) + 1
+        self.scored_count = scored = self.scored_count or 0
+        self.recent_scores = self.recent_scores or []
+        if score is None:
+            return
+
+        self.mean_score = ((self.mean_score or 0) * scored + score) / (scored + 1)
+        self.scored_count = scored + 1
+        self.best_score = (
+            score if self.best_score is None else max(self.best_score, score)
+        )
+        # Reassign rather than append so the JSON column is marked dirty
+        self.recent_scores = [*self.recent_scores, score][-self.RECENT_LIMIT :]
+
+
+class ArchivedSession(db.Model):
+    """A completed session moved out of the hot tables.
+
+    The transcript and feedback live in a single zlib-compressed JSON payload;
+    only the columns needed to list the session are stored uncompressed.
+    """
+
+    __tablename__ = "archived_sessions"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=False)
+    user_id = db.Column(
+        db.Integer, db.ForeignKey("users.id"), nullable=True, index=True
+    )
+    job_title = db.Column(db.String(200), nullable=False)
+    company_name = db.Column(db.String(200), nullable=False)
+    interview_score = db.Column(db.Integer, nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False)
+    archived_at = db.Column(db.DateTime, default=datetime.now)
+    payload = db.deferred(db.Column(db.LargeBinary, nullable=False))
+
+    is_archived = True
@@ -0,0 +1,230 @@
+"""Opt-in sampling profiler for single requests.
+
+A profiled request gets a sampler thread that records the request thread's
+stack every PROFILE_INTERVAL_MS. The samples are kept per worker and served
+as speedscope JSON (https://www.speedscope.app) from /admin/profiles.
+
+A request is profiled when it sends `X-Profile-Token: <ADMIN_API_TOKEN>` or
+is picked at PROFILE_SAMPLE_RATE. With PROFILING_ENABLED off no hook is
+registered at all. The sampler needs the GIL to take a sample, so a busy
+request is sampled about every sys.getswitchinterval() (5ms) at best.
+"""
+
+import hmac
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from flask import current_app, g, request
+
+
+PROFILE_HEADER = "X-Profile-Token"
+
+# Where a sample's time goes: the innermost frame matching one of these path
+# fragments decides. Compiled templates report their .html file.
+CATEGORIES = (
+    ("jinja", ("/jinja2/", ".html")),
+    ("sqlalchemy", ("/sqlalchemy/",)),
+    (
+        "document_parser",
+        (
+            "/utils/document_parser.py",
+            "/utils/pdf_extractor.py",
+            "/utils/docx_extractor.py",
+            "/utils/parser_pool.py",
+            "/pypdf/",
+            "/pdfplumber/",
+        ),
+    ),
+    ("ai_provider", ("/client/", "/google/genai/", "/requests/", "/urllib3/")),
+)
+
+
+def _category(stack: list[tuple[str, str, int]]) -> str:
+    for _, filename, _ in reversed(stack):
+        for category, fragments in CATEGORIES:
+            if any(fragment in filename for fragment in fragments):
+                return category
+    return "other"
+
+
+class SamplingProfiler:
+    """Samples one thread's stack from a background thread until stopped"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.frames: dict[tuple[str, str, int], int] = {}
+        self.samples: list[tuple[list[int], float]] = []
+        self.duration_ms = 0.0
+
+    def start(self) -> None:
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="request-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.duration_ms = (time.perf_counter() - self._started) * 1000
+
+    def _run(self) -> None:
+        last = self._started
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            now = time.perf_counter()
+            if frame is None:
+                return
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_qualname, code.co_filename, code.co_firstlineno)
+                stack.append(self.frames.setdefault(key, len(self.frames)))
+                frame = frame.f_back
+            stack.reverse()
+            self.samples.append((stack, (now - last) * 1000))
+            last = now
+
+    def summary(self) -> dict[str, float]:
+        """Sampled milliseconds per category"""
+        keys = list(self.frames)
+        totals = dict.fromkeys([name for name, _ in CATEGORIES] + ["other"], 0.0)
+        for stack, weight in self.samples:
+            totals[_category([keys[i] for i in stack])] += weight
+        return {name: round(ms, 1) for name, ms in totals.items()}
+
+    def to_speedscope(self, name: str) -> dict:
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "interview-simulator",
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [
+                    {"name": qualname, "file": filename, "line": line}
+                    for qualname, filename, line in self.frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": sum(weight for _, weight in self.samples),
+                    "samples": [stack for stack, _ in self.samples],
+                    "weights": [weight for _, weight in self.samples],
+                }
+            ],
+        }
+
+
+class ProfileStore:
+    """The newest profiles of this worker, bounded in count and age"""
+
+    def __init__(self, max_profiles: int = 50, retention_seconds: float = 3600):
+        self.max_profiles = max_profiles
+        self.retention_seconds = retention_seconds
+        self._profiles: OrderedDict[str, tuple[dict, SamplingProfiler]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, meta: dict, profiler: SamplingProfiler) -> None:
+        with self._lock:
+            self._profiles[meta["id"]] = (meta, profiler)
+            while len(self._profiles) > self.max_profiles:
+                self._profiles.popitem(last=False)
+            self._expire()
+
+    def list(self) -> list[dict]:
+        with self._lock:
+            self._expire()
+            return [meta for meta, _ in reversed(self._profiles.values())]
+
+    def get(self, profile_id: str) -> tuple[dict, SamplingProfiler] | None:
+        with self._lock:
+            self._expire()
+            return self._profiles.get(profile_id)
+
+    def _expire(self) -> None:
+        cutoff = time.time() - self.retention_seconds
+        while self._profiles:
+            meta, _ = next(iter(self._profiles.values()))
+            if meta["recorded_at"] >= cutoff:
+                return
+            self._profiles.popitem(last=False)
+
+
+def get_profile_store(app) -> ProfileStore:
+    """The worker-wide profile store, created on first use"""
+    if "profiles" not in app.extensions:
+        app.extensions["profiles"] = ProfileStore(
+            app.config.get("PROFILE_MAX_STORED", 50),
+            app.config.get("PROFILE_RETENTION_SECONDS", 3600),
+        )
+    return app.extensions["profiles"]
+
+
+def _wants_profile() -> bool:
+    config = current_app.config
+    token = request.headers.get(PROFILE_HEADER)
+    expected = config.get("ADMIN_API_TOKEN")
+    if token and expected and hmac.compare_digest(token.encode(), expected.encode()):
+        return True
+    rate = config.get("PROFILE_SAMPLE_RATE", 0.0)
+    return rate > 0 and random.random() < rate
+
+
+def _start_profile() -> None:
+    if _wants_profile():
+        g.profiler = SamplingProfiler(
+            current_app.config.get("PROFILE_INTERVAL_MS", 2) / 1000
+        )
+        g.profiler.start()
+
+
+def _finish_profile(status: int) -> str | None:
+    profiler = g.pop("profiler", None)
+    if profiler is None:
+        return None
+    profiler.stop()
+    meta = {
+        "id": uuid.uuid4().hex,
+        "method": request.method,
+        "path": request.path,
+        "endpoint": request.endpoint,
+        "status": status,
+        "started_at": profiler.started_at.isoformat(timespec="seconds"),
+        "recorded_at": time.time(),
+        "duration_ms": round(profiler.duration_ms, 1),
+        "samples": len(profiler.samples),
+        "summary": profiler.summary(),
+    }
+    get_profile_store(current_app).add(meta, profiler)
+    return meta["id"]
+
+
+def _after_request(response):
+    profile_id = _finish_profile(response.status_code)
+    if profile_id:
+        response.headers["X-Profile-Id"] = profile_id
+    return response
+
+
+def _teardown_request(exc):
+    # Only still running if the view raised before after_request ran
+    _finish_profile(500)
+
+
+def init_profiling(app) -> None:
+    if not app.config.get("PROFILING_ENABLED", False):
+        return
+    app.before_request(_start_profile)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
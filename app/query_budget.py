@@ -0,0 +1,149 @@
+"""Per-request SQL query counts, timings and N+1 detection.
+
+Every statement a request runs is counted and timed through SQLAlchemy's
+cursor events, and logged at debug level; in debug or testing apps, or with
+QUERY_TIMING_HEADER on, they are sent in a `Server-Timing: db` header. A view can
+declare how many statements it may run with `@query_budget(n)`; going over
+is logged, or raised as QueryBudgetExceeded when QUERY_BUDGET_RAISE is on.
+A statement repeated QUERY_REPEAT_THRESHOLD times in one request, typically
+a lazy load inside a loop, is logged as a likely N+1.
+"""
+
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from flask import current_app, g, has_app_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from .exceptions import QueryBudgetExceeded
+from .models import db
+
+
+logger = logging.getLogger(__name__)
+
+# Started by track_queries(); each sees every statement run on its engine
+_engine_trackers: list[tuple[Engine, "QueryStats"]] = []
+
+
+class QueryStats:
+    """Statements run while tracking was on, with their total time"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, ms: float) -> None:
+        self.count += 1
+        self.total_ms += ms
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements run at least `threshold` times, most repeated first"""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold
+        ]
+
+
+def query_budget(max_queries: int):
+    """Declare the most SQL statements a view may run per request"""
+
+    def decorator(view):
+        view.query_budget = max_queries
+        return view
+
+    return decorator
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    # Kept on the statement's own execution context: a statement that fails
+    # never reaches after_cursor_execute, and must not leave a start time
+    # behind on the pooled connection for the next statement to pick up
+    context.query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    ms = (time.perf_counter() - context.query_started) * 1000
+    for engine, stats in _engine_trackers:
+        if conn.engine is engine:
+            stats.record(statement, ms)
+    if has_app_context():
+        stats = g.get("request_query_stats")
+        if stats is not None:
+            stats.record(statement, ms)
+
+
+def _listen(engine: Engine) -> None:
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries(app):
+    """Every statement run on `app`'s database while the block runs, by any
+    request, job or thread"""
+    with app.app_context():
+        engine = db.engine
+    _listen(engine)
+    stats = QueryStats()
+    _engine_trackers.append((engine, stats))
+    try:
+        yield stats
+    finally:
+        _engine_trackers.remove((engine, stats))
+
+
+def _start_request() -> None:
+    g.request_query_stats = QueryStats()
+
+
+def _finish_request(response):
+    stats = g.pop("request_query_stats", None)
+    if stats is None:
+        return response
+    config = current_app.config
+
+    # Query counts say too much about the schema to send to every client
+    if config["QUERY_TIMING_HEADER"] or current_app.debug or current_app.testing:
+        response.headers.add(
+            "Server-Timing",
+            f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries"',
+        )
+    else:
+        logger.debug(
+            f"{request.method} {request.path} ran {stats.count} queries "
+            f"in {stats.total_ms:.1f} ms"
+        )
+    for statement, count in stats.repeated(config["QUERY_REPEAT_THRESHOLD"]):
+        logger.warning(
+            f"Possible N+1 in {request.endpoint}: ran {count} times: {statement}"
+        )
+
+    view = current_app.view_functions.get(request.endpoint)
+    budget = getattr(view, "query_budget", None)
+    if budget is not None and stats.count > budget:
+        message = (
+            f"{request.method} {request.path} ran {stats.count} queries, "
+            f"over its budget of {budget}"
+        )
+        if config["QUERY_BUDGET_RAISE"]:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+    return response
+
+
+def init_query_tracking(app) -> None:
+    app.config.setdefault("QUERY_TRACKING_ENABLED", True)
+    app.config.setdefault("QUERY_TIMING_HEADER", False)
+    app.config.setdefault("QUERY_BUDGET_RAISE", False)
+    app.config.setdefault("QUERY_REPEAT_THRESHOLD", 5)
+    if not app.config["QUERY_TRACKING_ENABLED"]:
+        return
+    with app.app_context():
+        _listen(db.engine)
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
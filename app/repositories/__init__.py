@@ -1,12 +1,32 @@
+from .analytics_repository import AnalyticsRepository
+from .archive_repository import ArchiveRepository
+from .document_repository import DocumentRepository
+from .export_repository import ExportRepository
 from .file_repository import FileRepository
 from .feedback_repository import FeedbackRepository
 from .message_repository import MessageRepository
+from .ownership_repository import OwnershipRepository
+from .parse_cache_repository import ParseCacheRepository
+from .render_cache_repository import RenderCacheRepository
+from .search_repository import SearchRepository
 from .session_repository import SessionRepository
+from .upload_job_repository import UploadJobRepository
+from .user_repository import UserRepository
 
 
 __all__ = [
+    "AnalyticsRepository",
+    "ArchiveRepository",
+    "DocumentRepository",
+    "ExportRepository",
     "FileRepository",
     "FeedbackRepository",
     "MessageRepository",
+    "OwnershipRepository",
+    "ParseCacheRepository",
+    "RenderCacheRepository",
+    "SearchRepository",
     "SessionRepository",
+    "UploadJobRepository",
+    "UserRepository",
 ]
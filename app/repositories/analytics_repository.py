@@ -0,0 +1,97 @@
+from sqlalchemy.exc import IntegrityError
+from app.models import db, ArchivedSession, Feedback, Session, UserProgress
+
+
+class AnalyticsRepository:
+    """Maintains the materialized `user_progress` table"""
+
+    def record_score(self, session_id: int, score: int | None) -> None:
+        """Fold a new feedback score into its user's progress row.
+
+        The caller owns the transaction; changes are only flushed. Sessions
+        without a user are not tracked.
+        """
+        owner = db.session.execute(
+            db.select(Session.user_id, Session.job_title).where(
+                Session.id == session_id
+            )
+        ).first()
+        if owner is None or owner.user_id is None:
+            return
+
+        progress = self._get_or_create(owner.user_id, owner.job_title)
+        progress.record(score)
+        db.session.flush()
+
+    def get_for_user(self, user_id: int) -> list[UserProgress]:
+        return list(
+            db.session.scalars(
+                db.select(UserProgress)
+                .where(UserProgress.user_id == user_id)
+                .order_by(UserProgress.updated_at.desc())
+            )
+        )
+
+    def rebuild(self) -> int:
+        """Recompute every progress row from hot and archived sessions"""
+        hot = (
+            db.select(
+                Session.user_id,
+                Session.job_title,
+                Feedback.interview_score.label("score"),
+                Session.created_at,
+            )
+            .join(Feedback, Feedback.session_id == Session.id)
+            .where(Session.user_id.isnot(None))
+        )
+        archived = db.select(
+            ArchivedSession.user_id,
+            ArchivedSession.job_title,
+            ArchivedSession.interview_score.label("score"),
+            ArchivedSession.created_at,
+        ).where(ArchivedSession.user_id.isnot(None))
+        completed = db.union_all(hot, archived).subquery()
+
+        progress_by_key = {}
+        try:
+            db.session.execute(db.delete(UserProgress))
+            for row in db.session.execute(
+                db.select(completed)
+                .order_by(completed.c.created_at)
+                .execution_options(yield_per=1000)
+            ):
+                key = (row.user_id, row.job_title)
+                if key not in progress_by_key:
+                    progress_by_key[key] = UserProgress(
+                        user_id=row.user_id, job_title=row.job_title
+                    )
+                progress_by_key[key].record(row.score)
+
+            db.session.add_all(progress_by_key.values())
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        return len(progress_by_key)
+
+    def _get_or_create(self, user_id: int, job_title: str) -> UserProgress:
+        progress = self._get(user_id, job_title)
+        if progress is not None:
+            return progress
+
+        try:
+            with db.session.begin_nested():
+                progress = UserProgress(user_id=user_id, job_title=job_title)
+                db.session.add(progress)
+            return progress
+        except IntegrityError:
+            # Another worker created the row between our lookup and insert
+            return self._get(user_id, job_title)
+
+    @staticmethod
+    def _get(user_id: int, job_title: str) -> UserProgress | None:
+        return db.session.scalars(
+            db.select(UserProgress)
+            .where(UserProgress.user_id == user_id, UserProgress.job_title == job_title)
+            .with_for_update()
+        ).first()
@@ -0,0 +1,196 @@
+import json
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from app.models import db, ArchivedSession, Feedback, Message, Session
+from .session_repository import SessionRepository
+
+
+PAYLOAD_VERSION = 1
+
+
+@dataclass
+class ArchivedMessage:
+    role: str
+    content: str
+    timestamp: datetime | None
+
+
+@dataclass
+class ArchivedFeedback:
+    session_id: int
+    interview_score: int | None
+    strengths: str | None
+    weaknesses: str | None
+    cv_improvements: str | None
+    created_at: datetime | None
+
+
+@dataclass
+class ArchivedTranscript:
+    session: ArchivedSession
+    messages: list[ArchivedMessage]
+    feedback: ArchivedFeedback
+
+
+class ArchiveRepository:
+    """Moves completed sessions into `archived_sessions` and reads them back"""
+
+    ARCHIVE_BATCH_SIZE = 200
+
+    def __init__(self, session_repository: SessionRepository | None = None):
+        self.session_repo = session_repository or SessionRepository()
+
+    def archive_completed_before(
+        self, cutoff: datetime, batch_size: int = ARCHIVE_BATCH_SIZE
+    ) -> int:
+        """Archive every session with feedback created before `cutoff`"""
+        archived = 0
+        while True:
+            session_ids = list(
+                db.session.scalars(
+                    db.select(Session.id)
+                    .join(Feedback, Feedback.session_id == Session.id)
+                    .where(Session.created_at < cutoff)
+                    .order_by(Session.id)
+                    .limit(batch_size)
+                )
+            )
+            if not session_ids:
+                return archived
+            archived += self.archive_sessions(session_ids)
+
+    def archive_sessions(self, session_ids: list[int]) -> int:
+        """Compress the given completed sessions into the archive and remove
+        them from the hot tables in the same transaction."""
+        sessions = Session.query.filter(Session.id.in_(session_ids)).all()
+        feedback_by_session = {
+            f.session_id: f
+            for f in Feedback.query.filter(Feedback.session_id.in_(session_ids))
+        }
+        messages_by_session = defaultdict(list)
+        for message in Message.query.filter(
+            Message.session_id.in_(session_ids)
+        ).order_by(Message.session_id, Message.timestamp):
+            messages_by_session[message.session_id].append(message)
+
+        records = [
+            self._to_record(
+                session,
+                messages_by_session[session.id],
+                feedback_by_session[session.id],
+            )
+            for session in sessions
+            if session.id in feedback_by_session
+        ]
+        if not records:
+            return 0
+
+        try:
+            db.session.add_all(records)
+            db.session.flush()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        # Commits the archive rows together with the hot-table deletes
+        self.session_repo.delete_many([r.id for r in records], include_archived=False)
+        return len(records)
+
+    def get_summaries(self, session_ids: list[int]) -> list[ArchivedSession]:
+        """Listing columns only; the compressed payload is deferred"""
+        if not session_ids:
+            return []
+        return ArchivedSession.query.filter(ArchivedSession.id.in_(session_ids)).all()
+
+    def get_recent_summaries(self, user_id: int, limit: int) -> list[ArchivedSession]:
+        return (
+            ArchivedSession.query.filter(ArchivedSession.user_id == user_id)
+            .order_by(ArchivedSession.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_transcript(self, session_id: int) -> ArchivedTranscript | None:
+        record = db.session.get(ArchivedSession, session_id)
+        if not record:
+            return None
+
+        data = self.decode_payload(record.payload)
+        messages = [
+            ArchivedMessage(
+                role=m["role"],
+                content=m["content"],
+                timestamp=_parse_datetime(m["timestamp"]),
+            )
+            for m in data["messages"]
+        ]
+        feedback_data = data["feedback"]
+        feedback = ArchivedFeedback(
+            session_id=session_id,
+            interview_score=feedback_data["interview_score"],
+            strengths=feedback_data["strengths"],
+            weaknesses=feedback_data["weaknesses"],
+            cv_improvements=feedback_data["cv_improvements"],
+            created_at=_parse_datetime(feedback_data["created_at"]),
+        )
+        return ArchivedTranscript(session=record, messages=messages, feedback=feedback)
+
+    def get_archived_at(self, session_id: int) -> datetime | None:
+        return db.session.scalar(
+            db.select(ArchivedSession.archived_at).where(
+                ArchivedSession.id == session_id
+            )
+        )
+
+    def get_feedback(self, session_id: int) -> ArchivedFeedback | None:
+        transcript = self.get_transcript(session_id)
+        return transcript.feedback if transcript else None
+
+    @staticmethod
+    def decode_payload(payload: bytes) -> dict:
+        return json.loads(zlib.decompress(payload))
+
+    @staticmethod
+    def _to_record(
+        session: Session, messages: list[Message], feedback: Feedback
+    ) -> ArchivedSession:
+        data = {
+            "version": PAYLOAD_VERSION,
+            "messages": [
+                {
+                    "role": m.role,
+                    "content": m.content,
+                    "timestamp": _format_datetime(m.timestamp),
+                }
+                for m in messages
+            ],
+            "feedback": {
+                "interview_score": feedback.interview_score,
+                "strengths": feedback.strengths,
+                "weaknesses": feedback.weaknesses,
+                "cv_improvements": feedback.cv_improvements,
+                "created_at": _format_datetime(feedback.created_at),
+            },
+        }
+        payload = zlib.compress(
+            json.dumps(data, separators=(",", ":")).encode("utf-8"), level=9
+        )
+        return ArchivedSession(
+            id=session.id,
+            user_id=session.user_id,
+            job_title=session.job_title,
+            company_name=session.company_name,
+            interview_score=feedback.interview_score,
+            created_at=session.created_at,
+            payload=payload,
+        )
+
+
+def _format_datetime(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
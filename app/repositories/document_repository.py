@@ -0,0 +1,70 @@
+import hashlib
+from sqlalchemy.exc import IntegrityError
+from app.models import db, Document, ParseCacheEntry, Session
+
+
+class DocumentRepository:
+    """Stores large document text once, keyed by the SHA-256 of its content"""
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get_or_create_id(self, content: str, sections: list[dict] | None = None) -> int:
+        """Return the id of the document holding `content`, inserting it if new.
+
+        `sections` fills in the structure of a document stored without one.
+        The caller owns the transaction; the insert is only flushed.
+        """
+        content_hash = self.hash_content(content)
+
+        document_id = self._get_id_by_hash(content_hash)
+        if document_id is not None:
+            if sections is not None:
+                db.session.execute(
+                    db.update(Document)
+                    .where(Document.id == document_id, Document.sections.is_(None))
+                    .values(sections=sections)
+                )
+            return document_id
+
+        try:
+            with db.session.begin_nested():
+                document = Document(
+                    content_hash=content_hash, content=content, sections=sections
+                )
+                db.session.add(document)
+            return document.id
+        except IntegrityError:
+            # Another worker stored the same content between our lookup and insert
+            return self._get_id_by_hash(content_hash)
+
+    def get_by_id(self, document_id: int) -> Document | None:
+        return db.session.get(Document, document_id)
+
+    def delete_unreferenced(self) -> int:
+        """Remove documents no session points at any more, along with the
+        parse cache entries that resolve to them"""
+        referenced = db.union(
+            db.select(Session.cv_document_id).where(Session.cv_document_id.isnot(None)),
+            db.select(Session.job_description_document_id).where(
+                Session.job_description_document_id.isnot(None)
+            ),
+        )
+        db.session.execute(
+            db.delete(ParseCacheEntry).where(
+                ParseCacheEntry.document_id.not_in(referenced)
+            )
+        )
+        result = db.session.execute(
+            db.delete(Document).where(Document.id.not_in(referenced))
+        )
+        db.session.commit()
+        return result.rowcount
+
+    def _get_id_by_hash(self, content_hash: str) -> int | None:
+        return (
+            db.session.query(Document.id)
+            .filter(Document.content_hash == content_hash)
+            .scalar()
+        )
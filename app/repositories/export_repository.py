@@ -0,0 +1,140 @@
+from collections.abc import Iterator
+from datetime import datetime
+from app.models import db, ArchivedSession, Feedback, Message, Session
+from .archive_repository import ArchiveRepository
+
+
+class ExportRepository:
+    """Streams sessions for export without building ORM objects.
+
+    Rows come back as plain tuples through `yield_per`, so neither the identity
+    map nor the result buffers grow with the size of the database.
+    """
+
+    BATCH_SIZE = 500
+
+    def __init__(self, batch_size: int = BATCH_SIZE):
+        self.batch_size = batch_size
+
+    def iter_sessions(
+        self, since: datetime | None = None, until: datetime | None = None
+    ) -> Iterator[dict]:
+        """Hot sessions in id order, each with its messages and feedback"""
+        sessions = db.session.execute(
+            self._filter(
+                db.select(
+                    Session.id,
+                    Session.user_id,
+                    Session.job_title,
+                    Session.company_name,
+                    Session.created_at,
+                    Feedback.id.label("feedback_id"),
+                    Feedback.interview_score,
+                    Feedback.strengths,
+                    Feedback.weaknesses,
+                    Feedback.cv_improvements,
+                    Feedback.created_at.label("feedback_created_at"),
+                )
+                .outerjoin(Feedback, Feedback.session_id == Session.id)
+                .order_by(Session.id),
+                Session.created_at,
+                since,
+                until,
+            ).execution_options(yield_per=self.batch_size)
+        )
+        messages = iter(
+            db.session.execute(
+                self._filter(
+                    db.select(
+                        Message.session_id,
+                        Message.role,
+                        Message.content,
+                        Message.timestamp,
+                    )
+                    .join(Session, Session.id == Message.session_id)
+                    .order_by(Message.session_id, Message.timestamp, Message.id),
+                    Session.created_at,
+                    since,
+                    until,
+                ).execution_options(yield_per=self.batch_size)
+            )
+        )
+
+        # Both result sets are ordered by session id, so a merge join pairs
+        # each session with its messages while holding only one at a time
+        pending = next(messages, None)
+        for row in sessions:
+            session_messages = []
+            while pending is not None and pending.session_id <= row.id:
+                if pending.session_id == row.id:
+                    session_messages.append(
+                        {
+                            "role": pending.role,
+                            "content": pending.content,
+                            "timestamp": _format_datetime(pending.timestamp),
+                        }
+                    )
+                pending = next(messages, None)
+
+            yield {
+                "id": row.id,
+                "user_id": row.user_id,
+                "job_title": row.job_title,
+                "company_name": row.company_name,
+                "created_at": _format_datetime(row.created_at),
+                "archived": False,
+                "messages": session_messages,
+                "feedback": None
+                if row.feedback_id is None
+                else {
+                    "interview_score": row.interview_score,
+                    "strengths": row.strengths,
+                    "weaknesses": row.weaknesses,
+                    "cv_improvements": row.cv_improvements,
+                    "created_at": _format_datetime(row.feedback_created_at),
+                },
+            }
+
+    def iter_archived(
+        self, since: datetime | None = None, until: datetime | None = None
+    ) -> Iterator[dict]:
+        """Archived sessions in id order, decompressed one at a time"""
+        rows = db.session.execute(
+            self._filter(
+                db.select(
+                    ArchivedSession.id,
+                    ArchivedSession.user_id,
+                    ArchivedSession.job_title,
+                    ArchivedSession.company_name,
+                    ArchivedSession.created_at,
+                    ArchivedSession.payload,
+                ).order_by(ArchivedSession.id),
+                ArchivedSession.created_at,
+                since,
+                until,
+            ).execution_options(yield_per=self.batch_size)
+        )
+        for row in rows:
+            data = ArchiveRepository.decode_payload(row.payload)
+            yield {
+                "id": row.id,
+                "user_id": row.user_id,
+                "job_title": row.job_title,
+                "company_name": row.company_name,
+                "created_at": _format_datetime(row.created_at),
+                "archived": True,
+                "messages": data["messages"],
+                "feedback": data["feedback"],
+            }
+
+    @staticmethod
+    def _filter(query, column, since: datetime | None, until: datetime | None):
+        if since is not None:
+            query = query.where(column >= since)
+        if until is not None:
+            query = query.where(column < until)
+        return query
+
+
+def _format_datetime(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
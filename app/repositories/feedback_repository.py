@@ -1,7 +1,24 @@
+from datetime import datetime
 from app.models import db, Feedback
+from .analytics_repository import AnalyticsRepository
+from .render_cache_repository import RenderCacheRepository
+from .request_cache import NullCache
+from .search_repository import SearchRepository
 
 
 class FeedbackRepository:
+    def __init__(
+        self,
+        cache=None,
+        search_repository: SearchRepository | None = None,
+        analytics_repository: AnalyticsRepository | None = None,
+        render_cache: RenderCacheRepository | None = None,
+    ):
+        self.cache = cache or NullCache()
+        self.search_repo = search_repository or SearchRepository()
+        self.analytics_repo = analytics_repository or AnalyticsRepository()
+        self.render_cache = render_cache or RenderCacheRepository()
+
     def create_feedback(
         self,
         session_id: int,
@@ -18,14 +35,35 @@ class FeedbackRepository:
             cv_improvements=cv_improvements,
         )
         db.session.add(feedback)
+        self.search_repo.index(
+            session_id,
+            SearchRepository.KIND_FEEDBACK,
+            SearchRepository.feedback_text(strengths, weaknesses, cv_improvements),
+        )
+        self.analytics_repo.record_score(session_id, score)
+        self.render_cache.invalidate([session_id])
         db.session.commit()
+        self.cache.invalidate(session_id)
         db.session.refresh(feedback)
         return feedback
 
     def get_feedback(self, session_id: int) -> Feedback | None:
-        return Feedback.query.filter_by(session_id=session_id).first()
+        return self.cache.get_or_load(
+            session_id,
+            "feedback",
+            lambda: Feedback.query.filter_by(session_id=session_id).first(),
+        )
+
+    def get_created_at(self, session_id: int) -> datetime | None:
+        return db.session.scalar(
+            db.select(Feedback.created_at).where(Feedback.session_id == session_id)
+        )
 
     def has_feedback(self, session_id: int) -> bool:
-        return db.session.query(
-            Feedback.query.filter_by(session_id=session_id).exists()
-        ).scalar()
+        return self.cache.get_or_load(
+            session_id,
+            "has_feedback",
+            lambda: db.session.query(
+                Feedback.query.filter_by(session_id=session_id).exists()
+            ).scalar(),
+        )
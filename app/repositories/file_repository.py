@@ -1,22 +1,29 @@
 import os
-import logging
-from werkzeug.utils import secure_filename
-from datetime import datetime
+import shutil
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO
 from app.exceptions import ValidationError
 
 
-logger = logging.getLogger(__name__)
-
-
 class FileRepository:
     ALLOWED_EXTENSIONS = {"pdf", "docx", "txt"}
     MAX_FILE_SIZE = 16 * 1024 * 1024
+    SPOOL_MAX_SIZE = 1024 * 1024
 
-    def __init__(self, upload_folder: str):
+    def __init__(self, upload_folder: str, spool_max_size: int = SPOOL_MAX_SIZE):
         self.upload_folder = upload_folder
+        self.spool_max_size = spool_max_size
         os.makedirs(upload_folder, exist_ok=True)
 
-    def save_uploaded_file(self, file) -> str:
+    def open_uploaded_file(self, file) -> BinaryIO:
+        """Seekable binary stream over an upload, for parsing without a disk copy.
+
+        Werkzeug already buffers uploads in memory or in a spooled temporary
+        file, so a seekable upload stream is used as is. Anything else is
+        copied into a SpooledTemporaryFile that stays in memory up to
+        `spool_max_size` bytes and otherwise spills to a uniquely named file
+        in the upload folder, removed when the stream is closed.
+        """
         if not file or not file.filename:
             raise ValidationError("No file provided")
 
@@ -25,32 +32,24 @@ class FileRepository:
                 f"Invalid file type. Allowed: {', '.join(self.ALLOWED_EXTENSIONS)}"
             )
 
-        filename = self._generate_safe_filename(file.filename)
-        file_path = os.path.join(self.upload_folder, filename)
-
-        try:
-            file.save(file_path)
-        except Exception as e:
-            raise ValidationError(f"Failed to save file: {e}")
-
-        return file_path
+        stream = file.stream
+        if stream.seekable():
+            stream.seek(0)
+            return stream
 
-    def delete_file(self, file_path: str) -> None:
+        spool = SpooledTemporaryFile(
+            max_size=self.spool_max_size, mode="w+b", dir=self.upload_folder
+        )
         try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
+            shutil.copyfileobj(stream, spool)
         except Exception as e:
-            logger.warning(f"Warning: Failed to delete file {file_path}: {e}")
+            spool.close()
+            raise ValidationError(f"Failed to read uploaded file: {e}")
+        spool.seek(0)
+        return spool
 
     def _is_allowed_file(self, filename: str) -> bool:
         return (
             "." in filename
             and filename.rsplit(".", 1)[1].lower() in self.ALLOWED_EXTENSIONS
         )
-
-    def _generate_safe_filename(self, original_filename: str) -> str:
-        safe_name = secure_filename(original_filename)
-        timestamp = int(datetime.now().timestamp())
-        name, ext = os.path.splitext(safe_name)
-
-        return f"{timestamp}_{name}{ext}"
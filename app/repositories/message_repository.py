@@ -1,10 +1,19 @@
+from datetime import datetime
 from app.models import db, Message, Session
 from app.exceptions import ValidationError, NotFoundError
+from .request_cache import NullCache
+from .search_repository import SearchRepository
 
 
 class MessageRepository:
+    def __init__(self, cache=None, search_repository: SearchRepository | None = None):
+        self.cache = cache or NullCache()
+        self.search_repo = search_repository or SearchRepository()
+
     def create_message(self, session_id: int, role: str, content: str) -> Message:
-        session = Session.query.get(session_id)
+        session = self.cache.get_or_load(
+            session_id, "session", lambda: db.session.get(Session, session_id)
+        )
         if not session:
             raise NotFoundError(f"Session {session_id} not found")
 
@@ -20,7 +29,9 @@ class MessageRepository:
             content=content,
         )
         db.session.add(message)
+        self.search_repo.index(session_id, SearchRepository.KIND_MESSAGE, content)
         db.session.commit()
+        self.cache.invalidate(session_id)
         db.session.refresh(message)
         return message
 
@@ -29,21 +40,53 @@ class MessageRepository:
     ) -> list[Message]:
         new_messages = [Message(session_id=session_id, **msg) for msg in messages]
         db.session.bulk_save_objects(new_messages, return_defaults=True)
+        self.search_repo.index_many(
+            [
+                {
+                    "content": m.content,
+                    "session_id": session_id,
+                    "kind": SearchRepository.KIND_MESSAGE,
+                }
+                for m in new_messages
+            ]
+        )
         db.session.commit()
+        self.cache.invalidate(session_id)
         return new_messages
 
     def get_conversation(self, session_id: int) -> list[Message]:
-        return (
-            Message.query.filter_by(session_id=session_id)
-            .order_by(Message.timestamp.asc())
-            .all()
+        return self.cache.get_or_load(
+            session_id,
+            "conversation",
+            lambda: (
+                Message.query.filter_by(session_id=session_id)
+                .order_by(Message.timestamp.asc())
+                .all()
+            ),
         )
 
     def count_messages(self, session_id: int, role: str = None) -> int:
-        query = Message.query.filter_by(session_id=session_id)
-        if role:
-            query = query.filter_by(role=role)
-        return query.count()
+        def load():
+            query = Message.query.filter_by(session_id=session_id)
+            if role:
+                query = query.filter_by(role=role)
+            return query.count()
+
+        return self.cache.get_or_load(session_id, ("count", role), load)
+
+    def get_version(self, session_id: int) -> tuple[int, datetime | None]:
+        """Message count and newest timestamp; changes with every new message"""
+        return self.cache.get_or_load(
+            session_id,
+            "version",
+            lambda: tuple(
+                db.session.execute(
+                    db.select(
+                        db.func.count(Message.id), db.func.max(Message.timestamp)
+                    ).where(Message.session_id == session_id)
+                ).one()
+            ),
+        )
 
     def conversation_to_history(self, session_id: int) -> list[dict]:
         messages = self.get_conversation(session_id)
@@ -0,0 +1,98 @@
+import secrets
+import threading
+from collections import OrderedDict
+from app.models import db, ArchivedSession, BrowserSession, Session
+
+
+class OwnershipMemory:
+    """Process-wide LRU in front of the ownership lookups.
+
+    Holds browser tokens -> user ids and session ids -> owner ids. Neither
+    changes once set (unowned sessions are never cached), so entries never
+    need invalidating across workers. Access is locked.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str | int], int] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str | int]) -> int | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: tuple[str, str | int], value: int) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class OwnershipRepository:
+    """Which user a browser is, and which user owns a session.
+
+    The session cookie carries only an opaque browser token; the token's user
+    lives in `browser_sessions`, and a session's owner is its indexed
+    `user_id`, hot or archived. Both lookups are by primary key.
+    """
+
+    TOKEN_BYTES = 32
+
+    def __init__(self, memory: OwnershipMemory | None = None):
+        self.memory = memory or OwnershipMemory()
+
+    def create_browser_session(self, user_id: int) -> str:
+        token = secrets.token_urlsafe(self.TOKEN_BYTES)
+        db.session.add(BrowserSession(id=token, user_id=user_id))
+        db.session.commit()
+        self.memory.put(("browser", token), user_id)
+        return token
+
+    def get_user_id(self, token: str) -> int | None:
+        user_id = self.memory.get(("browser", token))
+        if user_id is None:
+            user_id = db.session.scalar(
+                db.select(BrowserSession.user_id).where(BrowserSession.id == token)
+            )
+            if user_id is not None:
+                self.memory.put(("browser", token), user_id)
+        return user_id
+
+    def get_owner_id(self, session_id: int) -> int | None:
+        owner_id = self.memory.get(("session", session_id))
+        if owner_id is None:
+            owner_id = db.session.scalar(
+                db.select(Session.user_id).where(Session.id == session_id)
+            ) or db.session.scalar(
+                db.select(ArchivedSession.user_id).where(
+                    ArchivedSession.id == session_id
+                )
+            )
+            if owner_id is not None:
+                self.memory.put(("session", session_id), owner_id)
+        return owner_id
+
+    def claim(self, session_ids: list[int], user_id: int) -> int:
+        """Give `user_id` the sessions in `session_ids` that have no owner yet"""
+        if not session_ids:
+            return 0
+        claimed = 0
+        for model in (Session, ArchivedSession):
+            result = db.session.execute(
+                db.update(model)
+                .where(model.id.in_(session_ids), model.user_id.is_(None))
+                .values(user_id=user_id)
+            )
+            claimed += result.rowcount
+        db.session.commit()
+        return claimed
@@ -0,0 +1,148 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import BinaryIO
+from sqlalchemy.exc import IntegrityError
+from app.models import db, ParseCacheEntry
+from .document_repository import DocumentRepository
+
+
+class ParseCacheMemory:
+    """Process-wide LRU tier of the parse cache, plus its hit counters.
+
+    Shared by every request a worker handles, so access is locked.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, str]) -> str | None:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+            return text
+
+    def put(self, key: tuple[str, str], text: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def record_db_hit(self) -> None:
+        with self._lock:
+            self.db_hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.memory_hits + self.db_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "memory_hits": self.memory_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "hit_rate": (
+                    (self.memory_hits + self.db_hits) / lookups if lookups else 0.0
+                ),
+            }
+
+
+class ParseCacheRepository:
+    """Parsed document text keyed by the SHA-256 of the uploaded bytes and
+    the parser version that produced it.
+
+    Looks in the worker's LRU tier first, then in the `parse_cache` table that
+    all workers share. The table points at the content-addressed `documents`
+    row, so cached text is never stored twice.
+    """
+
+    def __init__(
+        self,
+        memory: ParseCacheMemory | None = None,
+        document_repository: DocumentRepository | None = None,
+    ):
+        self.memory = memory or ParseCacheMemory()
+        self.document_repo = document_repository or DocumentRepository()
+
+    @staticmethod
+    def hash_stream(stream: BinaryIO) -> str:
+        """SHA-256 of the whole stream, rewound afterwards for the parser"""
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: stream.read(64 * 1024), b""):
+            digest.update(chunk)
+        stream.seek(0)
+        return digest.hexdigest()
+
+    def get(self, key: tuple[str, str]) -> str | None:
+        return self.lookup([key])[1]
+
+    def lookup(
+        self, keys: list[tuple[str, str]]
+    ) -> tuple[tuple[str, str] | None, str | None]:
+        """First of `keys` that is cached, with its text; one miss if none is.
+
+        All keys must share the same content hash.
+        """
+        for key in keys:
+            text = self.memory.get(key)
+            if text is not None:
+                return key, text
+
+        content_hash = keys[0][0]
+        versions = [parser_version for _, parser_version in keys]
+        entries = {
+            entry.parser_version: entry
+            for entry in db.session.scalars(
+                db.select(ParseCacheEntry).where(
+                    ParseCacheEntry.content_hash == content_hash,
+                    ParseCacheEntry.parser_version.in_(versions),
+                )
+            )
+        }
+        for key in keys:
+            entry = entries.get(key[1])
+            if entry is not None:
+                self.memory.record_db_hit()
+                self.memory.put(key, entry.document.content)
+                return key, entry.document.content
+
+        self.memory.record_miss()
+        return None, None
+
+    def put(self, key: tuple[str, str], text: str) -> None:
+        """Cache `text` under `key`. The caller owns the transaction; the
+        rows are only flushed."""
+        self.memory.put(key, text)
+
+        content_hash, parser_version = key
+        try:
+            with db.session.begin_nested():
+                db.session.add(
+                    ParseCacheEntry(
+                        content_hash=content_hash,
+                        parser_version=parser_version,
+                        document_id=self.document_repo.get_or_create_id(text),
+                    )
+                )
+        except IntegrityError:
+            # Another worker cached the same upload first; the savepoint has
+            # already been rolled back
+            pass
@@ -0,0 +1,139 @@
+import logging
+import threading
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from app.models import db, RenderedPage
+
+
+logger = logging.getLogger(__name__)
+
+
+class RenderCacheMemory:
+    """Process-wide LRU tier of the render cache, plus its hit counters.
+
+    Keys are (session id, page key). Access is locked.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, str], str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[int, str]) -> str | None:
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+            return html
+
+    def put(self, key: tuple[int, str], html: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = html
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard_sessions(self, session_ids: set[int]) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] in session_ids]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def record_shared_hit(self) -> None:
+        with self._lock:
+            self.shared_hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.memory_hits + self.shared_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "memory_hits": self.memory_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_rate": (
+                    (self.memory_hits + self.shared_hits) / lookups if lookups else 0.0
+                ),
+            }
+
+
+class RenderCacheRepository:
+    """Rendered HTML of pages that only change with a known version.
+
+    Callers put that version in the page key, so a stale entry is never read;
+    invalidation only frees what can no longer be used. Looks in the worker's
+    LRU tier first, then, when `shared` is on, in the `rendered_pages` table
+    that all workers share.
+    """
+
+    def __init__(self, memory: RenderCacheMemory | None = None, shared: bool = False):
+        self.memory = memory or RenderCacheMemory()
+        self.shared = shared
+
+    def get_or_render(
+        self, session_id: int, key: str, render: Callable[[], str]
+    ) -> str:
+        html = self.memory.get((session_id, key))
+        if html is not None:
+            return html
+
+        if self.shared:
+            stored = db.session.get(RenderedPage, (session_id, key))
+            if stored is not None:
+                html = zlib.decompress(stored.html).decode()
+                self.memory.record_shared_hit()
+                self.memory.put((session_id, key), html)
+                return html
+
+        self.memory.record_miss()
+        html = render()
+        self.memory.put((session_id, key), html)
+        if self.shared:
+            self._store(session_id, key, html)
+        return html
+
+    def invalidate(self, session_ids: list[int]) -> None:
+        """Drop every cached page of `session_ids`.
+
+        The shared rows are deleted in the caller's transaction, so they go
+        with the session or feedback change that made them obsolete.
+        """
+        self.memory.discard_sessions(set(session_ids))
+        db.session.execute(
+            db.delete(RenderedPage).where(RenderedPage.session_id.in_(session_ids))
+        )
+
+    def _store(self, session_id: int, key: str, html: str) -> None:
+        # On a connection and transaction of its own: pages are stored during
+        # GETs, which must not commit the request's session. A page that is
+        # not stored is only rendered again, so failures are logged, not raised
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(
+                    db.insert(RenderedPage).values(
+                        session_id=session_id,
+                        key=key,
+                        html=zlib.compress(html.encode()),
+                    )
+                )
+        except IntegrityError:
+            # Another worker rendered the same page first
+            pass
+        except SQLAlchemyError as e:
+            logger.warning(f"Could not store rendered page {key!r}: {e}")
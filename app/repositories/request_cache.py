@@ -0,0 +1,28 @@
+class RequestCache:
+    """Memoizes repository reads for the lifetime of one request.
+
+    Entries are grouped by interview session id so that any write touching a
+    session can drop everything derived from it in one call.
+    """
+
+    def __init__(self):
+        self._entries: dict[int, dict] = {}
+
+    def get_or_load(self, session_id: int, key, loader):
+        bucket = self._entries.setdefault(session_id, {})
+        if key not in bucket:
+            bucket[key] = loader()
+        return bucket[key]
+
+    def invalidate(self, session_id: int) -> None:
+        self._entries.pop(session_id, None)
+
+
+class NullCache:
+    """Pass-through cache used outside requests or when caching is disabled"""
+
+    def get_or_load(self, session_id: int, key, loader):
+        return loader()
+
+    def invalidate(self, session_id: int) -> None:
+        pass
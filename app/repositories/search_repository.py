@@ -0,0 +1,288 @@
+import re
+from dataclasses import dataclass
+from sqlalchemy import DDL, bindparam, event, text
+from app.models import db, ArchivedSession, Feedback, Message, Session
+
+
+# Snippet highlight markers; control characters cannot appear in escaped
+# HTML, so the caller can safely swap them for <mark> tags after escaping.
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
+
+_SQLITE_DDL = DDL(
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5("
+    "content, session_id UNINDEXED, kind UNINDEXED, "
+    "tokenize = 'porter unicode61')"
+)
+_POSTGRES_DDL = [
+    DDL(
+        "CREATE TABLE IF NOT EXISTS search_index ("
+        "id BIGSERIAL PRIMARY KEY, "
+        "session_id INTEGER NOT NULL, "
+        "kind VARCHAR(20) NOT NULL, "
+        "content TEXT NOT NULL, "
+        "tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', content)) STORED)"
+    ),
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_search_index_tsv ON search_index USING GIN (tsv)"
+    ),
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_search_index_session_id "
+        "ON search_index (session_id)"
+    ),
+]
+
+# create_all()/drop_all() do not know about the index, so hook it in by dialect
+event.listen(db.metadata, "after_create", _SQLITE_DDL.execute_if(dialect="sqlite"))
+for _ddl in _POSTGRES_DDL:
+    event.listen(db.metadata, "after_create", _ddl.execute_if(dialect="postgresql"))
+event.listen(db.metadata, "before_drop", DDL("DROP TABLE IF EXISTS search_index"))
+
+# Ownership is checked against the session tables, so the statement stays the
+# same size however many sessions the user has
+_OWNED_SESSION_IDS = (
+    "SELECT id FROM sessions WHERE user_id = :user_id "
+    "UNION ALL SELECT id FROM archived_sessions WHERE user_id = :user_id"
+)
+
+
+@dataclass
+class SearchResult:
+    session_id: int
+    kind: str
+    snippet: str
+    job_title: str
+    company_name: str
+
+
+class SearchRepository:
+    """Full-text index over session titles, messages and feedback.
+
+    Backed by an FTS5 virtual table on SQLite and a tsvector column with a GIN
+    index on Postgres. Writes only add statements to the caller's transaction.
+    """
+
+    KIND_SESSION = "session"
+    KIND_MESSAGE = "message"
+    KIND_FEEDBACK = "feedback"
+
+    def index(self, session_id: int, kind: str, content: str | None) -> None:
+        if not content or not content.strip():
+            return
+        db.session.execute(
+            text(
+                "INSERT INTO search_index (content, session_id, kind) "
+                "VALUES (:content, :session_id, :kind)"
+            ),
+            {"content": content, "session_id": session_id, "kind": kind},
+        )
+
+    def index_many(self, rows: list[dict]) -> None:
+        """Bulk variant of `index`; rows carry content, session_id and kind"""
+        rows = [r for r in rows if r["content"] and r["content"].strip()]
+        if rows:
+            db.session.execute(
+                text(
+                    "INSERT INTO search_index (content, session_id, kind) "
+                    "VALUES (:content, :session_id, :kind)"
+                ),
+                rows,
+            )
+
+    def remove_sessions(self, session_ids: list[int]) -> None:
+        if not session_ids:
+            return
+        db.session.execute(
+            text(
+                "DELETE FROM search_index WHERE session_id IN :session_ids"
+            ).bindparams(bindparam("session_ids", expanding=True)),
+            {"session_ids": list(session_ids)},
+        )
+
+    def search(
+        self, query: str, user_id: int | None, limit: int, offset: int
+    ) -> tuple[list[SearchResult], int]:
+        """Best matches first among the sessions `user_id` owns, hot or
+        archived, plus the total match count"""
+        if user_id is None:
+            return [], 0
+
+        if self._dialect() == "postgresql":
+            rows, total = self._search_postgres(query, user_id, limit, offset)
+        else:
+            match = self.to_fts5_query(query)
+            if not match:
+                return [], 0
+            rows, total = self._search_sqlite(match, user_id, limit, offset)
+
+        titles = self._session_titles({row.session_id for row in rows})
+        results = [
+            SearchResult(
+                session_id=row.session_id,
+                kind=row.kind,
+                snippet=row.snippet,
+                job_title=titles.get(row.session_id, ("", ""))[0],
+                company_name=titles.get(row.session_id, ("", ""))[1],
+            )
+            for row in rows
+        ]
+        return results, total
+
+    def rebuild(self) -> int:
+        """Recreate the whole index from the hot and archived tables"""
+        from .archive_repository import ArchiveRepository
+
+        db.session.execute(text("DELETE FROM search_index"))
+        indexed = 0
+
+        for session in db.session.execute(
+            db.select(Session.id, Session.job_title, Session.company_name)
+        ):
+            self.index(
+                session.id,
+                self.KIND_SESSION,
+                f"{session.job_title} {session.company_name}",
+            )
+            indexed += 1
+
+        batch = []
+        for message in db.session.execute(
+            db.select(Message.session_id, Message.content).execution_options(
+                yield_per=1000
+            )
+        ):
+            batch.append(
+                {
+                    "content": message.content,
+                    "session_id": message.session_id,
+                    "kind": self.KIND_MESSAGE,
+                }
+            )
+            if len(batch) >= 1000:
+                self.index_many(batch)
+                indexed += len(batch)
+                batch = []
+        self.index_many(batch)
+        indexed += len(batch)
+
+        for feedback in Feedback.query.yield_per(1000):
+            self.index(
+                feedback.session_id,
+                self.KIND_FEEDBACK,
+                self.feedback_text(
+                    feedback.strengths, feedback.weaknesses, feedback.cv_improvements
+                ),
+            )
+            indexed += 1
+
+        for archived in ArchivedSession.query.yield_per(100):
+            data = ArchiveRepository.decode_payload(archived.payload)
+            self.index(
+                archived.id,
+                self.KIND_SESSION,
+                f"{archived.job_title} {archived.company_name}",
+            )
+            self.index_many(
+                [
+                    {
+                        "content": m["content"],
+                        "session_id": archived.id,
+                        "kind": self.KIND_MESSAGE,
+                    }
+                    for m in data["messages"]
+                ]
+            )
+            feedback = data["feedback"]
+            self.index(
+                archived.id,
+                self.KIND_FEEDBACK,
+                self.feedback_text(
+                    feedback["strengths"],
+                    feedback["weaknesses"],
+                    feedback["cv_improvements"],
+                ),
+            )
+            indexed += len(data["messages"]) + 2
+
+        db.session.commit()
+        return indexed
+
+    @staticmethod
+    def feedback_text(*parts: str | None) -> str:
+        return "\n".join(p for p in parts if p)
+
+    @staticmethod
+    def to_fts5_query(query: str) -> str:
+        """Turn free text into a safe FTS5 query: every word must match, and
+        the last one may be a prefix so results appear while typing."""
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return ""
+        quoted = [f'"{term}"' for term in terms]
+        quoted[-1] += "*"
+        return " ".join(quoted)
+
+    def _search_sqlite(self, match: str, user_id: int, limit, offset):
+        params = {"match": match, "user_id": user_id}
+        where = (
+            "WHERE search_index MATCH :match "
+            f"AND CAST(session_id AS INTEGER) IN ({_OWNED_SESSION_IDS}) "
+        )
+        rows = db.session.execute(
+            text(
+                "SELECT CAST(session_id AS INTEGER) AS session_id, kind, "
+                f"snippet(search_index, 0, '{HIGHLIGHT_START}', '{HIGHLIGHT_END}', "
+                "'…', 16) AS snippet "
+                f"FROM search_index {where}"
+                "ORDER BY bm25(search_index) "
+                "LIMIT :limit OFFSET :offset"
+            ),
+            {**params, "limit": limit, "offset": offset},
+        ).all()
+        total = db.session.execute(
+            text(f"SELECT count(*) FROM search_index {where}"), params
+        ).scalar()
+        return rows, total
+
+    def _search_postgres(self, query: str, user_id: int, limit, offset):
+        params = {"query": query, "user_id": user_id}
+        rows = db.session.execute(
+            text(
+                "SELECT session_id, kind, "
+                "ts_headline('english', content, q, "
+                f"'StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, "
+                "MaxWords=24, MinWords=8') AS snippet "
+                "FROM search_index, websearch_to_tsquery('english', :query) AS q "
+                f"WHERE tsv @@ q AND session_id IN ({_OWNED_SESSION_IDS}) "
+                "ORDER BY ts_rank(tsv, q) DESC "
+                "LIMIT :limit OFFSET :offset"
+            ),
+            {**params, "limit": limit, "offset": offset},
+        ).all()
+        total = db.session.execute(
+            text(
+                "SELECT count(*) FROM search_index, "
+                "websearch_to_tsquery('english', :query) AS q "
+                f"WHERE tsv @@ q AND session_id IN ({_OWNED_SESSION_IDS})"
+            ),
+            params,
+        ).scalar()
+        return rows, total
+
+    @staticmethod
+    def _session_titles(session_ids: set[int]) -> dict[int, tuple[str, str]]:
+        if not session_ids:
+            return {}
+        titles = {}
+        for model in (Session, ArchivedSession):
+            for row in db.session.execute(
+                db.select(model.id, model.job_title, model.company_name).where(
+                    model.id.in_(session_ids)
+                )
+            ):
+                titles[row.id] = (row.job_title, row.company_name)
+        return titles
+
+    @staticmethod
+    def _dialect() -> str:
+        return db.session.get_bind().dialect.name
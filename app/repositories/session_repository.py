@@ -1,10 +1,30 @@
-from app.models import db, Session
+from datetime import datetime
+from app.models import db, ArchivedSession, Session, Message, Feedback, UploadJob
 from app.exceptions import NotFoundError
+from .document_repository import DocumentRepository
+from .render_cache_repository import RenderCacheRepository
+from .request_cache import NullCache
+from .search_repository import SearchRepository
 
 
 class SessionRepository:
     """Handles all database operations for Session model"""
 
+    # Keeps IN (...) lists well under SQLite's bound-parameter limit
+    DELETE_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        document_repository: DocumentRepository | None = None,
+        cache=None,
+        search_repository: SearchRepository | None = None,
+        render_cache: RenderCacheRepository | None = None,
+    ):
+        self.document_repo = document_repository or DocumentRepository()
+        self.cache = cache or NullCache()
+        self.search_repo = search_repository or SearchRepository()
+        self.render_cache = render_cache or RenderCacheRepository()
+
     def create(
         self, job_title: str, company_name: str, user_id: int | None = None
     ) -> Session:
@@ -13,29 +33,43 @@ class SessionRepository:
             job_title=job_title, company_name=company_name, user_id=user_id
         )
         db.session.add(session)
+        db.session.flush()
+        self.search_repo.index(
+            session.id, SearchRepository.KIND_SESSION, f"{job_title} {company_name}"
+        )
         db.session.commit()
         db.session.refresh(session)
         return session
 
     def get_by_id(self, session_id: int) -> Session | None:
-        return Session.query.get(session_id)
+        return self.cache.get_or_load(
+            session_id, "session", lambda: db.session.get(Session, session_id)
+        )
 
-    def update_cv_text(self, session_id: int, cv_text: str) -> Session:
-        session = Session.query.get(session_id)
+    def update_cv_text(
+        self, session_id: int, cv_text: str, sections: list[dict] | None = None
+    ) -> Session:
+        session = self.get_by_id(session_id)
         if not session:
             raise NotFoundError(f"Session {session_id} not found")
 
-        session.cv_text = cv_text
+        session.cv_document_id = self.document_repo.get_or_create_id(cv_text, sections)
+        session.has_cv = True
         db.session.commit()
+        self.cache.invalidate(session_id)
         return session
 
     def update_job_description(self, session_id: int, job_description: str) -> Session:
-        session = Session.query.get(session_id)
+        session = self.get_by_id(session_id)
         if not session:
             raise NotFoundError(f"Session {session_id} not found")
 
-        session.job_description_text = job_description
+        session.job_description_document_id = self.document_repo.get_or_create_id(
+            job_description
+        )
+        session.has_job_description = True
         db.session.commit()
+        self.cache.invalidate(session_id)
         return session
 
     def get_by_ids(self, session_ids: list[int]) -> list[Session]:
@@ -49,6 +83,17 @@ class SessionRepository:
             .all()
         )
 
+    def get_recent_for_user(self, user_id: int, limit: int) -> list[Session]:
+        return (
+            Session.query.filter(Session.user_id == user_id)
+            .options(
+                db.selectinload(Session.messages), db.selectinload(Session.feedback)
+            )
+            .order_by(Session.created_at.desc())
+            .limit(limit)
+            .all()
+        )
+
     def get_all(self) -> list[Session]:
         return (
             Session.query.options(
@@ -59,15 +104,72 @@ class SessionRepository:
         )
 
     def delete(self, session_id: int) -> None:
-        session = Session.query.get(session_id)
-        if not session:
+        if not self.delete_many([session_id]):
             raise NotFoundError(f"Session {session_id} not found")
 
-        db.session.delete(session)
-        db.session.commit()
+    def delete_many(self, session_ids: list[int], include_archived: bool = True) -> int:
+        """Delete sessions with their messages, feedback and upload jobs in one
+        transaction.
+
+        Uses set-based DELETE ... WHERE session_id IN (...) statements instead
+        of the ORM cascade, so child rows are never loaded into memory.
+        Archived copies are removed too unless `include_archived` is False.
+        Returns the number of sessions deleted.
+        """
+        session_ids = list(dict.fromkeys(session_ids))
+        deleted = 0
+
+        try:
+            for start in range(0, len(session_ids), self.DELETE_BATCH_SIZE):
+                batch = session_ids[start : start + self.DELETE_BATCH_SIZE]
+                db.session.execute(
+                    db.delete(Message).where(Message.session_id.in_(batch))
+                )
+                db.session.execute(
+                    db.delete(Feedback).where(Feedback.session_id.in_(batch))
+                )
+                db.session.execute(
+                    db.delete(UploadJob).where(UploadJob.session_id.in_(batch))
+                )
+                result = db.session.execute(
+                    db.delete(Session).where(Session.id.in_(batch))
+                )
+                deleted += result.rowcount
+                if include_archived:
+                    # Archived sessions stay searchable and viewable, so only
+                    # a real delete drops their index entries and pages
+                    self.search_repo.remove_sessions(batch)
+                    self.render_cache.invalidate(batch)
+                    result = db.session.execute(
+                        db.delete(ArchivedSession).where(ArchivedSession.id.in_(batch))
+                    )
+                    deleted += result.rowcount
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        for session_id in session_ids:
+            self.cache.invalidate(session_id)
+        return deleted
+
+    def get_ids_created_before(self, cutoff: datetime, limit: int) -> list[int]:
+        """Ids of hot and archived sessions created before `cutoff`"""
+        hot = db.select(Session.id.label("id")).where(Session.created_at < cutoff)
+        archived = db.select(ArchivedSession.id.label("id")).where(
+            ArchivedSession.created_at < cutoff
+        )
+        ids = db.union(hot, archived).subquery()
+        return list(
+            db.session.scalars(db.select(ids.c.id).order_by(ids.c.id).limit(limit))
+        )
 
     def get_session_with_messages(self, session_id: int) -> Session | None:
-        return Session.query.options(db.joinedload(Session.messages)).get(session_id)
+        return db.session.get(
+            Session, session_id, options=[db.joinedload(Session.messages)]
+        )
 
     def get_session_with_feedback(self, session_id: int) -> Session | None:
-        return Session.query.options(db.joinedload(Session.feedback)).get(session_id)
+        return db.session.get(
+            Session, session_id, options=[db.joinedload(Session.feedback)]
+        )
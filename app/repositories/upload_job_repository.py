@@ -0,0 +1,39 @@
+from datetime import datetime
+from app.models import db, UploadJob
+
+
+class UploadJobRepository:
+    """Status rows for background CV uploads. Every write commits at once so
+    other workers polling the status see it immediately."""
+
+    def create(self, session_id: int, filename: str) -> UploadJob:
+        job = UploadJob(session_id=session_id, filename=filename)
+        db.session.add(job)
+        db.session.commit()
+        return job
+
+    def get_latest(self, session_id: int) -> UploadJob | None:
+        return (
+            UploadJob.query.filter_by(session_id=session_id)
+            .order_by(UploadJob.id.desc())
+            .first()
+        )
+
+    def mark_processing(self, job_id: int) -> None:
+        self._update(job_id, status=UploadJob.PROCESSING)
+
+    def mark_done(self, job_id: int) -> None:
+        self._update(job_id, status=UploadJob.DONE, error=None)
+
+    def mark_failed(self, job_id: int, error: str) -> None:
+        # Whatever the failed job left in the session must not be committed
+        db.session.rollback()
+        self._update(job_id, status=UploadJob.FAILED, error=error)
+
+    def _update(self, job_id: int, **values) -> None:
+        db.session.execute(
+            db.update(UploadJob)
+            .where(UploadJob.id == job_id)
+            .values(updated_at=datetime.now(), **values)
+        )
+        db.session.commit()
@@ -0,0 +1,12 @@
+from app.models import db, User
+
+
+class UserRepository:
+    def create(self, email: str | None = None) -> User:
+        user = User(email=email)
+        db.session.add(user)
+        db.session.commit()
+        return user
+
+    def exists(self, user_id: int) -> bool:
+        return db.session.get(User, user_id) is not None
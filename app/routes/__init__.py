@@ -1,8 +1,13 @@
+from .admin_routes import bp as admin_bp
+from .analytics_routes import bp as analytics_bp
+from .asset_routes import bp as assets_bp
 from .document_routes import bp as document_bp
 from .session_routes import bp as session_bp
 from .interview_routes import bp as interview_bp
 from .feedback_routes import bp as feedback_bp
+from .search_routes import bp as search_bp
 from .errors import register_error_handlers
+from .ownership import migrate_legacy_cookie
 
 
 def register_routes(app):
@@ -10,4 +15,9 @@ def register_routes(app):
     app.register_blueprint(interview_bp)
     app.register_blueprint(feedback_bp)
     app.register_blueprint(document_bp)
+    app.register_blueprint(search_bp)
+    app.register_blueprint(analytics_bp)
+    app.register_blueprint(admin_bp)
+    app.register_blueprint(assets_bp)
     register_error_handlers(app)
+    app.before_request(migrate_legacy_cookie)
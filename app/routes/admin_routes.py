@@ -0,0 +1,102 @@
+import hmac
+from functools import wraps
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    jsonify,
+    request,
+    stream_with_context,
+)
+from ..container import (
+    get_container,
+    get_parse_cache_memory,
+    get_render_cache_memory,
+)
+from ..exceptions import ValidationError
+from ..profiling import get_profile_store
+from ..services.export_service import ExportService
+
+
+bp = Blueprint("admin", __name__, url_prefix="/admin")
+
+
+def require_admin_token(view):
+    """Allow the request only with `Authorization: Bearer <ADMIN_API_TOKEN>`.
+
+    Admin endpoints are hidden entirely when no token is configured.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        expected = current_app.config.get("ADMIN_API_TOKEN")
+        if not expected:
+            abort(404)
+
+        scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(
+            token.encode(), expected.encode()
+        ):
+            abort(401)
+        return view(*args, **kwargs)
+
+    return wrapper
+
+
+@bp.route("/export")
+@require_admin_token
+def export_sessions():
+    compress = request.args.get("gzip", "").lower() in ("1", "true", "yes")
+
+    try:
+        since = ExportService.parse_bound(request.args.get("since"), "since")
+        until = ExportService.parse_bound(request.args.get("until"), "until")
+        chunks = get_container().export_service.stream_ndjson(
+            since=since, until=until, compress=compress
+        )
+    except ValidationError as e:
+        return jsonify(error=str(e)), 400
+
+    if compress:
+        response = Response(stream_with_context(chunks), mimetype="application/gzip")
+        response.headers["Content-Disposition"] = (
+            "attachment; filename=sessions.ndjson.gz"
+        )
+        return response
+
+    return Response(stream_with_context(chunks), mimetype="application/x-ndjson")
+
+
+@bp.route("/metrics")
+@require_admin_token
+def metrics():
+    # Counters are per worker process
+    return jsonify(
+        parse_cache=get_parse_cache_memory(current_app).stats(),
+        render_cache=get_render_cache_memory(current_app).stats(),
+    )
+
+
+@bp.route("/profiles")
+@require_admin_token
+def list_profiles():
+    # Profiles are kept by the worker that served the request
+    return jsonify(profiles=get_profile_store(current_app).list())
+
+
+@bp.route("/profiles/<profile_id>")
+@require_admin_token
+def download_profile(profile_id):
+    """The profile as speedscope JSON; open it at https://www.speedscope.app"""
+    stored = get_profile_store(current_app).get(profile_id)
+    if stored is None:
+        abort(404)
+    meta, profiler = stored
+    response = jsonify(
+        profiler.to_speedscope(f"{meta['method']} {meta['path']} ({meta['status']})")
+    )
+    response.headers["Content-Disposition"] = (
+        f"attachment; filename=profile-{profile_id}.speedscope.json"
+    )
+    return response
@@ -0,0 +1,15 @@
+from flask import Blueprint, render_template
+from ..container import get_container
+from ..query_budget import query_budget
+from .ownership import current_user_id
+
+
+bp = Blueprint("analytics", __name__)
+
+
+@bp.route("/progress")
+@query_budget(3)
+def progress():
+    # Reads only the materialized user_progress rows, never sessions or feedback
+    progress = get_container().analytics_service.get_progress(current_user_id())
+    return render_template("progress.html", progress=progress)
@@ -0,0 +1,59 @@
+import json
+import mimetypes
+import os
+from flask import Blueprint, abort, current_app, request, send_from_directory, url_for
+
+
+bp = Blueprint("assets", __name__, url_prefix="/assets")
+
+# Built files are named after their content, so they never change in place
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Precompressed variants written by `python -m assets.build`, best first
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _dist() -> str:
+    return os.path.join(current_app.static_folder, "dist")
+
+
+def get_manifest() -> dict[str, str]:
+    """Bundle name -> content-hashed filename, read once per process"""
+    manifest = current_app.extensions.get("asset_manifest")
+    if manifest is None:
+        try:
+            with open(os.path.join(_dist(), "manifest.json")) as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            raise RuntimeError(
+                "static/dist/manifest.json is missing, run: python -m assets.build"
+            ) from None
+        current_app.extensions["asset_manifest"] = manifest
+    return manifest
+
+
+@bp.app_template_global()
+def asset_url(name: str) -> str:
+    return url_for("assets.serve", filename=get_manifest()[name])
+
+
+@bp.route("/<path:filename>")
+def serve(filename):
+    if filename not in get_manifest().values():
+        abort(404)
+
+    encoding, suffix = next(
+        (
+            (encoding, suffix)
+            for encoding, suffix in ENCODINGS
+            if request.accept_encodings.quality(encoding) > 0
+        ),
+        (None, ""),
+    )
+    response = send_from_directory(
+        _dist(), filename + suffix, mimetype=mimetypes.guess_type(filename)[0]
+    )
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.vary.add("Accept-Encoding")
+    return response
@@ -0,0 +1,58 @@
+import hashlib
+from collections.abc import Callable
+from datetime import datetime
+from flask import Response, current_app, make_response, request
+from flask import session as flask_session
+from werkzeug.http import is_resource_modified
+from ..container import get_container
+
+
+def _template_version() -> str:
+    """Digest of every template's source, so a deploy invalidates old ETags"""
+    version = current_app.extensions.get("template_version")
+    if version is None:
+        env = current_app.jinja_env
+        digest = hashlib.sha256()
+        for name in sorted(env.list_templates()):
+            source, _, _ = env.loader.get_source(env, name)
+            digest.update(name.encode() + b"\0" + source.encode())
+        version = current_app.extensions["template_version"] = digest.hexdigest()[:12]
+    return version
+
+
+def render_if_modified(
+    version: str,
+    last_modified: datetime | None,
+    render: Callable[[], str],
+    cache_for_session: int | None = None,
+) -> Response:
+    """Answer 304 if the browser already has `version` of this page, otherwise
+    render it and attach the validators.
+
+    `version` must change whenever the page would, and be cheap to compute;
+    `render` is never called for a repeat view. With `cache_for_session`, the
+    HTML is kept in the render cache under that session and this version.
+    """
+    etag = f"{_template_version()}-{version}"
+    # A pending flash message is part of the page, and a 304 would leave it
+    # unshown
+    flashing = "_flashes" in flask_session
+    if not flashing and not is_resource_modified(
+        request.environ, etag=etag, last_modified=last_modified
+    ):
+        response = Response(status=304)
+    elif flashing or cache_for_session is None:
+        response = make_response(render())
+    else:
+        render_cache = get_container().render_cache_repository
+        response = make_response(
+            render_cache.get_or_render(cache_for_session, etag, render)
+        )
+
+    response.set_etag(etag, weak=True)
+    if last_modified:
+        response.last_modified = last_modified
+    # Pages are per-owner: browsers may keep them but must revalidate
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
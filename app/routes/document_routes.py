@@ -1,43 +1,25 @@
 from flask import Blueprint, request, redirect, url_for, flash
-from flask import session as flask_session
-from ..services.document_service import DocumentService
-from ..repositories.session_repository import SessionRepository
-from ..repositories.file_repository import FileRepository
+from ..container import get_container
 from ..exceptions import ValidationError, NotFoundError, DocumentParsingError
+from ..query_budget import query_budget
+from .ownership import check_session_ownership
 
 
 bp = Blueprint("document", __name__, url_prefix="/session")
 
 
-def _get_document_service():
-    from flask import current_app
-
-    session_repo = SessionRepository()
-    file_repo = FileRepository(current_app.config["UPLOAD_FOLDER"])
-    return DocumentService(session_repo, file_repo)
-
-
-def _check_session_ownership(session_id):
-    my_sessions = flask_session.get("my_sessions", [])
-    if session_id not in my_sessions:
-        from flask import abort
-
-        abort(403, "You don't have access to this session")
-
-
 @bp.route("/<int:session_id>/upload")
+@query_budget(4)
 def upload_page(session_id):
-    _check_session_ownership(session_id)
+    check_session_ownership(session_id)
     try:
-        from ..services.session_service import SessionService
-        from ..repositories.session_repository import SessionRepository
-
-        session_service = SessionService(SessionRepository())
-        session = session_service.get_session(session_id)
+        container = get_container()
+        session = container.session_service.get_session(session_id)
+        upload_job = container.document_service.get_upload_job(session_id)
 
         from flask import render_template
 
-        return render_template("upload.html", session=session)
+        return render_template("upload.html", session=session, upload_job=upload_job)
     except NotFoundError:
         from flask import abort
 
@@ -45,8 +27,9 @@ def upload_page(session_id):
 
 
 @bp.route("/<int:session_id>/upload-cv", methods=["POST"])
+@query_budget(16)
 def upload_cv(session_id):
-    _check_session_ownership(session_id)
+    check_session_ownership(session_id)
 
     try:
         file = request.files.get("cv_file")
@@ -54,10 +37,13 @@ def upload_cv(session_id):
         if not file:
             raise ValidationError("No file was uploaded")
 
-        document_service = _get_document_service()
-        document_service.upload_cv(session_id, file)
-
-        flash("CV uploaded and processed successfully!", "success")
+        document_service = get_container().document_service
+        if document_service.parses_uploads_in_background:
+            # The upload page polls upload_status until the job finishes
+            document_service.submit_cv_upload(session_id, file)
+        else:
+            document_service.upload_cv(session_id, file)
+            flash("CV uploaded and processed successfully!", "success")
 
     except ValidationError as e:
         flash(str(e), "error")
@@ -73,14 +59,37 @@ def upload_cv(session_id):
     return redirect(url_for("document.upload_page", session_id=session_id))
 
 
+@bp.route("/<int:session_id>/upload-status")
+@query_budget(3)
+def upload_status(session_id):
+    """Polled by the upload page while a CV is parsed in the background"""
+    check_session_ownership(session_id)
+
+    from flask import make_response, render_template
+
+    upload_job = get_container().document_service.get_upload_job(session_id)
+    response = make_response(
+        render_template(
+            "fragments/upload_status.html",
+            session_id=session_id,
+            upload_job=upload_job,
+        )
+    )
+    if upload_job and upload_job.status == upload_job.DONE:
+        # Reload so the CV section and the start button reflect the new CV
+        response.headers["HX-Refresh"] = "true"
+    return response
+
+
 @bp.route("/<int:session_id>/upload-job", methods=["POST"])
+@query_budget(8)
 def upload_job_description(session_id):
-    _check_session_ownership(session_id)
+    check_session_ownership(session_id)
 
     try:
         job_description = request.form.get("job_description", "")
 
-        document_service = _get_document_service()
+        document_service = get_container().document_service
         document_service.upload_job_description(session_id, job_description)
 
         flash("Job description saved successfully!", "success")
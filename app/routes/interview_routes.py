@@ -1,41 +1,23 @@
 from flask import Blueprint, render_template, request, redirect, url_for, flash, abort
-from flask import session as flask_session
-from ..services.interview_service import InterviewService
-from ..services.session_service import SessionService
-from ..repositories.session_repository import SessionRepository
-from ..repositories.message_repository import MessageRepository
+from ..container import get_container
 from ..exceptions import ValidationError, NotFoundError, AIServiceError
+from ..query_budget import query_budget
+from .conditional import render_if_modified
+from .ownership import check_session_ownership
 
 
 bp = Blueprint("interview", __name__, url_prefix="/session")
 
 
-def _get_interview_service():
-    from ..extensions import get_ai_client
-
-    session_repo = SessionRepository()
-    message_repo = MessageRepository()
-    ai_client = get_ai_client()
-    return InterviewService(session_repo, message_repo, ai_client)
-
-
-def _get_session_service():
-    return SessionService(SessionRepository())
-
-
-def _check_session_ownership(session_id):
-    my_sessions = flask_session.get("my_sessions", [])
-    if session_id not in my_sessions:
-        abort(403, "You don't have access to this session")
-
-
 @bp.route("/<int:session_id>/interview")
+@query_budget(12)
 def interview_page(session_id):
-    _check_session_ownership(session_id)
+    check_session_ownership(session_id)
 
     try:
-        session_service = _get_session_service()
-        interview_service = _get_interview_service()
+        container = get_container()
+        session_service = container.session_service
+        interview_service = container.interview_service
 
         session = session_service.get_session(session_id)
 
@@ -51,14 +33,23 @@ def interview_page(session_id):
         if not progress["is_started"]:
             interview_service.start_interview(session_id)
 
-        message_repo = MessageRepository()
-        conversation = message_repo.get_conversation(session_id)
+        message_repository = container.message_repository
+        message_count, last_message_at = message_repository.get_version(session_id)
 
-        return render_template(
-            "interview.html",
-            session=session,
-            conversation=conversation,
-            progress=progress,
+        def render():
+            return render_template(
+                "interview.html",
+                session=session,
+                conversation=message_repository.get_conversation(session_id),
+                progress=progress,
+            )
+
+        # A finished transcript no longer changes, so it is cached
+        return render_if_modified(
+            f"interview-{message_count}",
+            last_message_at,
+            render,
+            cache_for_session=session_id if progress["is_complete"] else None,
         )
 
     except NotFoundError:
@@ -69,17 +60,17 @@ def interview_page(session_id):
 
 
 @bp.route("/<int:session_id>/message", methods=["POST"])
+@query_budget(15)
 def send_message(session_id):
-    _check_session_ownership(session_id)
+    check_session_ownership(session_id)
 
     try:
         answer = request.form.get("answer", "")
 
-        interview_service = _get_interview_service()
-        result = interview_service.submit_answer(session_id, answer)
+        container = get_container()
+        result = container.interview_service.submit_answer(session_id, answer)
 
-        message_repo = MessageRepository()
-        conversation = message_repo.get_conversation(session_id)
+        conversation = container.message_repository.get_conversation(session_id)
 
         if result["is_complete"]:
             user_message = conversation[-1]
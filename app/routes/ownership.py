@@ -0,0 +1,53 @@
+from flask import abort, g
+from flask import session as flask_session
+from ..container import get_container
+
+
+# The only thing the session cookie keeps between requests (flashed messages
+# aside); everything else is looked up server-side by it
+TOKEN_KEY = "sid"
+# What the cookie used to carry: the anonymous user and every session it made
+LEGACY_KEYS = ("user_id", "my_sessions")
+
+
+def current_user_id() -> int | None:
+    """The user behind this browser, or None if it has never created a session"""
+    if "current_user_id" not in g:
+        token = flask_session.get(TOKEN_KEY)
+        g.current_user_id = (
+            get_container().session_service.get_browser_user(token) if token else None
+        )
+    return g.current_user_id
+
+
+def ensure_user_id() -> int:
+    """The current user, starting an anonymous one for a new browser"""
+    user_id = current_user_id()
+    if user_id is None:
+        token, user_id = get_container().session_service.start_browser_session()
+        flask_session[TOKEN_KEY] = token
+        g.current_user_id = user_id
+    return user_id
+
+
+def check_session_ownership(session_id: int) -> None:
+    if not get_container().session_service.is_owner(session_id, current_user_id()):
+        abort(403, "You don't have access to this session")
+
+
+def migrate_legacy_cookie() -> None:
+    """Move a cookie written before ownership lived server-side to a token.
+
+    Its user is kept and the sessions it listed become that user's, unless
+    they already have an owner. Runs before every request; a no-op for
+    cookies without the old keys.
+    """
+    if not any(key in flask_session for key in LEGACY_KEYS):
+        return
+    session_ids = flask_session.pop("my_sessions", None) or []
+    user_id = flask_session.pop("user_id", None)
+    token, user_id = get_container().session_service.start_browser_session(
+        user_id, session_ids
+    )
+    flask_session[TOKEN_KEY] = token
+    g.current_user_id = user_id
@@ -0,0 +1,33 @@
+from flask import Blueprint, render_template, request
+from ..container import get_container
+from ..exceptions import ValidationError
+from ..query_budget import query_budget
+from ..services.search_service import SearchService
+from .ownership import current_user_id
+
+
+bp = Blueprint("search", __name__)
+
+
+@bp.app_template_filter("highlight_snippet")
+def highlight_snippet(snippet):
+    return SearchService.highlight(snippet)
+
+
+@bp.route("/search")
+@query_budget(5)
+def search():
+    query = request.args.get("q", "")
+    page = request.args.get("page", 1, type=int)
+
+    if not query.strip():
+        return render_template("search.html", query="", search=None, error=None)
+
+    try:
+        search = get_container().search_service.search(
+            query, current_user_id(), page=page
+        )
+    except ValidationError as e:
+        return render_template("search.html", query=query, search=None, error=str(e))
+
+    return render_template("search.html", query=query, search=search, error=None)
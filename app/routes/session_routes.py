@@ -1,44 +1,38 @@
 from flask import Blueprint, request, redirect, url_for, flash, render_template
-from flask import session as flask_session
-from ..services.session_service import SessionService
-from ..repositories.session_repository import SessionRepository
+from ..container import get_container
 from ..exceptions import ValidationError
+from ..query_budget import query_budget
+from .ownership import current_user_id, ensure_user_id
 
 
 bp = Blueprint("session", __name__)
 
 
-def _get_session_service():
-    return SessionService(SessionRepository())
-
 @bp.route("/")
 def landing():
     return render_template("landing.html")
 
 
 @bp.route("/dashboard")
+@query_budget(5)
 def index():
-    my_session_ids = flask_session.get("my_sessions", [])
-
-    session_service = _get_session_service()
-    recent_sessions = session_service.get_sessions_by_ids(my_session_ids)
-    recent_sessions = recent_sessions[:5]
+    session_service = get_container().session_service
+    recent_sessions = session_service.get_recent_sessions(current_user_id(), limit=5)
     return render_template("index.html", recent_sessions=recent_sessions)
 
 
 @bp.route("/session/create", methods=["POST"])
+@query_budget(8)
 def create_session():
     try:
         job_title = request.form.get("job_title", "")
         company_name = request.form.get("company_name", "")
 
-        session_service = _get_session_service()
-        new_session = session_service.create_session(job_title, company_name)
-
-        my_sessions = flask_session.get("my_sessions", [])
-        my_sessions.append(new_session.id)
-        flask_session["my_sessions"] = my_sessions  # Reassign to trigger save
-        flask_session.modified = True
+        session_service = get_container().session_service
+        # Anonymous per-browser user; it owns the session and tracks progress
+        new_session = session_service.create_session(
+            job_title, company_name, user_id=ensure_user_id()
+        )
 
         return redirect(url_for("document.upload_page", session_id=new_session.id))
 
@@ -1,6 +1,17 @@
+from .analytics_service import AnalyticsService
 from .document_service import DocumentService
+from .export_service import ExportService
 from .feedback_service import FeedbackService
 from .interview_service import InterviewService
+from .search_service import SearchService
 from .session_service import SessionService
 
-__all__ = ["DocumentService", "FeedbackService", "InterviewService", "SessionService"]
+__all__ = [
+    "AnalyticsService",
+    "DocumentService",
+    "ExportService",
+    "FeedbackService",
+    "InterviewService",
+    "SearchService",
+    "SessionService",
+]
@@ -0,0 +1,16 @@
+from app.repositories.analytics_repository import AnalyticsRepository
+from app.models import UserProgress
+
+
+class AnalyticsService:
+    def __init__(self, analytics_repository: AnalyticsRepository):
+        self.analytics_repo = analytics_repository
+
+    def get_progress(self, user_id: int | None) -> list[UserProgress]:
+        """Progress per job title, most recently practised first"""
+        if user_id is None:
+            return []
+        return self.analytics_repo.get_for_user(user_id)
+
+    def rebuild(self) -> int:
+        return self.analytics_repo.rebuild()
@@ -1,35 +1,159 @@
-from app.repositories import FileRepository, SessionRepository
+import io
+from datetime import datetime, timedelta
+from pathlib import Path
+from app.repositories import (
+    FileRepository,
+    ParseCacheRepository,
+    SessionRepository,
+    UploadJobRepository,
+)
+from utils.cv_structure import CvStructurer
 from utils.document_parser import DocumentParser
-from app.models import Session
-from app.exceptions import ValidationError, NotFoundError
+from app.models import Session, UploadJob
+from app.exceptions import DocumentParsingError, ValidationError, NotFoundError
 
 
 class DocumentService:
     def __init__(
-        self, session_repository: SessionRepository, file_repository: FileRepository
+        self,
+        session_repository: SessionRepository,
+        file_repository: FileRepository,
+        parse_cache: ParseCacheRepository | None = None,
+        parser=None,
+        char_budget: int | None = None,
+        background_jobs=None,
+        upload_job_repository: UploadJobRepository | None = None,
+        background_full_parse: bool = False,
+        upload_job_timeout: float = 120,
     ):
         self.session_repo = session_repository
         self.file_repo = file_repository
+        self.parse_cache = parse_cache
+        # DocumentParser, or an InProcessParser or SandboxedParser carrying the
+        # app's limits; all three share one interface
+        self.parser = parser or DocumentParser
+        # Stop parsing once this many characters are read; None parses everything
+        self.char_budget = char_budget
+        self.background_jobs = background_jobs
+        # When set, uploads are parsed after the response; see submit_cv_upload
+        self.upload_job_repo = upload_job_repository
+        # Fully parse budget-truncated CVs after the response
+        self.background_full_parse = background_full_parse
+        # Active upload jobs older than this were lost with their worker
+        self.upload_job_timeout = upload_job_timeout
+
+    @property
+    def parses_uploads_in_background(self) -> bool:
+        return bool(self.background_jobs and self.upload_job_repo)
 
     def upload_cv(self, session_id: int, file) -> Session:
         session = self.session_repo.get_by_id(session_id)
         if not session:
             raise NotFoundError(f"Session {session_id} not found")
 
-        file_path = self.file_repo.save_uploaded_file(file)
+        with self.file_repo.open_uploaded_file(file) as stream:
+            return self._store_cv(session_id, stream, file.filename)
+
+    def submit_cv_upload(self, session_id: int, file) -> UploadJob:
+        """Keep the upload's bytes and parse them in a background job; the
+        returned job tracks progress and any error"""
+        session = self.session_repo.get_by_id(session_id)
+        if not session:
+            raise NotFoundError(f"Session {session_id} not found")
 
+        with self.file_repo.open_uploaded_file(file) as stream:
+            data = stream.read()
+        if not data:
+            raise ValidationError("The uploaded file is empty")
+
+        job = self.upload_job_repo.create(session_id, file.filename)
+        self.background_jobs.submit(
+            _process_cv_upload, job.id, session_id, data, file.filename
+        )
+        return job
+
+    def process_cv_upload(
+        self, job_id: int, session_id: int, data: bytes, filename: str
+    ) -> None:
+        self.upload_job_repo.mark_processing(job_id)
         try:
-            cv_text = DocumentParser.extract_text(file_path)
-            if not cv_text or len(cv_text.strip()) < 50:
-                raise ValidationError(
-                    "CV seems too short. Please upload a complete CV "
-                    "(at least 50 characters)"
-                )
-            updated_session = self.session_repo.update_cv_text(session_id, cv_text)
+            self._store_cv(session_id, io.BytesIO(data), filename)
+        except ValidationError as e:
+            self.upload_job_repo.mark_failed(job_id, str(e))
+        except DocumentParsingError as e:
+            self.upload_job_repo.mark_failed(job_id, f"Could not read file: {e}")
+        except NotFoundError:
+            self.upload_job_repo.mark_failed(job_id, "Session not found")
+        except Exception:
+            self.upload_job_repo.mark_failed(
+                job_id, "An error occurred processing your CV"
+            )
+            raise
+        else:
+            self.upload_job_repo.mark_done(job_id)
+
+    def get_upload_job(self, session_id: int) -> UploadJob | None:
+        """The session's latest upload job, failing it if its worker is gone"""
+        if not self.upload_job_repo:
+            return None
+        job = self.upload_job_repo.get_latest(session_id)
+        if (
+            job
+            and job.is_active
+            and datetime.now() - job.updated_at
+            > timedelta(seconds=self.upload_job_timeout)
+        ):
+            self.upload_job_repo.mark_failed(
+                job.id, "Processing stopped unexpectedly. Please upload again."
+            )
+            job = self.upload_job_repo.get_latest(session_id)
+        return job
+
+    def _store_cv(self, session_id: int, stream, filename: str) -> Session:
+        cv_text, complete, cache_key = self._extract_text(stream, filename)
+        if not complete and self.background_full_parse and self.background_jobs:
+            stream.seek(0)
+            data = stream.read()
+
+        if not cv_text or len(cv_text.strip()) < 50:
+            raise ValidationError(
+                "CV seems too short. Please upload a complete CV "
+                "(at least 50 characters)"
+            )
+        if cache_key:
+            # Committed together with the session's new CV
+            self.parse_cache.put(cache_key, cv_text)
+        session = self.session_repo.update_cv_text(
+            session_id, cv_text, CvStructurer.structure(cv_text)
+        )
+
+        if not complete and self.background_full_parse and self.background_jobs:
+            self.background_jobs.submit(
+                _complete_cv_text,
+                session_id,
+                session.cv_document_id,
+                data,
+                filename,
+            )
+        return session
 
-            return updated_session
-        finally:
-            self.file_repo.delete_file(file_path)
+    def complete_cv_text(
+        self, session_id: int, partial_document_id: int, data: bytes, filename: str
+    ) -> None:
+        """Replace a budget-truncated CV with its full text, unless the session
+        has had a different CV uploaded since"""
+        text = self.parser.extract_text_from_stream(io.BytesIO(data), filename)
+
+        session = self.session_repo.get_by_id(session_id)
+        if session and session.cv_document_id == partial_document_id:
+            if self.parse_cache:
+                content_hash = self.parse_cache.hash_stream(io.BytesIO(data))
+                self.parse_cache.put(
+                    (content_hash, self._parser_version(filename, None)), text
+                )
+            self.session_repo.update_cv_text(
+                session_id, text, CvStructurer.structure(text)
+            )
 
     def upload_job_description(self, session_id: int, text: str) -> Session:
         session = self.session_repo.get_by_id(session_id)
@@ -53,3 +177,62 @@ class DocumentService:
         updated_session = self.session_repo.update_job_description(session_id, text)
 
         return updated_session
+
+    def _extract_text(
+        self, stream, filename: str
+    ) -> tuple[str, bool, tuple[str, str] | None]:
+        """Parse an upload within the character budget, reusing the text of
+        identical earlier uploads. Also returns whether the text is complete,
+        and the parse cache key to store freshly parsed text under once the
+        caller has accepted it."""
+        keys = []
+        if self.parse_cache:
+            content_hash = self.parse_cache.hash_stream(stream)
+            # A full parse from an earlier upload beats a budgeted one
+            keys = [(content_hash, self._parser_version(filename, None))]
+            if self.char_budget:
+                keys.append(
+                    (content_hash, self._parser_version(filename, self.char_budget))
+                )
+            key, text = self.parse_cache.lookup(keys)
+            if text is not None:
+                return text, key == keys[0], None
+
+        if self.char_budget:
+            text, complete = self.parser.extract_prefix(
+                stream, filename, self.char_budget
+            )
+        else:
+            text = self.parser.extract_text_from_stream(stream, filename)
+            complete = True
+
+        cache_key = None
+        if self.parse_cache:
+            cache_key = keys[0] if complete else keys[-1]
+        return text, complete, cache_key
+
+    def _parser_version(self, filename: str, char_budget: int | None) -> str:
+        version = f"{self.parser.VERSION}{Path(filename).suffix.lower()}"
+        return f"{version}@{char_budget}" if char_budget else version
+
+
+def _process_cv_upload(
+    job_id: int, session_id: int, data: bytes, filename: str
+) -> None:
+    # Runs in a background job with its own app context and container
+    from app.container import get_container
+
+    get_container().document_service.process_cv_upload(
+        job_id, session_id, data, filename
+    )
+
+
+def _complete_cv_text(
+    session_id: int, partial_document_id: int, data: bytes, filename: str
+) -> None:
+    # Runs in a background job with its own app context and container
+    from app.container import get_container
+
+    get_container().document_service.complete_cv_text(
+        session_id, partial_document_id, data, filename
+    )
@@ -0,0 +1,72 @@
+import json
+import zlib
+from collections.abc import Iterator
+from datetime import datetime
+from app.repositories import ExportRepository
+from app.exceptions import ValidationError
+
+
+class ExportService:
+    # Buffer roughly this many bytes of NDJSON before handing a chunk out
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, export_repository: ExportRepository):
+        self.export_repo = export_repository
+
+    def stream_ndjson(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        compress: bool = False,
+    ) -> Iterator[bytes]:
+        """Yield the export as NDJSON chunks, gzip-compressed if requested.
+
+        `since` is inclusive and `until` exclusive, so consecutive exports with
+        adjacent bounds never overlap.
+        """
+        if since and until and since >= until:
+            raise ValidationError("'since' must be earlier than 'until'")
+
+        chunks = self._ndjson_chunks(since, until)
+        return self._gzip(chunks) if compress else chunks
+
+    @staticmethod
+    def _gzip(chunks: Iterator[bytes]) -> Iterator[bytes]:
+        # wbits=31 writes a gzip container instead of a raw zlib stream
+        compressor = zlib.compressobj(level=6, wbits=31)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    def _ndjson_chunks(
+        self, since: datetime | None, until: datetime | None
+    ) -> Iterator[bytes]:
+        buffer = []
+        buffered = 0
+        for records in (
+            self.export_repo.iter_sessions(since, until),
+            self.export_repo.iter_archived(since, until),
+        ):
+            for record in records:
+                line = json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+                buffer.append(line)
+                buffered += len(line)
+                if buffered >= self.CHUNK_SIZE:
+                    yield b"".join(buffer)
+                    buffer.clear()
+                    buffered = 0
+        if buffer:
+            yield b"".join(buffer)
+
+    @staticmethod
+    def parse_bound(value: str | None, name: str) -> datetime | None:
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            raise ValidationError(
+                f"Invalid '{name}' value {value!r}; expected an ISO 8601 date"
+            )
@@ -1,7 +1,16 @@
+from datetime import datetime
 from client.ai_client import AIClient
 from app.models import Feedback
-from app.repositories import FeedbackRepository, MessageRepository, SessionRepository
+from app.repositories import (
+    ArchiveRepository,
+    FeedbackRepository,
+    MessageRepository,
+    SessionRepository,
+)
+from app.repositories.archive_repository import ArchivedFeedback
 from app.exceptions import ValidationError, NotFoundError
+from utils.cv_structure import CvStructurer
+from utils.prompt_templates import PromptTemplates
 
 
 class FeedbackService:
@@ -11,11 +20,13 @@ class FeedbackService:
         message_repository: MessageRepository,
         feedback_repository: FeedbackRepository,
         ai_client: AIClient,
+        archive_repository: ArchiveRepository | None = None,
     ):
         self.session_repo = session_repository
         self.message_repo = message_repository
         self.feedback_repo = feedback_repository
         self.ai_client = ai_client
+        self.archive_repo = archive_repository
 
     def generate_feedback(self, session_id: int) -> Feedback:
         session = self.session_repo.get_by_id(session_id)
@@ -33,7 +44,12 @@ class FeedbackService:
 
         feedback_data = self.ai_client.generate_feedback(
             convo_history=conversation_history,
-            cv_text=session.cv_text,
+            cv_text=CvStructurer.prompt_text(
+                session.cv_text,
+                session.cv_sections,
+                session.job_description_text,
+                PromptTemplates.CV_CHARS,
+            ),
             job_desc=session.job_description_text,
             job_title=session.job_title,
         )
@@ -42,8 +58,22 @@ class FeedbackService:
             session_id=session_id, **feedback_data
         )
 
-    def get_feedback(self, session_id: int) -> Feedback:
+    def get_feedback_version(self, session_id: int) -> datetime:
+        """When the session's feedback was written, or archived with it.
+
+        Feedback never changes afterwards, so this identifies the page.
+        """
+        version = self.feedback_repo.get_created_at(session_id)
+        if not version and self.archive_repo:
+            version = self.archive_repo.get_archived_at(session_id)
+        if not version:
+            raise NotFoundError(f"Feedback for session {session_id} not found.")
+        return version
+
+    def get_feedback(self, session_id: int) -> Feedback | ArchivedFeedback:
         feedback = self.feedback_repo.get_feedback(session_id)
+        if not feedback and self.archive_repo:
+            feedback = self.archive_repo.get_feedback(session_id)
         if not feedback:
             raise NotFoundError(f"Feedback for session {session_id} not found.")
         return feedback
@@ -1,6 +1,8 @@
 from app.repositories import SessionRepository, MessageRepository
 from client.ai_client import AIClient
 from app.exceptions import ValidationError, NotFoundError
+from utils.cv_structure import CvStructurer
+from utils.prompt_templates import PromptTemplates
 
 
 class InterviewService:
@@ -21,7 +23,7 @@ class InterviewService:
         if not session:
             raise NotFoundError(f"Session {session_id} not found")
 
-        if not session.cv_text or not session.job_description_text:
+        if not session.has_cv or not session.has_job_description:
             raise ValidationError(
                 "Session is not ready. CV and job description are required."
             )
@@ -30,7 +32,12 @@ class InterviewService:
             raise ValidationError("Interview has already started.")
 
         first_question = self.ai_client.generate_first_question(
-            cv_text=session.cv_text,
+            cv_text=CvStructurer.prompt_text(
+                session.cv_text,
+                session.cv_sections,
+                session.job_description_text,
+                PromptTemplates.CV_CHARS,
+            ),
             job_desc=session.job_description_text,
             job_title=session.job_title,
             company_name=session.company_name,
@@ -60,7 +67,12 @@ class InterviewService:
 
         next_question = self.ai_client.generate_followup_question(
             convo_history=convo_history,
-            cv_text=session.cv_text,
+            cv_text=CvStructurer.prompt_text(
+                session.cv_text,
+                session.cv_sections,
+                session.job_description_text,
+                PromptTemplates.FOLLOWUP_CV_CHARS,
+            ),
             job_desc=session.job_description_text,
             question_count=question_count,
             max_questions=self.MAX_QUESTIONS,
@@ -0,0 +1,50 @@
+import math
+from markupsafe import Markup, escape
+from app.repositories import SearchRepository
+from app.repositories.search_repository import HIGHLIGHT_END, HIGHLIGHT_START
+from app.exceptions import ValidationError
+
+
+class SearchService:
+    PER_PAGE = 10
+    MAX_QUERY_LENGTH = 200
+
+    def __init__(self, search_repository: SearchRepository):
+        self.search_repo = search_repository
+
+    def search(
+        self,
+        query: str,
+        user_id: int | None,
+        page: int = 1,
+        per_page: int = PER_PAGE,
+    ) -> dict:
+        query = (query or "").strip()
+        if not query:
+            raise ValidationError("Search query cannot be empty")
+
+        if len(query) > self.MAX_QUERY_LENGTH:
+            raise ValidationError(
+                f"Search query too long (max {self.MAX_QUERY_LENGTH} characters)"
+            )
+
+        page = max(page, 1)
+        results, total = self.search_repo.search(
+            query, user_id, limit=per_page, offset=(page - 1) * per_page
+        )
+
+        return {
+            "query": query,
+            "results": results,
+            "total": total,
+            "page": page,
+            "pages": math.ceil(total / per_page),
+        }
+
+    @staticmethod
+    def highlight(snippet: str) -> Markup:
+        """Escape a snippet and turn the index's match markers into <mark> tags"""
+        escaped = str(escape(snippet))
+        return Markup(
+            escaped.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
+        )
@@ -1,13 +1,28 @@
+from datetime import datetime, timedelta
+from app.repositories.archive_repository import ArchiveRepository
+from app.repositories.ownership_repository import OwnershipRepository
 from app.repositories.session_repository import SessionRepository
-from app.models import Session
+from app.repositories.user_repository import UserRepository
+from app.models import ArchivedSession, Session
 from app.exceptions import ValidationError, NotFoundError
 
 
 class SessionService:
-    def __init__(self, session_repository: SessionRepository):
+    def __init__(
+        self,
+        session_repository: SessionRepository,
+        archive_repository: ArchiveRepository | None = None,
+        user_repository: UserRepository | None = None,
+        ownership_repository: OwnershipRepository | None = None,
+    ):
         self.session_repo = session_repository
+        self.archive_repo = archive_repository
+        self.user_repo = user_repository
+        self.ownership_repo = ownership_repository
 
-    def create_session(self, job_title: str, company_name: str) -> Session:
+    def create_session(
+        self, job_title: str, company_name: str, user_id: int | None = None
+    ) -> Session:
         if not job_title or not job_title.strip():
             raise ValidationError("Job title cannot be empty")
 
@@ -18,18 +33,65 @@ class SessionService:
             raise ValidationError("Job title too long (max 200 characters)")
 
         return self.session_repo.create(
-            job_title=job_title.strip(), company_name=company_name.strip()
+            job_title=job_title.strip(),
+            company_name=company_name.strip(),
+            user_id=user_id,
         )
 
-    def get_session(self, session_id: int) -> Session:
+    def resolve_user(self, user_id: int | None) -> int:
+        """Return `user_id` if that user exists, otherwise a new anonymous user's id"""
+        if not self.user_repo:
+            raise RuntimeError("SessionService was created without a user repository")
+        if user_id is not None and self.user_repo.exists(user_id):
+            return user_id
+        return self.user_repo.create().id
+
+    def start_browser_session(
+        self, user_id: int | None = None, session_ids: list[int] | None = None
+    ) -> tuple[str, int]:
+        """Open a browser session for `user_id` (or a new anonymous user) and
+        give it the unowned sessions in `session_ids`.
+
+        Returns the opaque token for the cookie and the user's id.
+        """
+        ownership_repo = self._require_ownership()
+        user_id = self.resolve_user(user_id)
+        if session_ids:
+            ownership_repo.claim(session_ids, user_id)
+        return ownership_repo.create_browser_session(user_id), user_id
+
+    def get_browser_user(self, token: str) -> int | None:
+        return self._require_ownership().get_user_id(token)
+
+    def is_owner(self, session_id: int, user_id: int | None) -> bool:
+        if user_id is None:
+            return False
+        return self._require_ownership().get_owner_id(session_id) == user_id
+
+    def get_recent_sessions(
+        self, user_id: int | None, limit: int = 5
+    ) -> list[Session | ArchivedSession]:
+        """The user's `limit` newest sessions, hot or archived"""
+        if user_id is None:
+            return []
+        sessions = self.session_repo.get_recent_for_user(user_id, limit)
+        if self.archive_repo:
+            sessions += self.archive_repo.get_recent_summaries(user_id, limit)
+        return sorted(sessions, key=lambda s: s.created_at, reverse=True)[:limit]
+
+    def get_session(
+        self, session_id: int, include_archived: bool = False
+    ) -> Session | ArchivedSession:
         session = self.session_repo.get_by_id(session_id)
+        if not session and include_archived and self.archive_repo:
+            session = next(iter(self.archive_repo.get_summaries([session_id])), None)
         if not session:
             raise NotFoundError(f"Session {session_id} not found")
         return session
 
     def is_ready_for_interview(self, session_id: int) -> bool:
         session = self.get_session(session_id)
-        return bool(session.cv_text and session.job_description_text)
+        return bool(session.has_cv and session.has_job_description)
 
     def get_all_sessions(self) -> list[Session]:
         return self.session_repo.get_all()
@@ -37,13 +99,62 @@ class SessionService:
     def delete_session(self, session_id: int) -> None:
         self.session_repo.delete(session_id)
 
-    def get_sessions_by_ids(self, session_ids: list[int]) -> list[Session]:
-        return self.session_repo.get_by_ids(session_ids)
+    def delete_sessions(self, session_ids: list[int]) -> int:
+        return self.session_repo.delete_many(session_ids)
+
+    def purge_sessions(self, older_than_days: int, batch_size: int = 500) -> int:
+        """Delete every session created more than `older_than_days` ago.
+
+        Each batch is deleted in its own transaction to keep locks short.
+        """
+        if older_than_days < 0:
+            raise ValidationError("Retention period cannot be negative")
+
+        cutoff = datetime.now() - timedelta(days=older_than_days)
+        purged = 0
+        while True:
+            session_ids = self.session_repo.get_ids_created_before(cutoff, batch_size)
+            if not session_ids:
+                return purged
+            purged += self.session_repo.delete_many(session_ids)
+
+    def get_sessions_by_ids(
+        self, session_ids: list[int]
+    ) -> list[Session | ArchivedSession]:
+        sessions = self.session_repo.get_by_ids(session_ids)
+        if not self.archive_repo:
+            return sessions
+
+        found = {s.id for s in sessions}
+        missing = [sid for sid in session_ids if sid not in found]
+        sessions.extend(self.archive_repo.get_summaries(missing))
+        return sorted(sessions, key=lambda s: s.created_at, reverse=True)
+
+    def archive_sessions(self, older_than_days: int, batch_size: int = 200) -> int:
+        """Move completed sessions older than `older_than_days` to the archive"""
+        if not self.archive_repo:
+            raise RuntimeError("SessionService was created without an archive")
+        if older_than_days < 0:
+            raise ValidationError("Archive age cannot be negative")
+
+        cutoff = datetime.now() - timedelta(days=older_than_days)
+        return self.archive_repo.archive_completed_before(cutoff, batch_size)
 
     def get_full_session_details(self, session_id: int) -> dict:
         session_with_messages = self.session_repo.get_session_with_messages(session_id)
         if not session_with_messages:
-            raise NotFoundError(f"Session {session_id} not found")
+            transcript = (
+                self.archive_repo.get_transcript(session_id)
+                if self.archive_repo
+                else None
+            )
+            if not transcript:
+                raise NotFoundError(f"Session {session_id} not found")
+            return {
+                "session": transcript.session,
+                "messages": transcript.messages,
+                "feedback": transcript.feedback,
+            }
 
         session_with_feedback = self.session_repo.get_session_with_feedback(session_id)
 
@@ -54,3 +165,10 @@ class SessionService:
             if session_with_feedback
             else None,
         }
+
+    def _require_ownership(self) -> OwnershipRepository:
+        if not self.ownership_repo:
+            raise RuntimeError(
+                "SessionService was created without an ownership repository"
+            )
+        return self.ownership_repo
@@ -0,0 +1,29 @@
+import os
+from jinja2 import FileSystemBytecodeCache
+
+
+def init_templates(app) -> None:
+    """Cache compiled templates on disk and optionally compile them all now.
+
+    The bytecode cache is keyed by each template's source checksum, so a
+    changed template is recompiled, and entries are written to a temporary
+    file and renamed, so workers sharing the directory never read a partial
+    one.
+    """
+    if app.config.get("TEMPLATE_BYTECODE_CACHE", True):
+        directory = app.config.get("TEMPLATE_CACHE_DIR") or None
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Without a directory Jinja uses a private per-user temp directory
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory)
+
+    if app.config.get("TEMPLATE_WARMUP", False):
+        warm_templates(app)
+
+
+def warm_templates(app) -> int:
+    """Compile every template now instead of on the first request using it"""
+    names = app.jinja_env.list_templates()
+    for name in names:
+        app.jinja_env.get_template(name)
+    return len(names)
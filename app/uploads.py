@@ -0,0 +1,25 @@
+from tempfile import SpooledTemporaryFile
+from typing import IO
+from flask import Request, current_app
+
+
+class SpooledUploadRequest(Request):
+    """Buffers uploaded files in memory up to UPLOAD_SPOOL_MAX_SIZE bytes.
+
+    Larger files spill to a uniquely named temporary file in UPLOAD_FOLDER
+    that is removed as soon as the request's stream is closed.
+    """
+
+    def _get_file_stream(
+        self,
+        total_content_length: int | None,
+        content_type: str | None,
+        filename: str | None = None,
+        content_length: int | None = None,
+    ) -> IO[bytes]:
+        config = current_app.config
+        return SpooledTemporaryFile(
+            max_size=config["UPLOAD_SPOOL_MAX_SIZE"],
+            mode="rb+",
+            dir=config["UPLOAD_FOLDER"],
+        )
@@ -0,0 +1,161 @@
+"""Hash and precompress the CSS and JavaScript the templates load.
+
+Writes content-hashed copies of the checked-in files below, with gzip and
+brotli variants, to static/dist/, plus a manifest.json mapping each bundle's
+name to its current file, which is what `asset_url` in the templates
+resolves. Re-run after changing one of them, and commit the output.
+
+app.css   assets/css/tailwind.css, Tailwind's preflight and utilities
+main.css  assets/css/main.css, the stylesheet of pages extending base.html
+htmx.js   assets/vendor/htmx-1.9.11.min.js
+
+python -m assets.build
+python -m assets.build --check   # exit 1 if static/dist/ is out of date
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SOURCES = ROOT / "assets"
+TEMPLATES = ROOT / "templates"
+DIST = ROOT / "static" / "dist"
+MANIFEST = DIST / "manifest.json"
+
+BUNDLES = {
+    "app.css": SOURCES / "css" / "tailwind.css",
+    "main.css": SOURCES / "css" / "main.css",
+    "htmx.js": SOURCES / "vendor" / "htmx-1.9.11.min.js",
+}
+
+# Classes that no stylesheet defines but that mean something: htmx toggles
+# htmx-indicator, prose is inert without the typography plugin
+KNOWN_CLASSES = {
+    "htmx-indicator",
+    "prose",
+    "prose-green",
+    "prose-orange",
+    "prose-purple",
+}
+
+_CLASS_ATTR = re.compile(r'class="([^"]*)"')
+_JINJA_TAG = re.compile(r"{%.*?%}|{#.*?#}", re.DOTALL)
+# A class built from an expression, like alert-{{ category }}, is not checked
+_JINJA_EXPR = re.compile(r"\S*{{.*?}}\S*", re.DOTALL)
+# Selectors escape characters like the ":" of md:flex or the "." of p-2.5
+_CSS_CLASS = re.compile(r"\.(-?[a-zA-Z_](?:[\w-]|\\.)*)")
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+
+def _templates() -> list[Path]:
+    return sorted(TEMPLATES.rglob("*.html"))
+
+
+def defined_classes(css: str) -> set[str]:
+    return {
+        name.replace("\\", "")
+        for name in _CSS_CLASS.findall(_CSS_COMMENT.sub(" ", css))
+    }
+
+
+def unknown_classes() -> dict[str, set[str]]:
+    """Classes in class attributes that no stylesheet defines, by template"""
+    known = set(KNOWN_CLASSES)
+    for name, path in BUNDLES.items():
+        if name.endswith(".css"):
+            known |= defined_classes(path.read_text())
+    unknown = {}
+    for path in _templates():
+        text = _JINJA_EXPR.sub(" ", _JINJA_TAG.sub(" ", path.read_text()))
+        for attr in _CLASS_ATTR.findall(text):
+            names = set(attr.split()) - known
+            if names:
+                unknown.setdefault(path.name, set()).update(names)
+    return unknown
+
+
+def bundles() -> dict[str, bytes]:
+    return {name: path.read_bytes() for name, path in BUNDLES.items()}
+
+
+def hashed_name(name: str, content: bytes) -> str:
+    stem, ext = name.rsplit(".", 1)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:8]}.{ext}"
+
+
+def compress(content: bytes) -> dict[str, bytes]:
+    """The precompressed variants served to browsers that accept them"""
+    import brotli
+
+    return {
+        # mtime=0 keeps the output reproducible for --check
+        ".gz": gzip.compress(content, compresslevel=9, mtime=0),
+        ".br": brotli.compress(content, quality=11),
+    }
+
+
+def build(check: bool = False) -> bool:
+    """Write static/dist/, or with `check` only compare against it.
+
+    Returns whether static/dist/ was already up to date.
+    """
+    unknown = unknown_classes()
+    if unknown:
+        for template, names in sorted(unknown.items()):
+            print(f"{template}: no CSS for {', '.join(sorted(names))}")
+        sys.exit(1)
+
+    manifest = {}
+    files = {}
+    for name, content in bundles().items():
+        manifest[name] = hashed_name(name, content)
+        files[manifest[name]] = content
+        for suffix, compressed in compress(content).items():
+            files[manifest[name] + suffix] = compressed
+
+    current = json.loads(MANIFEST.read_text()) if MANIFEST.exists() else {}
+    up_to_date = current == manifest and all((DIST / f).exists() for f in files)
+    if check or up_to_date:
+        return up_to_date
+
+    DIST.mkdir(parents=True, exist_ok=True)
+    for path in DIST.iterdir():
+        if path.name not in files and path != MANIFEST:
+            path.unlink()
+    for filename, content in files.items():
+        (DIST / filename).write_bytes(content)
+    MANIFEST.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="fail if static/dist/ is out of date"
+    )
+    args = parser.parse_args()
+
+    up_to_date = build(check=args.check)
+    if args.check and not up_to_date:
+        print("static/dist/ is out of date, run: python -m assets.build")
+        sys.exit(1)
+
+    manifest = json.loads(MANIFEST.read_text())
+    for name, filename in sorted(manifest.items()):
+        sizes = [
+            (DIST / (filename + suffix)).stat().st_size for suffix in ("", ".gz", ".br")
+        ]
+        print(
+            f"{name:10} {filename:22} {sizes[0]:>8,} B  gz {sizes[1]:>7,}  br {sizes[2]:>7,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+/** Used by the standalone Tailwind CLI to regenerate assets/css/tailwind.css */
+module.exports = {
+  content: ["./templates/**/*.html"],
+  // main.css defines its own .container
+  corePlugins: { container: false },
+  theme: { extend: {} },
+  plugins: [],
+};
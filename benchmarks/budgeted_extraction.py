@@ -0,0 +1,46 @@
+"""Full parse vs budget-limited parse of long CVs.
+
+python -m benchmarks.budgeted_extraction --budget 6000
+"""
+
+import argparse
+import io
+import random
+import time
+from benchmarks.pdf_corpus import build_pdf, page_lines
+from utils.document_parser import DocumentParser
+
+
+def _best_ms(parse, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget", type=int, default=6000)
+    args = parser.parse_args()
+
+    print(f"{'pages':>5} {'full parse':>11} {'budgeted':>10} {'chars kept':>11}")
+    for pages in (2, 10, 40):
+        rng = random.Random(pages)
+        pdf = build_pdf([page_lines(p, rng) for p in range(pages)])
+
+        full = _best_ms(
+            lambda: DocumentParser.extract_text_from_stream(io.BytesIO(pdf), "cv.pdf")
+        )
+        budgeted = _best_ms(
+            lambda: DocumentParser.extract_prefix(
+                io.BytesIO(pdf), "cv.pdf", args.budget
+            )
+        )
+        text, _ = DocumentParser.extract_prefix(io.BytesIO(pdf), "cv.pdf", args.budget)
+        print(f"{pages:>5} {full:>9.1f}ms {budgeted:>8.1f}ms {len(text):>11}")
+
+
+if __name__ == "__main__":
+    main()
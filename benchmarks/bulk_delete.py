@@ -0,0 +1,61 @@
+"""Time and peak memory of deleting sessions: ORM cascade vs set-based DELETE.
+
+python -m benchmarks.bulk_delete --messages 12000 --sessions 100
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from benchmarks.common import make_app, seed_sessions
+from app.models import db, Message, Session
+from app.repositories import SessionRepository
+
+
+def _orm_cascade_delete(session_ids: list[int]) -> None:
+    for session_id in session_ids:
+        db.session.delete(db.session.get(Session, session_id))
+    db.session.commit()
+
+
+def _measure(label: str, delete, session_ids: list[int]) -> None:
+    tracemalloc.start()
+    started = time.perf_counter()
+    delete(session_ids)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    remaining = db.session.query(Message).count()
+    print(
+        f"{label:<14} {elapsed * 1000:>9.1f} ms  {peak / 1024 / 1024:>7.2f} MiB peak"
+        f"  ({remaining} messages left)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--messages", type=int, default=12000)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    app = make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{path}")
+
+    try:
+        with app.app_context():
+            print(f"{args.sessions} sessions, {args.messages} messages")
+
+            session_ids = seed_sessions(args.sessions, args.messages // args.sessions)
+            _measure("orm cascade", _orm_cascade_delete, session_ids)
+
+            session_ids = seed_sessions(args.sessions, args.messages // args.sessions)
+            _measure("bulk delete", SessionRepository().delete_many, session_ids)
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Shared helpers for the benchmark scripts.
+
+Benchmarks run against an in-memory SQLite database and a canned AI client so
+they measure our own code paths, not network latency.
+"""
+
+import tempfile
+from contextlib import contextmanager
+from sqlalchemy import event
+from app import create_app
+from app.models import db, Feedback, Message, Session
+from tests.conftest import FakeAIClient
+
+
+class BenchmarkConfig:
+    SECRET_KEY = "benchmark"
+    TESTING = True
+    UPLOAD_FOLDER = tempfile.mkdtemp(prefix="bench-uploads-")
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # The in-memory database lives and dies with the app
+    CREATE_SCHEMA_ON_STARTUP = True
+    OPENROUTER_API_KEY = ""
+    GEMINI_API_KEY = ""
+    # Upload benchmarks time the parse itself, not the hand-off to a job
+    UPLOAD_ASYNC = False
+
+
+def make_app(**overrides):
+    config = type("Config", (BenchmarkConfig,), overrides)
+    app = create_app(config)
+
+    from app import extensions
+
+    extensions.ai_client = FakeAIClient()
+    return app
+
+
+@contextmanager
+def count_queries(app):
+    """Collects every SQL statement executed while the block runs"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def seed_sessions(session_count: int, messages_per_session: int) -> list[int]:
+    """Insert sessions with messages and feedback using bulk INSERTs"""
+    sessions = [
+        Session(job_title=f"Engineer {i}", company_name="Acme")
+        for i in range(session_count)
+    ]
+    db.session.add_all(sessions)
+    db.session.flush()
+
+    content = "A reasonably long interview answer. " * 20
+    db.session.execute(
+        db.insert(Message),
+        [
+            {"session_id": s.id, "role": "user", "content": content}
+            for s in sessions
+            for _ in range(messages_per_session)
+        ],
+    )
+    db.session.execute(
+        db.insert(Feedback),
+        [{"session_id": s.id, "interview_score": 7} for s in sessions],
+    )
+    db.session.commit()
+    session_ids = [s.id for s in sessions]
+    db.session.expunge_all()
+    return session_ids
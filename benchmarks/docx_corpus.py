@@ -0,0 +1,50 @@
+"""Deterministic CV-like DOCX files for the parser benchmarks.
+
+Each role adds a heading, bullet paragraphs and a skills table, and every
+file has a contact header and a footer, so the corpus exercises all the
+parts the streaming extractor reads.
+"""
+
+import io
+import random
+from pathlib import Path
+from benchmarks.pdf_corpus import WORDS
+
+ROLE_COUNTS = (1, 5, 20, 100, 400)
+BULLETS_PER_ROLE = 8
+SKILL_ROWS = 5
+
+
+def build_docx(roles: int, rng: random.Random) -> bytes:
+    from docx import Document
+
+    document = Document()
+    section = document.sections[0]
+    section.header.paragraphs[0].text = "Jane Doe - jane@example.com"
+    section.footer.paragraphs[0].text = "References available on request"
+
+    for role in range(roles):
+        document.add_heading(f"Role {role + 1}", level=2)
+        for _ in range(BULLETS_PER_ROLE):
+            document.add_paragraph(
+                " ".join(rng.choices(WORDS, k=rng.randint(10, 18))),
+                style="List Bullet",
+            )
+        table = document.add_table(rows=SKILL_ROWS, cols=2)
+        for row in table.rows:
+            row.cells[0].text = rng.choice(WORDS)
+            row.cells[1].text = f"{rng.randint(1, 10)} years"
+
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def write_corpus(directory: Path, role_counts=ROLE_COUNTS) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for count in role_counts:
+        path = directory / f"cv-{count:03d}-roles.docx"
+        path.write_bytes(build_docx(count, random.Random(count)))
+        paths.append(path)
+    return paths
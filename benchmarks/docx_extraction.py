@@ -0,0 +1,68 @@
+"""DOCX extraction time and peak memory over the generated corpus.
+
+Compares the previous python-docx path, which built the whole object model
+and read only body paragraphs, with the streaming DocxExtractor.
+
+python -m benchmarks.docx_extraction --repeat 3
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from benchmarks.docx_corpus import write_corpus
+from utils.docx_extractor import DocxExtractor
+
+
+def _legacy(path: Path) -> str:
+    from docx import Document
+
+    return "\n".join(para.text for para in Document(path).paragraphs)
+
+
+def _streaming(path: Path) -> str:
+    return DocxExtractor.extract(str(path))
+
+
+def _measure(extract, path: Path, repeat: int) -> tuple[float, float, int]:
+    """Best time in ms, peak traced memory in MiB and characters extracted"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        extract(path)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    try:
+        text = extract(path)
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+    return min(timings), peak, len(text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = write_corpus(Path(tempfile.mkdtemp(prefix="docx-corpus-")))
+    print(
+        f"{'roles':>5} {'size':>7} | {'python-docx':>11} {'peak':>8} {'chars':>7}"
+        f" | {'streaming':>9} {'peak':>8} {'chars':>7}"
+    )
+    for path in corpus:
+        roles = int(path.stem.split("-")[1])
+        size = path.stat().st_size / 1024
+        legacy = _measure(_legacy, path, args.repeat)
+        streaming = _measure(_streaming, path, args.repeat)
+        print(
+            f"{roles:>5} {size:>5.0f}KB"
+            f" | {legacy[0]:>9.1f}ms {legacy[1]:>6.2f}MB {legacy[2]:>7}"
+            f" | {streaming[0]:>7.1f}ms {streaming[1]:>6.2f}MB {streaming[2]:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Peak memory of the NDJSON export as the database grows.
+
+python -m benchmarks.export_memory --sizes 500 2000 8000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from benchmarks.common import make_app, seed_sessions
+from app.repositories import ExportRepository
+from app.services import ExportService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 8000])
+    parser.add_argument("--messages-per-session", type=int, default=16)
+    parser.add_argument("--gzip", action="store_true")
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    app = make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{path}")
+    seeded = 0
+
+    try:
+        with app.app_context():
+            print(f"{'sessions':>8}  {'bytes out':>12}  {'time':>9}  {'peak':>9}")
+            for size in sorted(args.sizes):
+                seed_sessions(size - seeded, args.messages_per_session)
+                seeded = size
+
+                service = ExportService(ExportRepository())
+                tracemalloc.start()
+                started = time.perf_counter()
+                written = sum(len(c) for c in service.stream_ndjson(compress=args.gzip))
+                elapsed = time.perf_counter() - started
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                print(
+                    f"{size:>8}  {written:>12}  {elapsed * 1000:>7.0f}ms"
+                    f"  {peak / 1024 / 1024:>6.2f}MiB"
+                )
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Upload latency for a CV parsed from scratch vs served by the parse cache.
+
+python -m benchmarks.parse_cache --pages 50
+"""
+
+import argparse
+import io
+import random
+import time
+from benchmarks.common import make_app
+from benchmarks.pdf_corpus import build_pdf, page_lines
+from app.container import get_parse_cache_memory
+
+
+def _upload_ms(client, pdf: bytes) -> float:
+    response = client.post(
+        "/session/create", data={"job_title": "Engineer", "company_name": "Acme"}
+    )
+    session_id = int(response.location.split("/")[-2])
+
+    started = time.perf_counter()
+    response = client.post(
+        f"/session/{session_id}/upload-cv",
+        data={"cv_file": (io.BytesIO(pdf), "cv.pdf")},
+        content_type="multipart/form-data",
+    )
+    elapsed = (time.perf_counter() - started) * 1000
+    assert response.status_code == 302, response.status_code
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(args.pages)
+    pdf = build_pdf([page_lines(p, rng) for p in range(args.pages)])
+    app = make_app()
+    client = app.test_client()
+    memory = get_parse_cache_memory(app)
+
+    cold = _upload_ms(client, pdf)
+    memory_hit = _upload_ms(client, pdf)
+    memory.clear()  # as seen by another worker: only the DB tier
+    db_hit = _upload_ms(client, pdf)
+
+    print(f"{args.pages}-page PDF ({len(pdf) / 1024:.0f} KiB)")
+    print(f"  cold parse     {cold:8.1f}ms")
+    print(f"  memory tier    {memory_hit:8.1f}ms")
+    print(f"  database tier  {db_hit:8.1f}ms")
+    print(f"  stats          {memory.stats()}")
+
+
+if __name__ == "__main__":
+    main()
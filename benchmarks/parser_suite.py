@@ -0,0 +1,312 @@
+"""Document parsing benchmark and regression check.
+
+Generates a reproducible corpus (PDFs of several sizes in one- and
+two-column layouts, DOCX files with tables, large and non-UTF-8 TXT files)
+and times DocumentParser.extract_text on each file. Every file is parsed in
+a fresh process so its peak RSS is its own. Results are written as JSON;
+given a baseline, timings are scaled by a CPU calibration loop so runs on
+different machines compare, and the exit status is 1 on a regression.
+
+python -m benchmarks.parser_suite --output results.json
+python -m benchmarks.parser_suite --baseline benchmarks/baselines/parser_suite.json
+python -m benchmarks.parser_suite --write-baseline benchmarks/baselines/parser_suite.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from benchmarks.docx_corpus import build_docx
+from benchmarks.pdf_corpus import WORDS, build_pdf, page_lines
+
+PDF_PAGES = (1, 5, 20, 50)
+TWO_COLUMN_PDF_PAGES = (5, 20)
+DOCX_ROLES = (5, 100, 400)
+TXT_SIZES = {"10KB": 10_000, "1MB": 1_000_000}
+CP1252_TXT_SIZES = {"100KB": 100_000}
+
+
+@dataclass
+class Case:
+    name: str
+    format: str
+    bucket: str
+    path: str
+
+
+@dataclass
+class Result:
+    name: str
+    format: str
+    bucket: str
+    input_bytes: int
+    wall_ms: float
+    median_ms: float
+    peak_rss_mb: float
+    rss_growth_mb: float
+    output_chars: int
+
+
+def _txt(size: int, rng: random.Random, encoding: str) -> bytes:
+    words = WORDS + (
+        ["café", "naïve", "résumé", "“quoted”"] if encoding != "utf-8" else []
+    )
+    lines = []
+    length = 0
+    while length < size:
+        line = " ".join(rng.choices(words, k=rng.randint(8, 16)))
+        lines.append(line)
+        length += len(line) + 1
+    return "\n".join(lines).encode(encoding)
+
+
+def write_corpus(directory: Path) -> list[Case]:
+    directory.mkdir(parents=True, exist_ok=True)
+    cases = []
+
+    def add(name, fmt, bucket, data: bytes):
+        path = directory / name
+        path.write_bytes(data)
+        cases.append(Case(name, fmt, bucket, str(path)))
+
+    for pages in PDF_PAGES:
+        rng = random.Random(pages)
+        add(
+            f"single-column-{pages:02d}p.pdf",
+            "pdf",
+            f"{pages} pages",
+            build_pdf([page_lines(p, rng) for p in range(pages)]),
+        )
+    for pages in TWO_COLUMN_PDF_PAGES:
+        rng = random.Random(pages)
+        add(
+            f"two-column-{pages:02d}p.pdf",
+            "pdf",
+            f"{pages} pages, 2 columns",
+            build_pdf([page_lines(p, rng) for p in range(pages)], columns=2),
+        )
+    for roles in DOCX_ROLES:
+        add(
+            f"tables-{roles:03d}-roles.docx",
+            "docx",
+            f"{roles} roles",
+            build_docx(roles, random.Random(roles)),
+        )
+    for label, size in TXT_SIZES.items():
+        add(f"utf8-{label}.txt", "txt", label, _txt(size, random.Random(size), "utf-8"))
+    for label, size in CP1252_TXT_SIZES.items():
+        add(
+            f"cp1252-{label}.txt",
+            "txt",
+            f"{label} cp1252",
+            _txt(size, random.Random(size), "cp1252"),
+        )
+    return cases
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss survives exec on Linux, so a spawned worker would report the
+    # parent's peak; VmHWM is reset for the new program
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def _run_case(case: Case, repeat: int) -> Result:
+    """Runs in a fresh worker process"""
+    from utils.document_parser import DocumentParser
+
+    before = _peak_rss_mb()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = DocumentParser.extract_text(case.path)
+        timings.append((time.perf_counter() - started) * 1000)
+    peak = _peak_rss_mb()
+
+    return Result(
+        name=case.name,
+        format=case.format,
+        bucket=case.bucket,
+        input_bytes=Path(case.path).stat().st_size,
+        wall_ms=round(min(timings), 2),
+        median_ms=round(statistics.median(timings), 2),
+        peak_rss_mb=round(peak, 1),
+        rss_growth_mb=round(peak - before, 1),
+        output_chars=len(text),
+    )
+
+
+def calibrate_ms() -> float:
+    """Best time of a fixed pure-Python workload, to scale timings by"""
+    timings = []
+    for _ in range(5):
+        started = time.perf_counter()
+        counts = {}
+        for i in range(300_000):
+            key = str(i % 1000)
+            counts[key] = counts.get(key, 0) + i
+        timings.append((time.perf_counter() - started) * 1000)
+    return round(min(timings), 2)
+
+
+def run(repeat: int) -> dict:
+    from utils.document_parser import DocumentParser
+
+    cases = write_corpus(Path(tempfile.mkdtemp(prefix="parser-suite-")))
+    calibration = calibrate_ms()
+    results = []
+    for case in cases:
+        # One process per case: a process's peak RSS never goes down
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+            results.append(pool.submit(_run_case, case, repeat).result())
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "parser_version": DocumentParser.VERSION,
+            "repeat": repeat,
+            # Before and after, so a noisy neighbour at either end matters less
+            "calibration_ms": min(calibration, calibrate_ms()),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def compare(
+    current: dict,
+    baseline: dict,
+    time_tolerance: float,
+    rss_tolerance: float,
+    min_ms: float,
+) -> list[str]:
+    """Human-readable regressions of `current` against `baseline`"""
+    scale = current["meta"]["calibration_ms"] / baseline["meta"]["calibration_ms"]
+    same_parser = (
+        current["meta"]["parser_version"] == baseline["meta"]["parser_version"]
+    )
+    previous = {result["name"]: result for result in baseline["results"]}
+
+    regressions = []
+    for result in current["results"]:
+        old = previous.get(result["name"])
+        if not old:
+            continue
+        name = result["name"]
+
+        expected_ms = old["wall_ms"] * scale
+        if (
+            result["wall_ms"] > expected_ms * (1 + time_tolerance)
+            and result["wall_ms"] - expected_ms > min_ms
+        ):
+            regressions.append(
+                f"{name}: {result['wall_ms']:.1f}ms, baseline {expected_ms:.1f}ms "
+                "after calibration"
+            )
+
+        growth_limit = max(
+            old["rss_growth_mb"] * (1 + rss_tolerance), old["rss_growth_mb"] + 5
+        )
+        if result["rss_growth_mb"] > growth_limit:
+            regressions.append(
+                f"{name}: parsing grew RSS by {result['rss_growth_mb']:.1f}MB, "
+                f"baseline {old['rss_growth_mb']:.1f}MB"
+            )
+
+        # Output changes are expected when the parser version is bumped
+        if same_parser and result["output_chars"] != old["output_chars"]:
+            regressions.append(
+                f"{name}: extracted {result['output_chars']} characters, "
+                f"baseline {old['output_chars']} with the same parser version"
+            )
+    return regressions
+
+
+def _print_table(report: dict) -> None:
+    print(
+        f"{'file':<28} {'bucket':<20} {'best':>9} {'median':>9} "
+        f"{'peak RSS':>9} {'growth':>8} {'chars':>8}"
+    )
+    for r in report["results"]:
+        print(
+            f"{r['name']:<28} {r['bucket']:<20} {r['wall_ms']:>7.1f}ms "
+            f"{r['median_ms']:>7.1f}ms {r['peak_rss_mb']:>7.1f}MB "
+            f"{r['rss_growth_mb']:>6.1f}MB {r['output_chars']:>8}"
+        )
+    print(f"calibration loop: {report['meta']['calibration_ms']}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare against this JSON")
+    parser.add_argument(
+        "--write-baseline", type=Path, help="save results as the baseline"
+    )
+    parser.add_argument(
+        "--time-tolerance",
+        type=float,
+        default=0.5,
+        help="allowed slowdown after calibration (0.5 = 50%%)",
+    )
+    parser.add_argument(
+        "--rss-tolerance",
+        type=float,
+        default=0.5,
+        help="allowed growth of per-file RSS increase (0.5 = 50%%)",
+    )
+    parser.add_argument(
+        "--min-ms",
+        type=float,
+        default=5.0,
+        help="ignore slowdowns smaller than this, they are noise",
+    )
+    args = parser.parse_args()
+
+    report = run(args.repeat)
+    _print_table(report)
+
+    for path in (args.output, args.write_baseline):
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.baseline:
+        regressions = compare(
+            report,
+            json.loads(args.baseline.read_text()),
+            args.time_tolerance,
+            args.rss_tolerance,
+            args.min_ms,
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
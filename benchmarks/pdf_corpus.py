@@ -0,0 +1,94 @@
+"""Deterministic CV-like PDFs for the parser benchmarks.
+
+Writes minimal PDF 1.4 files by hand (Helvetica text streams) so the corpus
+needs no PDF-writing dependency and is byte-for-byte reproducible.
+"""
+
+import random
+from pathlib import Path
+
+PAGE_COUNTS = (1, 2, 5, 10, 20, 50)
+LINES_PER_PAGE = 45
+
+WORDS = (
+    "designed built led migrated scaled reduced improved python flask sql "
+    "postgres redis kafka kubernetes docker terraform aws latency throughput "
+    "caching replication incident mentoring roadmap stakeholders deadline "
+    "testing deployment monitoring security api service team platform"
+).split()
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def page_lines(page: int, rng: random.Random) -> list[str]:
+    lines = [f"Experience - page {page + 1}"]
+    for _ in range(LINES_PER_PAGE - 1):
+        lines.append(" ".join(rng.choices(WORDS, k=rng.randint(8, 14))))
+    return lines
+
+
+def _text_stream(lines: list[str], columns: int) -> bytes:
+    if columns == 1:
+        rows = "".join(f"({_escape(line)}) Tj T* " for line in lines)
+        return f"BT /F1 10 Tf 12 TL 50 790 Td {rows}ET".encode("latin-1")
+
+    # Side-by-side columns, as in sidebar CV templates; each is its own
+    # text object so extractors have to reassemble the reading order
+    per_column = -(-len(lines) // columns)
+    width = 495 // columns
+    blocks = []
+    for column in range(columns):
+        chunk = lines[column * per_column : (column + 1) * per_column]
+        rows = "".join(f"({_escape(line[: width // 5])}) Tj T* " for line in chunk)
+        blocks.append(f"BT /F1 9 Tf 11 TL {50 + column * width} 790 Td {rows}ET")
+    return " ".join(blocks).encode("latin-1")
+
+
+def build_pdf(pages: list[list[str]], columns: int = 1) -> bytes:
+    """A PDF with one page per entry, each line drawn as a text row, split
+    over `columns` side-by-side columns"""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once page ids are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_ids = []
+    for lines in pages:
+        stream = _text_stream(lines, columns)
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)
+        )
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{i} 0 R" for i in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(out)
+
+
+def write_corpus(directory: Path, page_counts=PAGE_COUNTS) -> list[Path]:
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for count in page_counts:
+        rng = random.Random(count)
+        path = directory / f"cv-{count:02d}-pages.pdf"
+        path.write_bytes(build_pdf([page_lines(p, rng) for p in range(count)]))
+        paths.append(path)
+    return paths
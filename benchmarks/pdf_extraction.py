@@ -0,0 +1,73 @@
+"""PDF extraction time over the generated corpus (1-50 pages).
+
+Compares the previous pdfplumber loop, which ran layout analysis twice per
+page, with PdfExtractor serially and with its process pool.
+
+python -m benchmarks.pdf_extraction --repeat 3
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from benchmarks.pdf_corpus import write_corpus
+from utils.pdf_extractor import PdfExtractor
+
+
+def _legacy(path: Path) -> str:
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        parts = [page.extract_text() for page in pdf.pages if page.extract_text()]
+    return "\n".join(parts)
+
+
+def _serial(path: Path) -> str:
+    threshold = PdfExtractor.PARALLEL_MIN_PAGES
+    PdfExtractor.PARALLEL_MIN_PAGES = float("inf")
+    try:
+        return PdfExtractor.extract(str(path))
+    finally:
+        PdfExtractor.PARALLEL_MIN_PAGES = threshold
+
+
+def _pooled(path: Path) -> str:
+    threshold, workers = PdfExtractor.PARALLEL_MIN_PAGES, PdfExtractor.MAX_WORKERS
+    PdfExtractor.PARALLEL_MIN_PAGES, PdfExtractor.MAX_WORKERS = 1, max(workers, 2)
+    try:
+        return PdfExtractor.extract(str(path))
+    finally:
+        PdfExtractor.PARALLEL_MIN_PAGES, PdfExtractor.MAX_WORKERS = threshold, workers
+
+
+def _best_ms(extract, path: Path, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        extract(path)
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = write_corpus(Path(tempfile.mkdtemp(prefix="pdf-corpus-")))
+    # Start the pool's workers outside the measurements, as a web worker would
+    _pooled(corpus[0])
+
+    print(f"{os.cpu_count()} CPU(s), pool of {max(PdfExtractor.MAX_WORKERS, 2)}")
+    print(f"{'pages':>5} {'pdfplumber x2':>14} {'pypdf serial':>13} {'pypdf pool':>11}")
+    for path in corpus:
+        pages = int(path.stem.split("-")[1])
+        legacy = _best_ms(_legacy, path, args.repeat)
+        serial = _best_ms(_serial, path, args.repeat)
+        pooled = _best_ms(_pooled, path, args.repeat)
+        print(f"{pages:>5} {legacy:>12.1f}ms {serial:>11.1f}ms {pooled:>9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
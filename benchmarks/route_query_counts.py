@@ -0,0 +1,76 @@
+"""Per-route SQL query counts with and without the request-scoped cache.
+
+python -m benchmarks.route_query_counts
+"""
+
+import io
+from benchmarks.common import count_queries, make_app
+
+CV_TEXT = b"Backend engineer with eight years of Python, SQL and Flask. " * 10
+JOB_DESCRIPTION = "We are hiring a backend engineer to build Flask services. " * 5
+
+
+def _run_interview(app) -> list[tuple[str, int]]:
+    client = app.test_client()
+    results = []
+
+    def measure(label, request):
+        with count_queries(app) as statements:
+            response = request()
+        assert response.status_code < 400, (label, response.status_code)
+        results.append((label, len(statements)))
+        return response
+
+    response = measure(
+        "POST /session/create",
+        lambda: client.post(
+            "/session/create", data={"job_title": "Engineer", "company_name": "Acme"}
+        ),
+    )
+    session_id = int(response.location.rstrip("/").split("/")[-2])
+    base = f"/session/{session_id}"
+
+    measure(
+        "POST /session/<id>/upload-cv",
+        lambda: client.post(
+            f"{base}/upload-cv",
+            data={"cv_file": (io.BytesIO(CV_TEXT), "cv.txt")},
+            content_type="multipart/form-data",
+        ),
+    )
+    measure(
+        "POST /session/<id>/upload-job",
+        lambda: client.post(
+            f"{base}/upload-job", data={"job_description": JOB_DESCRIPTION}
+        ),
+    )
+    measure("GET /session/<id>/upload", lambda: client.get(f"{base}/upload"))
+    measure("GET /session/<id>/interview", lambda: client.get(f"{base}/interview"))
+    measure(
+        "GET /session/<id>/interview (started)",
+        lambda: client.get(f"{base}/interview"),
+    )
+    for _ in range(7):
+        client.post(f"{base}/message", data={"answer": "An answer"})
+    measure(
+        "POST /session/<id>/message (last)",
+        lambda: client.post(f"{base}/message", data={"answer": "Final answer"}),
+    )
+    measure("POST /session/<id>/complete", lambda: client.post(f"{base}/complete"))
+    measure("GET /session/<id>/feedback", lambda: client.get(f"{base}/feedback"))
+    measure("GET /dashboard", lambda: client.get("/dashboard"))
+    return results
+
+
+def main():
+    uncached = _run_interview(make_app(REQUEST_CACHE_ENABLED=False))
+    cached = _run_interview(make_app(REQUEST_CACHE_ENABLED=True))
+
+    width = max(len(label) for label, _ in cached)
+    print(f"{'route':<{width}}  {'no cache':>8}  {'cached':>6}  {'saved':>5}")
+    for (label, before), (_, after) in zip(uncached, cached):
+        print(f"{label:<{width}}  {before:>8}  {after:>6}  {before - after:>5}")
+
+
+if __name__ == "__main__":
+    main()
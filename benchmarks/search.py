@@ -0,0 +1,121 @@
+"""Full-text search latency over a few hundred thousand messages.
+
+Compares the FTS5 index against the LIKE '%...%' scan it replaces.
+
+    python -m benchmarks.search --sessions 20000 --messages-per-session 15
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from sqlalchemy import bindparam, text
+from benchmarks.common import make_app
+from app.models import db, Message, Session, User
+from app.repositories import SearchRepository
+
+TOPICS = (
+    "python flask sql postgres redis kafka kubernetes docker terraform aws "
+    "latency throughput caching sharding replication migration incident "
+    "leadership mentoring roadmap stakeholder deadline budget hiring review "
+    "testing deployment monitoring alerting security encryption compliance "
+    "frontend backend api graphql rest websocket queue worker scheduler"
+).split()
+QUERIES = ["caching", "kafka replication", "stakeholder deadline", "kube"]
+
+
+def _vocabulary(rng: random.Random) -> tuple[list[str], list[float]]:
+    """Filler words with a Zipf-like distribution plus rarer topic words"""
+    filler = [
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 9)))
+        for _ in range(5000)
+    ]
+    words = filler + TOPICS
+    weights = [1 / rank for rank in range(1, len(filler) + 1)] + [0.002] * len(TOPICS)
+    return words, weights
+
+
+def _seed(session_count: int, messages_per_session: int) -> None:
+    rng = random.Random(42)
+    words, weights = _vocabulary(rng)
+    sessions = [
+        {"job_title": f"Engineer {i}", "company_name": f"Company {i % 500}"}
+        for i in range(session_count)
+    ]
+    db.session.execute(db.insert(Session), sessions)
+
+    batch = []
+    for session_id in range(1, session_count + 1):
+        for _ in range(messages_per_session):
+            content = " ".join(rng.choices(words, weights, k=40))
+            batch.append({"session_id": session_id, "role": "user", "content": content})
+        if len(batch) >= 20000:
+            db.session.execute(db.insert(Message), batch)
+            batch = []
+    if batch:
+        db.session.execute(db.insert(Message), batch)
+    db.session.commit()
+
+
+def _time(fn, repeat: int = 5) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=20000)
+    parser.add_argument("--messages-per-session", type=int, default=15)
+    parser.add_argument(
+        "--owned", type=int, default=50, help="Sessions the searching user owns"
+    )
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    app = make_app(SQLALCHEMY_DATABASE_URI=f"sqlite:///{path}")
+
+    try:
+        with app.app_context():
+            _seed(args.sessions, args.messages_per_session)
+            started = time.perf_counter()
+            SearchRepository().rebuild()
+            print(
+                f"{args.sessions * args.messages_per_session} messages, "
+                f"index rebuilt in {time.perf_counter() - started:.1f}s"
+            )
+
+            repo = SearchRepository()
+            owned = random.Random(7).sample(range(1, args.sessions + 1), args.owned)
+            user = User()
+            db.session.add(user)
+            db.session.flush()
+            db.session.execute(
+                db.update(Session).where(Session.id.in_(owned)).values(user_id=user.id)
+            )
+            db.session.commit()
+            like_sql = text(
+                "SELECT id FROM messages "
+                "WHERE session_id IN :owned AND content LIKE :pattern"
+            ).bindparams(bindparam("owned", expanding=True))
+
+            print(f"{'query':<22} {'fts5':>10} {'like scan':>10}  matches")
+            for query in QUERIES:
+                results, total = repo.search(query, user.id, limit=10, offset=0)
+                fts = _time(lambda: repo.search(query, user.id, limit=10, offset=0))
+                like = _time(
+                    lambda: db.session.execute(
+                        like_sql,
+                        {"owned": owned, "pattern": f"%{query.split()[0]}%"},
+                    ).all()
+                )
+                print(f"{query:<22} {fts:>8.1f}ms {like:>8.1f}ms  {total}")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Worker boot time: imports, create_app() and the first requests served.
+
+Every run is a fresh interpreter, as a new gunicorn worker would be. The
+first requests are the home page and an interview page, the template-heavy
+one. They are timed without the Jinja bytecode cache, with an empty one
+(a deploy) and with a populated one (a recycled worker). The import profile
+comes from `python -X importtime` and lists the packages that take longest
+to import.
+
+python -m benchmarks.startup --runs 5 --top 15
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runs in the child interpreter; prints one JSON line with its timings
+_BOOT = """
+import json, time
+started = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+client = app.test_client()
+response = client.get("/")
+served = time.perf_counter()
+assert response.status_code == 200, response.status_code
+
+from app.models import db, Message, Session
+created_session = client.post(
+    "/session/create", data={"job_title": "Engineer", "company_name": "Acme"}
+)
+session_id = int(created_session.location.split("/")[-2])
+with app.app_context():
+    session = db.session.get(Session, session_id)
+    session.has_cv = session.has_job_description = True
+    db.session.add(Message(session_id=session_id, role="assistant", content="Hi?"))
+    db.session.commit()
+before_interview = time.perf_counter()
+response = client.get(f"/session/{session_id}/interview")
+interviewed = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "first_request_ms": (served - created) * 1000,
+    "first_interview_ms": (interviewed - before_interview) * 1000,
+    "total_ms": (served - started) * 1000,
+}))
+"""
+
+METRICS = (
+    "import_ms",
+    "create_app_ms",
+    "first_request_ms",
+    "first_interview_ms",
+    "total_ms",
+)
+
+
+def _boot(env: dict, importtime: bool) -> tuple[dict, str]:
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    result = subprocess.run(
+        command + ["-c", _BOOT],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def _slowest_imports(importtime_log: str, top: int) -> list[tuple[str, float]]:
+    """Import time per top-level package, slowest first. Each module's own
+    (self) time is charged to its package, so the figures add up."""
+    totals = defaultdict(float)
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        own, _, name = line.removeprefix("import time:").split("|")
+        totals[name.strip().split(".")[0]] += int(own) / 1000
+    return sorted(totals.items(), key=lambda item: -item[1])[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    database = Path(tempfile.mkdtemp(prefix="startup-")) / "app.db"
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{database}",
+        # Configure both providers so their construction is measured too
+        "GEMINI_API_KEY": "benchmark",
+        "OPENROUTER_API_KEY": "benchmark",
+        "UPLOAD_FOLDER": str(database.parent / "uploads"),
+    }
+    subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "wsgi", "init-db"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        check=True,
+    )
+
+    warm_cache = tempfile.mkdtemp(prefix="startup-jinja-")
+    _boot({**env, "TEMPLATE_CACHE_DIR": warm_cache}, importtime=False)
+    modes = {
+        "no cache": lambda: {"TEMPLATE_BYTECODE_CACHE": "false"},
+        "cold cache": lambda: {"TEMPLATE_CACHE_DIR": tempfile.mkdtemp()},
+        "warm cache": lambda: {"TEMPLATE_CACHE_DIR": warm_cache},
+    }
+    results = {
+        mode: [
+            _boot({**env, **settings()}, importtime=False)[0] for _ in range(args.runs)
+        ]
+        for mode, settings in modes.items()
+    }
+    print(f"median of {args.runs} fresh interpreters")
+    print(f"  {'':<19}" + "".join(f"{mode:>12}" for mode in modes))
+    for key in METRICS:
+        medians = [
+            statistics.median(run[key] for run in runs) for runs in results.values()
+        ]
+        print(f"  {key:<19}" + "".join(f"{ms:>10.1f}ms" for ms in medians))
+
+    _, log = _boot(env, importtime=True)
+    print("\nslowest packages to import (self time, one run)")
+    for name, ms in _slowest_imports(log, args.top):
+        print(f"  {name:<24} {ms:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
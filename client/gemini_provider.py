@@ -1,4 +1,3 @@
-from google import genai
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -12,8 +11,19 @@ class GeminiProvider:
         if not api_key:
             raise ValueError("API key is required")
 
-        self.client = genai.Client(api_key=api_key)
+        self.api_key = api_key
         self.model_name = model_name
+        self._client = None
+
+    @property
+    def client(self):
+        # google-genai takes most of a second to import, so workers only pay
+        # for it when they first need a question
+        if self._client is None:
+            from google import genai
+
+            self._client = genai.Client(api_key=self.api_key)
+        return self._client
 
     @retry(
         stop=stop_after_attempt(3),
@@ -1,13 +1,20 @@
-import requests
 import json
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_exponential,
-    retry_if_exception_type,
+    retry_if_exception,
 )
 
 
+def _is_transient(error: BaseException) -> bool:
+    # requests is imported on first use, so the check cannot name its
+    # exception class at import time
+    import requests
+
+    return isinstance(error, (requests.RequestException, ConnectionError, TimeoutError))
+
+
 class OpenRouterProvider:
     def __init__(self, api_key: str, model_name: str = "openai/gpt-oss-20b:free"):
         if not api_key:
@@ -23,9 +30,7 @@ class OpenRouterProvider:
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(
-            (requests.RequestException, ConnectionError, TimeoutError)
-        ),
+        retry=retry_if_exception(_is_transient),
     )
     def generate_text(self, prompt: str) -> str:
         payload = {
@@ -34,6 +39,8 @@ class OpenRouterProvider:
             "extra_body": {"reasoning": {"enabled": True}},
         }
 
+        import requests
+
         response = requests.post(
             self.endpoint, headers=self._headers, data=json.dumps(payload)
         )
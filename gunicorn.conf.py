@@ -0,0 +1,41 @@
+"""Gunicorn settings.
+
+The app is loaded once in the master (preload_app) and workers are forked
+from it, sharing its imported modules and compiled templates copy-on-write.
+The hooks below hand connection-owning state to app.lifecycle so nothing
+with a socket, thread or lock crosses the fork.
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", 4))
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+# Recycle workers now and then; with preload a new one forks in milliseconds
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", 1000))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", 100))
+
+
+def _app(server):
+    return server.app.wsgi()
+
+
+def when_ready(server):
+    if preload_app:
+        from app.lifecycle import prepare_for_fork
+
+        prepare_for_fork(_app(server))
+
+
+def pre_fork(server, worker):
+    if preload_app:
+        from app.lifecycle import before_fork
+
+        before_fork(_app(server))
+
+
+def post_fork(server, worker):
+    if preload_app:
+        from app.lifecycle import after_fork
+
+        after_fork(_app(server))
@@ -0,0 +1,90 @@
+from contextlib import contextmanager
+import pytest
+from flask import template_rendered
+from app import create_app
+from app.config import Config
+from app.query_budget import track_queries
+
+
+class AppTestConfig(Config):
+    SECRET_KEY = "test"
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    CREATE_SCHEMA_ON_STARTUP = True
+    OPENROUTER_API_KEY = ""
+    GEMINI_API_KEY = ""
+
+
+class FakeAIClient:
+    """Canned questions and feedback, for tests and benchmarks that run
+    whole interviews without an AI provider"""
+
+    def generate_first_question(self, **kwargs) -> str:
+        return "Tell me about yourself."
+
+    def generate_followup_question(self, **kwargs) -> str:
+        return "What was the hardest bug you fixed?"
+
+    def generate_feedback(self, **kwargs) -> dict:
+        return {
+            "score": 7,
+            "strengths": "Clear answers",
+            "weaknesses": "Little detail",
+            "cv_improvements": "Quantify impact",
+        }
+
+
+@pytest.fixture
+def make_app(tmp_path):
+    """Build an app on an in-memory database, uploading into `tmp_path`.
+
+    Keyword arguments override the test config, e.g.
+    make_app(RENDER_CACHE_SHARED=True).
+    """
+
+    def make(**config):
+        return create_app(
+            type(
+                "Config",
+                (AppTestConfig,),
+                {"UPLOAD_FOLDER": str(tmp_path), **config},
+            )
+        )
+
+    return make
+
+
+@pytest.fixture
+def renders(app):
+    """Names of the templates `app` renders while the test runs"""
+    rendered = []
+
+    def record(sender, template, context, **extra):
+        rendered.append(template.name)
+
+    template_rendered.connect(record, app)
+    yield rendered
+    template_rendered.disconnect(record, app)
+
+
+@pytest.fixture
+def assert_query_budget():
+    """Fail when a block runs more SQL statements than allowed, or repeats one.
+
+    with assert_query_budget(app, 5):
+        client.get("/dashboard")
+    """
+
+    @contextmanager
+    def check(app, max_queries: int, max_repeats: int | None = None):
+        with track_queries(app) as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"{stats.count} queries, over the budget of {max_queries}:\n"
+            + "\n".join(stats.statements)
+        )
+        if max_repeats is not None:
+            repeated = stats.repeated(max_repeats + 1)
+            assert not repeated, f"statements repeated (possible N+1): {repeated}"
+
+    return check
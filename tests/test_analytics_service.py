@@ -0,0 +1,71 @@
+import pytest
+from app.models import UserProgress
+from app.services.analytics_service import AnalyticsService
+
+
+@pytest.fixture
+def mock_analytics_repo():
+    class MockAnalyticsRepository:
+        def __init__(self):
+            self.progress = {1: [UserProgress(user_id=1, job_title="Engineer")]}
+            self.rebuilds = 0
+
+        def get_for_user(self, user_id):
+            return self.progress.get(user_id, [])
+
+        def rebuild(self):
+            self.rebuilds += 1
+            return len(self.progress)
+
+    return MockAnalyticsRepository()
+
+
+@pytest.fixture
+def analytics_service(mock_analytics_repo):
+    return AnalyticsService(mock_analytics_repo)
+
+
+class TestAnalyticsService:
+    def test_get_progress_for_user(self, analytics_service):
+        progress = analytics_service.get_progress(1)
+        assert [p.job_title for p in progress] == ["Engineer"]
+
+    def test_get_progress_without_user(self, analytics_service):
+        assert analytics_service.get_progress(None) == []
+
+    def test_rebuild(self, analytics_service, mock_analytics_repo):
+        assert analytics_service.rebuild() == 1
+        assert mock_analytics_repo.rebuilds == 1
+
+
+class TestUserProgressRecord:
+    def test_record_updates_aggregates(self):
+        progress = UserProgress(user_id=1, job_title="Engineer")
+
+        for score in (4, 8, 6):
+            progress.record(score)
+
+        assert progress.completed_count == 3
+        assert progress.scored_count == 3
+        assert progress.mean_score == pytest.approx(6.0)
+        assert progress.best_score == 8
+        assert progress.recent_scores == [4, 8, 6]
+
+    def test_record_without_score_only_counts(self):
+        progress = UserProgress(user_id=1, job_title="Engineer")
+
+        progress.record(None)
+
+        assert progress.completed_count == 1
+        assert progress.scored_count == 0
+        assert progress.mean_score is None
+        assert progress.recent_scores == []
+
+    def test_recent_scores_are_bounded(self):
+        progress = UserProgress(user_id=1, job_title="Engineer")
+
+        for score in range(UserProgress.RECENT_LIMIT + 5):
+            progress.record(score)
+
+        assert len(progress.recent_scores) == UserProgress.RECENT_LIMIT
+        assert progress.recent_scores[-1] == UserProgress.RECENT_LIMIT + 4
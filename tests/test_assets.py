@@ -0,0 +1,51 @@
+import gzip
+import pytest
+from app.routes.asset_routes import asset_url
+from assets import build
+
+
+@pytest.fixture
+def client(make_app):
+    return make_app().test_client()
+
+
+def _htmx_url(client):
+    with client.application.test_request_context():
+        return asset_url("htmx.js")
+
+
+def test_pages_load_hashed_assets(client):
+    page = client.get("/").get_data(as_text=True)
+
+    assert "cdn.tailwindcss.com" not in page
+    assert "/assets/app." in page
+
+
+@pytest.mark.parametrize(
+    "accept, encoding",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("", None),
+    ],
+)
+def test_serves_the_best_precompressed_variant(client, accept, encoding):
+    response = client.get(_htmx_url(client), headers={"Accept-Encoding": accept})
+
+    assert response.status_code == 200
+    assert response.headers.get("Content-Encoding") == encoding
+    assert response.mimetype == "text/javascript"
+    assert "immutable" in response.headers["Cache-Control"]
+    assert "Accept-Encoding" in response.headers["Vary"]
+    if encoding == "gzip":
+        assert b"htmx" in gzip.decompress(response.data)
+
+
+def test_only_built_bundles_are_served(client):
+    assert client.get("/assets/manifest.json").status_code == 404
+    assert client.get("/assets/app.css").status_code == 404
+
+
+def test_templates_only_use_styled_classes():
+    assert build.unknown_classes() == {}
@@ -0,0 +1,57 @@
+from utils.cv_structure import CvStructurer
+
+CV = """Jane Doe
+jane@example.com
+PROFESSIONAL EXPERIENCE
+Backend Engineer, Acme
+Built payment APIs in Python and Postgres
+Education:
+BSc Computer Science
+Technical Skills
+Python, SQL, Kubernetes
+Hobbies
+Chess"""
+
+
+def test_structure_splits_on_known_headings():
+    sections = CvStructurer.structure(CV)
+
+    assert [(s["kind"], s["title"]) for s in sections] == [
+        ("header", ""),
+        ("experience", "PROFESSIONAL EXPERIENCE"),
+        ("education", "Education:"),
+        ("skills", "Technical Skills"),
+    ]
+    assert sections[0]["text"] == "Jane Doe\njane@example.com"
+    # Unknown headings stay part of the section they appear in
+    assert sections[3]["text"] == "Python, SQL, Kubernetes\nHobbies\nChess"
+
+
+def test_short_cv_is_used_as_is():
+    assert CvStructurer.prompt_text(CV, None, "anything", 2000) == CV
+
+
+def test_prompt_text_prefers_sections_matching_the_job():
+    sections = [
+        {"kind": "header", "title": "", "text": "Jane Doe"},
+        {"kind": "education", "title": "Education", "text": "history degree " * 40},
+        {"kind": "experience", "title": "Experience", "text": "kubernetes terraform " * 40},
+        {"kind": "skills", "title": "Skills", "text": "kubernetes aws"},
+    ]
+    cv_text = "\n".join(f"{s['title']}\n{s['text']}" for s in sections)
+
+    text = CvStructurer.prompt_text(cv_text, sections, "Kubernetes and AWS engineer", 500)
+
+    assert len(text) <= 500
+    assert text.startswith("Jane Doe\n\nExperience\nkubernetes")
+    assert text.endswith("Skills\nkubernetes aws")
+    assert "history" not in text
+
+
+def test_prompt_text_structures_older_documents():
+    cv_text = "Jane Doe\nSkills\n" + "python " * 100 + "\nEducation\n" + "degree " * 100
+
+    text = CvStructurer.prompt_text(cv_text, None, "python developer", 400)
+
+    assert len(text) <= 400
+    assert "Skills\npython" in text
@@ -1,3 +1,4 @@
+import io
 from app.exceptions import DocumentParsingError
 from unittest.mock import patch, MagicMock
 import pytest
@@ -39,29 +40,38 @@ def test_extract_text_txt_empty(tmp_path):
         DocumentParser.extract_text(str(file_path))
 
 
-@patch("docx.Document")
-def test_extract_text_docx_success(mock_docx_class, tmp_path):
+def test_extract_text_docx_success(tmp_path):
+    from docx import Document
+
     file_path = tmp_path / "file.docx"
-    file_path.touch()
-    mock_doc = MagicMock()
-    mock_doc.paragraphs = [MagicMock(text="Paragraph 1"), MagicMock(text="Paragraph 2")]
-    mock_docx_class.return_value = mock_doc
-    
+    document = Document()
+    document.add_paragraph("Paragraph 1")
+    document.add_table(rows=1, cols=1).cell(0, 0).text = "Paragraph 2"
+    document.save(file_path)
+
     result = DocumentParser.extract_text(str(file_path))
     assert "Paragraph 1" in result
     assert "Paragraph 2" in result
 
-@patch("docx.Document")
-def test_extract_text_docx_empty(mock_docx_class, tmp_path):
+def test_extract_text_docx_empty(tmp_path):
+    from docx import Document
+
     file_path = tmp_path / "file.docx"
-    file_path.touch()
-    mock_doc = MagicMock()
-    mock_doc.paragraphs = [MagicMock(text="   "), MagicMock(text="")]
-    mock_docx_class.return_value = mock_doc
-    
+    document = Document()
+    document.add_paragraph("   ")
+    document.add_paragraph("")
+    document.save(file_path)
+
     with pytest.raises(DocumentParsingError, match="No text content found in DOCX"):
         DocumentParser.extract_text(str(file_path))
 
+def test_extract_text_docx_invalid(tmp_path):
+    file_path = tmp_path / "file.docx"
+    file_path.touch()
+
+    with pytest.raises(DocumentParsingError, match="Invalid DOCX file"):
+        DocumentParser.extract_text(str(file_path))
+
 @patch("pdfplumber.open")
 def test_extract_text_pdf_success(mock_pdfplumber_open, tmp_path):
     file_path = tmp_path / "file.pdf"
@@ -87,7 +97,18 @@ def test_extract_text_pdf_empty(mock_pdfplumber_open, tmp_path):
         DocumentParser.extract_text(str(file_path))
 
     
-def test_clean_text_removes_extra_spaces():
+def test_clean_text_removes_extra_spaces_but_keeps_lines():
     dirty_text = "  This  is   a \n test\n\n text "
     cleaned = DocumentParser._clean_text(dirty_text)
-    assert cleaned == "This is a test text"
\ No newline at end of file
+    assert cleaned == "This is a\ntest\ntext"
+
+def test_extract_text_from_stream_txt():
+    stream = io.BytesIO("Résumé with accents".encode("utf-8"))
+
+    result = DocumentParser.extract_text_from_stream(stream, "cv.txt")
+    assert result == "Résumé with accents"
+
+
+def test_extract_text_from_stream_unsupported_extension():
+    with pytest.raises(DocumentParsingError, match="Unsupported file type"):
+        DocumentParser.extract_text_from_stream(io.BytesIO(b"data"), "cv.exe")
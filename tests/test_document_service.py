@@ -1,5 +1,8 @@
+import io
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 import pytest
-from app.exceptions import ValidationError, NotFoundError
+from app.exceptions import DocumentParsingError, ValidationError, NotFoundError
 from app.services.document_service import DocumentService
 
 
@@ -18,11 +21,12 @@ def mock_dependencies(monkeypatch):
         def get_by_id(self, session_id):
             return self.sessions.get(session_id)
         
-        def update_cv_text(self, session_id, cv_text):
+        def update_cv_text(self, session_id, cv_text, sections=None):
             s = self.sessions.get(session_id)
             if not s:
                 raise NotFoundError()
             s.cv_text = cv_text
+            s.cv_sections = sections
             return s
         
         def update_job_description(self, session_id, text):
@@ -34,20 +38,18 @@ def mock_dependencies(monkeypatch):
         
     class MockFileRepository:
         def __init__(self):
-            self.deleted_files = []
-            self.saved_files = []
+            self.opened_streams = []
 
-        def save_uploaded_file(self, file):
-            path = f"/tmp/{file.filename}"
-            self.saved_files.append(path)
-            return path
-
-        def delete_file(self, path):
-            self.deleted_files.append(path)
+        def open_uploaded_file(self, file):
+            stream = io.BytesIO(b"file content")
+            self.opened_streams.append(stream)
+            return stream
 
     class MockParser:
+        VERSION = "test"
+
         @staticmethod
-        def extract_text(path):
+        def extract_text_from_stream(stream, filename):
             return "A" * 200
         
 
@@ -77,27 +79,34 @@ class TestDocumentService:
         result = document_service.upload_cv(1, file)
 
         assert result.cv_text.startswith("A")
-        assert len(file_repo.deleted_files) == 1
-        assert file_repo.saved_files
+        assert result.cv_sections == [
+            {"kind": "header", "title": "", "text": result.cv_text}
+        ]
+        assert len(file_repo.opened_streams) == 1
+        assert file_repo.opened_streams[0].closed
 
     def test_upload_cv_session_not_found(self, document_service):
         with pytest.raises(NotFoundError):
             document_service.upload_cv(99, DummyFile())
 
     def test_upload_cv_invalid_text_short(self, document_service, monkeypatch):
-        monkeypatch.setattr("app.services.document_service.DocumentParser.extract_text", lambda _: "too short")
+        monkeypatch.setattr("app.services.document_service.DocumentParser.extract_text_from_stream", lambda *_: "too short")
 
         with pytest.raises(ValidationError, match="too short"):
             document_service.upload_cv(1, DummyFile())
 
-    def test_upload_cv_always_deletes_file_on_error(self, document_service, mock_dependencies, monkeypatch):
+    def test_upload_cv_always_closes_stream_on_error(self, document_service, mock_dependencies, monkeypatch):
         _, file_repo = mock_dependencies
-        monkeypatch.setattr("app.services.document_service.DocumentParser.extract_text", lambda _: "too short")
+
+        def failing_parser(stream, filename):
+            raise ValidationError("Failed to parse")
+
+        monkeypatch.setattr("app.services.document_service.DocumentParser.extract_text_from_stream", failing_parser)
 
         with pytest.raises(ValidationError):
             document_service.upload_cv(1, DummyFile())
 
-        assert len(file_repo.deleted_files) == 1
+        assert file_repo.opened_streams[0].closed
 
     def test_upload_job_description_success(self, document_service):
         text = "This is a long enough job description text for testing purposes."
@@ -119,4 +128,216 @@ class TestDocumentService:
     def test_upload_job_description_too_long(self, document_service):
         text = "x" * 10001
         with pytest.raises(ValidationError, match="too long"):
-            document_service.upload_job_description(1, text)
\ No newline at end of file
+            document_service.upload_job_description(1, text)
+
+
+class TestDocumentServiceParseCache:
+    class MockParseCache:
+        def __init__(self, cached=None):
+            self.cached = cached or {}
+            self.stored = {}
+
+        def hash_stream(self, stream):
+            return "hash"
+
+        def lookup(self, keys):
+            for key in keys:
+                if key in self.cached:
+                    return key, self.cached[key]
+            return None, None
+
+        def put(self, key, text):
+            self.stored[key] = text
+
+    def test_upload_cv_parses_and_caches_on_miss(self, mock_dependencies):
+        session_repo, file_repo = mock_dependencies
+        cache = self.MockParseCache()
+        service = DocumentService(session_repo, file_repo, cache)
+
+        service.upload_cv(1, DummyFile("cv.pdf"))
+
+        assert cache.stored == {("hash", "test.pdf"): "A" * 200}
+
+    def test_upload_cv_skips_parser_on_hit(self, mock_dependencies, monkeypatch):
+        session_repo, file_repo = mock_dependencies
+        cached_text = "Cached CV text " * 10
+        cache = self.MockParseCache({("hash", "test.pdf"): cached_text})
+
+        def parser_must_not_run(stream, filename):
+            raise AssertionError("parser called on a cache hit")
+
+        monkeypatch.setattr("app.services.document_service.DocumentParser.extract_text_from_stream", parser_must_not_run)
+        service = DocumentService(session_repo, file_repo, cache)
+
+        session = service.upload_cv(1, DummyFile())
+
+        assert session.cv_text == cached_text
+        assert cache.stored == {}
+
+    def test_rejected_cv_is_not_cached(self, mock_dependencies, monkeypatch):
+        session_repo, file_repo = mock_dependencies
+        cache = self.MockParseCache()
+        monkeypatch.setattr("app.services.document_service.DocumentParser.extract_text_from_stream", lambda stream, filename: "Too short")
+        service = DocumentService(session_repo, file_repo, cache)
+
+        with pytest.raises(ValidationError):
+            service.upload_cv(1, DummyFile())
+
+        assert cache.stored == {}
+
+
+
+class TestDocumentServiceCharBudget:
+    class MockJobs:
+        def __init__(self):
+            self.submitted = []
+
+        def submit(self, fn, *args):
+            self.submitted.append(args)
+
+    @pytest.fixture
+    def budget_parser(self, monkeypatch):
+        calls = []
+
+        def extract_prefix(stream, filename, max_chars):
+            calls.append(max_chars)
+            return "B" * max_chars, False
+
+        monkeypatch.setattr("app.services.document_service.DocumentParser.extract_prefix", extract_prefix, raising=False)
+        return calls
+
+    def test_upload_cv_parses_within_budget(self, mock_dependencies, budget_parser):
+        session_repo, file_repo = mock_dependencies
+        service = DocumentService(session_repo, file_repo, char_budget=100)
+
+        session = service.upload_cv(1, DummyFile())
+
+        assert budget_parser == [100]
+        assert session.cv_text == "B" * 100
+
+    def test_upload_cv_schedules_full_parse_when_truncated(self, mock_dependencies, budget_parser):
+        session_repo, file_repo = mock_dependencies
+        session_repo.sessions[1].cv_document_id = 5
+        jobs = self.MockJobs()
+        service = DocumentService(session_repo, file_repo, char_budget=100, background_jobs=jobs, background_full_parse=True)
+
+        service.upload_cv(1, DummyFile("cv.pdf"))
+
+        assert jobs.submitted == [(1, 5, b"file content", "cv.pdf")]
+
+    def test_truncated_text_is_cached_under_budget_key(self, mock_dependencies, budget_parser):
+        session_repo, file_repo = mock_dependencies
+        cache = TestDocumentServiceParseCache.MockParseCache()
+        service = DocumentService(session_repo, file_repo, cache, char_budget=100)
+
+        service.upload_cv(1, DummyFile("cv.pdf"))
+
+        assert list(cache.stored) == [("hash", "test.pdf@100")]
+
+    def test_complete_cv_text_skips_replaced_cv(self, mock_dependencies):
+        session_repo, file_repo = mock_dependencies
+        session_repo.sessions[1].cv_document_id = 7
+        service = DocumentService(session_repo, file_repo)
+
+        service.complete_cv_text(1, 5, b"data", "cv.pdf")
+
+        assert session_repo.sessions[1].cv_text is None
+
+    def test_complete_cv_text_restructures_full_text(
+        self, mock_dependencies, monkeypatch
+    ):
+        session_repo, file_repo = mock_dependencies
+        session_repo.sessions[1].cv_document_id = 5
+        full_text = "Jane Doe\nSummary\nBackend engineer\nExperience\nBuilt APIs"
+        monkeypatch.setattr(
+            "app.services.document_service.DocumentParser.extract_text_from_stream",
+            lambda stream, filename: full_text,
+        )
+        service = DocumentService(session_repo, file_repo)
+
+        service.complete_cv_text(1, 5, b"data", "cv.pdf")
+
+        session = session_repo.sessions[1]
+        assert session.cv_text == full_text
+        assert [s["kind"] for s in session.cv_sections] == [
+            "header",
+            "summary",
+            "experience",
+        ]
+
+
+class TestDocumentServiceAsyncUpload:
+    class MockUploadJobs:
+        def __init__(self):
+            self.jobs = {}
+
+        def create(self, session_id, filename):
+            job = SimpleNamespace(
+                id=len(self.jobs) + 1, session_id=session_id, filename=filename,
+                status="pending", error=None, updated_at=datetime.now(),
+            )
+            job.is_active = True
+            self.jobs[job.id] = job
+            return job
+
+        def get_latest(self, session_id):
+            return max(self.jobs.values(), key=lambda job: job.id, default=None)
+
+        def mark_processing(self, job_id):
+            self.jobs[job_id].status = "processing"
+
+        def mark_done(self, job_id):
+            self.jobs[job_id].status = "done"
+            self.jobs[job_id].is_active = False
+
+        def mark_failed(self, job_id, error):
+            self.jobs[job_id].status = "failed"
+            self.jobs[job_id].error = error
+            self.jobs[job_id].is_active = False
+
+    @pytest.fixture
+    def service(self, mock_dependencies):
+        session_repo, file_repo = mock_dependencies
+        return DocumentService(
+            session_repo, file_repo,
+            background_jobs=TestDocumentServiceCharBudget.MockJobs(),
+            upload_job_repository=self.MockUploadJobs(),
+        )
+
+    def test_submit_cv_upload_queues_bytes_without_parsing(self, service, monkeypatch):
+        def parser_must_not_run(stream, filename):
+            raise AssertionError("parsed during the request")
+
+        monkeypatch.setattr("app.services.document_service.DocumentParser.extract_text_from_stream", parser_must_not_run)
+
+        job = service.submit_cv_upload(1, DummyFile("cv.pdf"))
+
+        assert job.status == "pending"
+        assert service.background_jobs.submitted == [(job.id, 1, b"file content", "cv.pdf")]
+        assert service.session_repo.sessions[1].cv_text is None
+
+    def test_process_cv_upload_stores_text(self, service):
+        job = service.submit_cv_upload(1, DummyFile("cv.pdf"))
+
+        service.process_cv_upload(job.id, 1, b"file content", "cv.pdf")
+
+        assert job.status == "done"
+        assert service.session_repo.sessions[1].cv_text == "A" * 200
+
+    def test_process_cv_upload_reports_parse_errors(self, service, monkeypatch):
+        def broken(stream, filename):
+            raise DocumentParsingError("Invalid DOCX file")
+
+        monkeypatch.setattr("app.services.document_service.DocumentParser.extract_text_from_stream", broken)
+        job = service.submit_cv_upload(1, DummyFile("cv.docx"))
+
+        service.process_cv_upload(job.id, 1, b"file content", "cv.docx")
+
+        assert job.status == "failed"
+        assert job.error == "Could not read file: Invalid DOCX file"
+
+    def test_stale_jobs_are_reported_as_failed(self, service):
+        job = service.submit_cv_upload(1, DummyFile())
+        job.updated_at = datetime.now() - timedelta(hours=1)
+
+        assert service.get_upload_job(1).status == "failed"
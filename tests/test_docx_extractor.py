@@ -0,0 +1,99 @@
+import io
+import zipfile
+import pytest
+from docx import Document
+from app.exceptions import DocumentParsingError
+from utils.document_parser import DocumentParser
+from utils.docx_extractor import DocxExtractor
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+MC = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+
+def _save(document) -> io.BytesIO:
+    stream = io.BytesIO()
+    document.save(stream)
+    stream.seek(0)
+    return stream
+
+
+def _docx_from_body(body: str) -> io.BytesIO:
+    """A package holding only word/document.xml"""
+    stream = io.BytesIO()
+    with zipfile.ZipFile(stream, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            f'<w:document xmlns:w="{W}" xmlns:mc="{MC}"><w:body>{body}</w:body></w:document>',
+        )
+    stream.seek(0)
+    return stream
+
+
+def test_blocks_follow_document_order():
+    document = Document()
+    document.sections[0].header.paragraphs[0].text = "Jane Doe"
+    document.sections[0].footer.paragraphs[0].text = "Page footer"
+    document.add_paragraph("Summary")
+    table = document.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Python"
+    table.cell(0, 1).text = "5 years"
+    table.cell(1, 0).text = "SQL"
+    document.add_paragraph("Education")
+
+    assert list(DocxExtractor.iter_blocks(_save(document))) == [
+        "Jane Doe",
+        "Summary",
+        "Python | 5 years",
+        "SQL",
+        "Education",
+        "Page footer",
+    ]
+
+
+def test_text_boxes_are_read_once():
+    body = (
+        "<w:p><w:r><w:t>Before</w:t></w:r>"
+        "<mc:AlternateContent><mc:Choice><w:txbxContent>"
+        "<w:p><w:r><w:t>Boxed</w:t></w:r></w:p>"
+        "</w:txbxContent></mc:Choice>"
+        "<mc:Fallback><w:txbxContent><w:p><w:r><w:t>Boxed</w:t></w:r></w:p>"
+        "</w:txbxContent></mc:Fallback></mc:AlternateContent></w:p>"
+        "<w:p><w:r><w:t>Line</w:t><w:br/><w:t>break</w:t></w:r></w:p>"
+    )
+    assert list(DocxExtractor.iter_blocks(_docx_from_body(body))) == [
+        "BeforeBoxed",
+        "Line\nbreak",
+    ]
+
+
+def test_nested_tables_stay_in_their_cell():
+    body = (
+        "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Outer</w:t></w:r></w:p>"
+        "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>a</w:t></w:r></w:p></w:tc>"
+        "<w:tc><w:p><w:r><w:t>b</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+        "</w:tc><w:tc><w:p><w:r><w:t>Right</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+    )
+    assert list(DocxExtractor.iter_blocks(_docx_from_body(body))) == [
+        "Outer\na | b | Right"
+    ]
+
+
+@pytest.mark.parametrize("data, message", [
+    (b"not a zip", "Invalid DOCX file"),
+    (_docx_from_body("<w:p>").getvalue(), "Invalid DOCX file"),
+])
+def test_invalid_documents_raise(data, message):
+    with pytest.raises(DocumentParsingError, match=message):
+        DocxExtractor.extract(io.BytesIO(data))
+
+
+def test_extract_prefix_stops_reading_docx():
+    document = Document()
+    for n in range(200):
+        document.add_paragraph(f"Paragraph {n} " + "experience " * 20)
+
+    text, complete = DocumentParser.extract_prefix(_save(document), "cv.docx", 500)
+
+    assert complete is False
+    assert len(text) == 500
+    assert text.startswith("Paragraph 0")
@@ -0,0 +1,83 @@
+import gzip
+import json
+import pytest
+from datetime import datetime
+from app.exceptions import ValidationError
+from app.services.export_service import ExportService
+
+
+@pytest.fixture
+def mock_export_repo():
+    class MockExportRepository:
+        def __init__(self):
+            self.calls = []
+            self.sessions = [
+                {"id": 1, "archived": False, "messages": [], "feedback": None},
+                {"id": 2, "archived": False, "messages": [], "feedback": None},
+            ]
+            self.archived = [
+                {"id": 3, "archived": True, "messages": [], "feedback": {"score": 7}}
+            ]
+
+        def iter_sessions(self, since, until):
+            self.calls.append(("sessions", since, until))
+            return iter(self.sessions)
+
+        def iter_archived(self, since, until):
+            self.calls.append(("archived", since, until))
+            return iter(self.archived)
+
+    return MockExportRepository()
+
+
+@pytest.fixture
+def export_service(mock_export_repo):
+    return ExportService(mock_export_repo)
+
+
+class TestExportService:
+    def test_stream_ndjson_writes_one_line_per_session(self, export_service):
+        output = b"".join(export_service.stream_ndjson())
+
+        records = [json.loads(line) for line in output.splitlines()]
+        assert [r["id"] for r in records] == [1, 2, 3]
+        assert records[2]["archived"] is True
+
+    def test_stream_ndjson_gzip(self, export_service):
+        output = b"".join(export_service.stream_ndjson(compress=True))
+
+        lines = gzip.decompress(output).splitlines()
+        assert len(lines) == 3
+
+    def test_stream_ndjson_passes_bounds_to_both_tiers(
+        self, export_service, mock_export_repo
+    ):
+        since, until = datetime(2025, 1, 1), datetime(2025, 2, 1)
+
+        list(export_service.stream_ndjson(since=since, until=until))
+
+        assert mock_export_repo.calls == [
+            ("sessions", since, until),
+            ("archived", since, until),
+        ]
+
+    def test_stream_ndjson_flushes_in_chunks(self, export_service, monkeypatch):
+        monkeypatch.setattr(ExportService, "CHUNK_SIZE", 1)
+
+        chunks = list(export_service.stream_ndjson())
+
+        assert len(chunks) == 3
+
+    def test_stream_ndjson_rejects_inverted_bounds(self, export_service):
+        with pytest.raises(ValidationError, match="earlier than"):
+            export_service.stream_ndjson(
+                since=datetime(2025, 2, 1), until=datetime(2025, 1, 1)
+            )
+
+    def test_parse_bound_accepts_iso_dates(self):
+        assert ExportService.parse_bound("2025-03-04", "since") == datetime(2025, 3, 4)
+        assert ExportService.parse_bound("", "since") is None
+
+    def test_parse_bound_rejects_garbage(self):
+        with pytest.raises(ValidationError, match="Invalid 'until'"):
+            ExportService.parse_bound("yesterday", "until")
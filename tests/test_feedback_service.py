@@ -12,6 +12,7 @@ def mock_dependencies():
             self.job_title = job_title
             self.company_name = company_name
             self.cv_text = cv_text
+            self.cv_sections = None
             self.job_description_text = job_description_text
 
     class MockSessionRepo:
@@ -93,3 +94,20 @@ class TestFeedbackService:
 
         with pytest.raises(ValidationError, match="empty interview"):
             feedback_service.generate_feedback(1)
+
+    def test_get_feedback_falls_back_to_archive(self, mock_dependencies):
+        session_repo, message_repo, feedback_repo, ai_client = mock_dependencies
+
+        class MockArchiveRepo:
+            def get_feedback(self, session_id):
+                return {"session_id": session_id, "score": 6}
+
+        service = FeedbackService(
+            session_repo, message_repo, feedback_repo, ai_client, MockArchiveRepo()
+        )
+
+        assert service.get_feedback(3)["score"] == 6
+
+    def test_get_feedback_not_found_without_archive(self, feedback_service):
+        with pytest.raises(NotFoundError):
+            feedback_service.get_feedback(3)
@@ -0,0 +1,102 @@
+import gzip
+import brotli
+import pytest
+from flask import Response
+from app.models import db, Feedback, Message, Session
+
+
+@pytest.fixture
+def app(make_app):
+    app = make_app(OPENROUTER_API_KEY="key")
+
+    @app.route("/test/text/<int:size>")
+    def text(size):
+        return "x" * size
+
+    @app.route("/test/stream")
+    def stream():
+        return Response(iter(["x" * 1000]), mimetype="text/plain")
+
+    return app
+
+
+def _create_session(client, app):
+    response = client.post(
+        "/session/create", data={"job_title": "Engineer", "company_name": "Acme"}
+    )
+    session_id = int(response.location.split("/")[-2])
+    with app.app_context():
+        session = db.session.get(Session, session_id)
+        session.has_cv = session.has_job_description = True
+        db.session.add(Message(session_id=session_id, role="assistant", content="Hi?"))
+        db.session.commit()
+    # Consume the flash from creating the session
+    client.get(f"/session/{session_id}/upload")
+    return session_id
+
+
+@pytest.mark.parametrize(
+    "accept, decompress",
+    [("gzip, br", brotli.decompress), ("gzip", gzip.decompress)],
+)
+def test_compresses_text_responses(app, accept, decompress):
+    response = app.test_client().get(
+        "/test/text/2000", headers={"Accept-Encoding": accept}
+    )
+
+    assert response.headers["Content-Encoding"] == accept.split(", ")[-1]
+    assert decompress(response.data) == b"x" * 2000
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+
+@pytest.mark.parametrize("path", ["/test/text/100", "/test/stream"])
+def test_skips_small_and_streamed_responses(app, path):
+    response = app.test_client().get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert response.data.startswith(b"x")
+
+
+def test_repeat_interview_view_is_not_rendered(app, renders):
+    client = app.test_client()
+    session_id = _create_session(client, app)
+    url = f"/session/{session_id}/interview"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.headers["ETag"].startswith('W/"')
+    renders.clear()
+
+    repeat = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert repeat.status_code == 304
+    assert renders == []
+
+    with app.app_context():
+        db.session.add(Message(session_id=session_id, role="user", content="Hello"))
+        db.session.commit()
+    changed = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != first.headers["ETag"]
+
+
+def test_feedback_page_revalidates_by_creation_time(app, renders):
+    client = app.test_client()
+    session_id = _create_session(client, app)
+    url = f"/session/{session_id}/feedback"
+    assert client.get(url).status_code == 404
+
+    with app.app_context():
+        db.session.add(Feedback(session_id=session_id, interview_score=7))
+        db.session.commit()
+    first = client.get(url)
+    assert first.status_code == 200
+    assert first.last_modified is not None
+    renders.clear()
+
+    by_etag = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+    by_date = client.get(
+        url, headers={"If-Modified-Since": first.headers["Last-Modified"]}
+    )
+    assert by_etag.status_code == by_date.status_code == 304
+    assert renders == []
+    assert "private" in by_etag.headers["Cache-Control"]
@@ -12,7 +12,10 @@ def mock_dependencies():
             self.job_title = job_title
             self.company_name = company_name
             self.cv_text = cv_text
+            self.cv_sections = None
             self.job_description_text = job_description_text
+            self.has_cv = cv_text is not None
+            self.has_job_description = job_description_text is not None
 
     class MockSessionRepo:
         def __init__(self) -> None:
@@ -80,6 +83,7 @@ class TestInterviewService:
     def test_start_interview_not_ready(self, interview_service, mock_dependencies):
         session_repo, _, _ = mock_dependencies
         session_repo.sessions[1].cv_text = None
+        session_repo.sessions[1].has_cv = False
 
         with pytest.raises(ValidationError, match="Session is not ready"):
             interview_service.start_interview(1)
@@ -0,0 +1,57 @@
+import pytest
+from app import extensions
+from app.container import get_document_parser, get_parse_cache_memory
+from app.jobs import get_background_jobs
+from app.lifecycle import after_fork, prepare_for_fork
+from app.templating import warm_templates
+from utils.pdf_extractor import PdfExtractor
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app(OPENROUTER_API_KEY="key", PARSER_SANDBOX_ENABLED=True)
+
+
+def test_prepare_for_fork_compiles_every_template(app):
+    prepare_for_fork(app)
+
+    cached = {template.name for template in app.jinja_env.cache.values()}
+    assert set(app.jinja_env.list_templates()) <= cached
+
+
+def test_after_fork_drops_per_process_state(app):
+    parse_cache = get_parse_cache_memory(app)
+    document_parser = get_document_parser(app)
+    jobs = get_background_jobs(app)
+    ai_client = extensions.ai_client
+    PdfExtractor._pool = object()
+
+    try:
+        after_fork(app)
+
+        assert get_parse_cache_memory(app) is not parse_cache
+        assert get_document_parser(app) is not document_parser
+        assert get_background_jobs(app) is not jobs
+        assert PdfExtractor._pool is None
+        assert extensions.ai_client is not None
+        assert extensions.ai_client is not ai_client
+    finally:
+        PdfExtractor._pool = None
+        jobs.shutdown()
+        get_background_jobs(app).shutdown()
+
+
+def test_templates_compiled_by_one_worker_are_reused_by_the_next(make_app, tmp_path):
+    config = {
+        "OPENROUTER_API_KEY": "key",
+        "TEMPLATE_CACHE_DIR": str(tmp_path / "jinja"),
+    }
+    first = make_app(**config)
+    warm_templates(first)
+    assert len(list((tmp_path / "jinja").iterdir())) == len(
+        first.jinja_env.list_templates()
+    )
+
+    second = make_app(**config)
+    second.jinja_env.compile = None  # any compile would now raise
+    assert warm_templates(second) == len(second.jinja_env.list_templates())
@@ -0,0 +1,73 @@
+from app.models import db, Session
+from app.repositories.ownership_repository import OwnershipMemory
+
+
+def _create(client, job_title="Engineer"):
+    response = client.post(
+        "/session/create", data={"job_title": job_title, "company_name": "Acme"}
+    )
+    return int(response.location.split("/")[-2])
+
+
+def test_memory_evicts_least_recently_used():
+    memory = OwnershipMemory(max_entries=2)
+    memory.put(("session", 1), 10)
+    memory.put(("session", 2), 20)
+    memory.get(("session", 1))
+    memory.put(("browser", "token"), 30)
+
+    assert memory.get(("session", 2)) is None
+    assert memory.get(("session", 1)) == 10
+    assert memory.get(("browser", "token")) == 30
+
+
+def test_cookie_holds_only_an_opaque_token(make_app):
+    client = make_app().test_client()
+    for i in range(20):
+        _create(client, f"Engineer {i}")
+
+    with client.session_transaction() as session:
+        assert list(session.keys()) == ["sid"]
+    assert len(client.get_cookie("session").value) < 150
+
+
+def test_only_the_creating_browser_owns_a_session(make_app):
+    app = make_app()
+    owner, stranger = app.test_client(), app.test_client()
+    session_id = _create(owner)
+
+    assert owner.get(f"/session/{session_id}/upload").status_code == 200
+    assert stranger.get(f"/session/{session_id}/upload").status_code == 403
+    assert stranger.get("/session/999/upload").status_code == 403
+
+
+def test_legacy_cookie_is_migrated(make_app):
+    app = make_app()
+    owner = app.test_client()
+    owned_id = _create(owner)
+    with app.app_context():
+        unowned = Session(job_title="Old", company_name="Acme")
+        db.session.add(unowned)
+        db.session.commit()
+        unowned_id = unowned.id
+
+    legacy = app.test_client()
+    with legacy.session_transaction() as session:
+        session["my_sessions"] = [unowned_id, owned_id]
+
+    assert legacy.get(f"/session/{unowned_id}/upload").status_code == 200
+    assert legacy.get(f"/session/{owned_id}/upload").status_code == 403
+    with legacy.session_transaction() as session:
+        assert list(session.keys()) == ["sid"]
+
+
+def test_search_only_finds_the_browsers_own_sessions(make_app):
+    app = make_app()
+    owner, stranger = app.test_client(), app.test_client()
+    owned_id = _create(owner, "Kafka Engineer")
+    _create(stranger, "Kafka Engineer")
+
+    page = owner.get("/search?q=kafka").get_data(as_text=True)
+
+    assert "1 result for" in page
+    assert f"/session/{owned_id}/interview" in page
@@ -0,0 +1,45 @@
+import io
+from app.repositories.parse_cache_repository import ParseCacheMemory, ParseCacheRepository
+
+
+def test_memory_tier_evicts_least_recently_used():
+    memory = ParseCacheMemory(max_entries=2)
+    memory.put(("a", "v"), "A")
+    memory.put(("b", "v"), "B")
+    memory.get(("a", "v"))
+    memory.put(("c", "v"), "C")
+
+    assert memory.get(("b", "v")) is None
+    assert memory.get(("a", "v")) == "A"
+    assert memory.get(("c", "v")) == "C"
+
+
+def test_memory_tier_disabled_with_zero_size():
+    memory = ParseCacheMemory(max_entries=0)
+    memory.put(("a", "v"), "A")
+    assert memory.get(("a", "v")) is None
+
+
+def test_stats_hit_rate():
+    memory = ParseCacheMemory()
+    memory.put(("a", "v"), "A")
+    memory.get(("a", "v"))
+    memory.record_db_hit()
+    memory.record_miss()
+    memory.record_miss()
+
+    stats = memory.stats()
+    assert stats["memory_hits"] == 1
+    assert stats["db_hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["hit_rate"] == 0.5
+
+
+def test_hash_stream_rewinds_stream():
+    stream = io.BytesIO(b"same bytes")
+
+    content_hash = ParseCacheRepository.hash_stream(stream)
+
+    assert content_hash == ParseCacheRepository.hash_stream(io.BytesIO(b"same bytes"))
+    assert len(content_hash) == 64
+    assert stream.read() == b"same bytes"
@@ -0,0 +1,67 @@
+import io
+import time
+from types import SimpleNamespace
+import pytest
+from app.container import get_document_parser
+from app.exceptions import DocumentParsingError
+from benchmarks.pdf_corpus import build_pdf
+from utils.parser_pool import SandboxedParser
+from utils.pdf_extractor import PdfExtractor
+
+
+@pytest.fixture(scope="module")
+def sandboxed_parser():
+    parser = SandboxedParser(workers=1, timeout=30, max_pages=2)
+    yield parser
+    parser.shutdown()
+
+
+def test_parses_in_worker(sandboxed_parser):
+    text = sandboxed_parser.extract_text_from_stream(
+        io.BytesIO(b"Senior engineer with Python experience"), "cv.txt"
+    )
+    assert text == "Senior engineer with Python experience"
+
+
+def test_page_cap_applies_in_worker(sandboxed_parser):
+    pdf = build_pdf([["page"]] * 3)
+    with pytest.raises(DocumentParsingError, match="too many pages"):
+        sandboxed_parser.extract_text_from_stream(io.BytesIO(pdf), "cv.pdf")
+
+
+def test_parser_errors_are_reraised(sandboxed_parser):
+    with pytest.raises(DocumentParsingError, match="Text file is empty"):
+        sandboxed_parser.extract_text_from_stream(io.BytesIO(b"   "), "cv.txt")
+
+
+def _hang(data, filename):
+    time.sleep(60)
+
+
+def test_slow_job_times_out_without_losing_the_worker():
+    parser = SandboxedParser(workers=1, timeout=0.5)
+    try:
+        parser.extract_text_from_stream(io.BytesIO(b"warm up the worker"), "cv.txt")
+        pool = parser._pool
+
+        with pytest.raises(DocumentParsingError, match="too long"):
+            parser._run(_hang, b"", "cv.txt")
+
+        assert parser._pool is pool
+        text = parser.extract_text_from_stream(io.BytesIO(b"still parsing"), "cv.txt")
+        assert text == "still parsing"
+    finally:
+        parser.shutdown()
+
+
+def test_page_cap_applies_without_sandbox():
+    app = SimpleNamespace(
+        config={"PARSER_SANDBOX_ENABLED": False, "PARSER_MAX_PAGES": 2},
+        extensions={},
+    )
+    parser = get_document_parser(app)
+
+    pdf = build_pdf([["page"]] * 3)
+    with pytest.raises(DocumentParsingError, match="max 2"):
+        parser.extract_text_from_stream(io.BytesIO(pdf), "cv.pdf")
+    assert PdfExtractor.MAX_PAGES == 100
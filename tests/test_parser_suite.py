@@ -0,0 +1,40 @@
+from benchmarks.parser_suite import compare
+
+
+def _report(calibration_ms, wall_ms, rss_growth_mb=2.0, output_chars=1000, version="4"):
+    return {
+        "meta": {"calibration_ms": calibration_ms, "parser_version": version},
+        "results": [
+            {
+                "name": "cv.pdf",
+                "wall_ms": wall_ms,
+                "rss_growth_mb": rss_growth_mb,
+                "output_chars": output_chars,
+            }
+        ],
+    }
+
+
+def _compare(current, baseline):
+    return compare(current, baseline, time_tolerance=0.5, rss_tolerance=0.5, min_ms=5)
+
+
+def test_timings_are_scaled_by_calibration():
+    # Twice as slow on a machine that is twice as slow is not a regression
+    assert _compare(_report(100, 200), _report(50, 100)) == []
+    assert len(_compare(_report(50, 200), _report(50, 100))) == 1
+
+
+def test_small_absolute_slowdowns_are_noise():
+    assert _compare(_report(50, 4), _report(50, 1)) == []
+
+
+def test_memory_and_output_changes_are_flagged():
+    regressions = _compare(
+        _report(50, 100, rss_growth_mb=40, output_chars=900), _report(50, 100)
+    )
+    assert [r.split(":")[1].split()[0] for r in regressions] == ["parsing", "extracted"]
+
+
+def test_output_changes_are_expected_with_a_new_parser_version():
+    assert _compare(_report(50, 100, output_chars=900, version="5"), _report(50, 100)) == []
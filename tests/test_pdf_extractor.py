@@ -0,0 +1,148 @@
+import io
+from pathlib import Path
+from unittest.mock import patch
+import pdfplumber.page
+import pypdf
+import pytest
+from app.exceptions import DocumentParsingError
+from benchmarks.pdf_corpus import build_pdf
+from utils.document_parser import DocumentParser
+from utils.pdf_extractor import PdfExtractor, is_garbled
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "cv.pdf"
+    path.write_bytes(build_pdf([["Senior Engineer"], ["Python and SQL"]]))
+    return path
+
+
+def test_extract_reads_every_page(pdf_path):
+    text = PdfExtractor.extract(str(pdf_path))
+    assert "Senior Engineer" in text
+    assert "Python and SQL" in text
+
+
+def test_extract_falls_back_to_pdfplumber_for_empty_pages(pdf_path):
+    with patch("pypdf.PageObject.extract_text", return_value=""):
+        text = PdfExtractor.extract(str(pdf_path))
+    assert "Senior Engineer" in text
+
+
+def test_extract_without_text_raises(tmp_path):
+    path = tmp_path / "blank.pdf"
+    path.write_bytes(build_pdf([[]]))
+    with pytest.raises(DocumentParsingError, match="No text content"):
+        PdfExtractor.extract(str(path))
+
+
+def test_pdfplumber_fallback_enforces_page_cap(monkeypatch):
+    monkeypatch.setattr(PdfExtractor, "MAX_PAGES", 2)
+    pdf = build_pdf([["page"]] * 3)
+    with patch("pypdf.PdfReader", side_effect=ValueError("unreadable")), \
+            patch("pdfplumber.page.Page.extract_text") as extract_text:
+        with pytest.raises(DocumentParsingError, match="too many pages"):
+            PdfExtractor.extract(io.BytesIO(pdf))
+    extract_text.assert_not_called()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Experienced backend engineer", False),
+    ("", True),
+    ("   \n ", True),
+    ("(cid:12)(cid:7)(cid:44) engineer", True),
+    ("��� abc", True),
+    ("x" * 300, True),
+])
+def test_is_garbled(text, expected):
+    assert is_garbled(text) is expected
+
+
+def test_extract_from_stream(pdf_path):
+    with open(pdf_path, "rb") as stream:
+        text = PdfExtractor.extract(io.BytesIO(stream.read()))
+    assert "Python and SQL" in text
+
+
+class ChunkedOnlyStream(io.BytesIO):
+    """Fails the test if anything reads the whole upload back into memory"""
+
+    def read(self, size=-1):
+        assert size is not None and size >= 0, "stream was read in full"
+        return super().read(size)
+
+
+def test_stream_fallback_reads_the_upload_in_place(pdf_path):
+    stream = ChunkedOnlyStream(pdf_path.read_bytes())
+    with patch("pypdf.PageObject.extract_text", return_value=""):
+        text = PdfExtractor.extract(stream)
+    assert "Senior Engineer" in text
+
+
+def test_parallel_extraction_of_a_stream(monkeypatch, tmp_path):
+    monkeypatch.setattr(PdfExtractor, "PARALLEL_MIN_PAGES", 2)
+    monkeypatch.setattr(PdfExtractor, "MAX_WORKERS", 2)
+    monkeypatch.setattr(PdfExtractor, "_pool", None)
+    spooled = []
+    extract_in_parallel = PdfExtractor._extract_in_parallel
+
+    def recording(path, page_count):
+        spooled.append(Path(path).parent)
+        return extract_in_parallel(path, page_count)
+
+    monkeypatch.setattr(PdfExtractor, "_extract_in_parallel", recording)
+    stream = ChunkedOnlyStream(build_pdf([[f"Page {n}"] for n in range(3)]))
+    try:
+        text = PdfExtractor.extract(stream, spool_dir=tmp_path)
+    finally:
+        PdfExtractor._pool.shutdown()
+
+    assert [line for line in text.splitlines() if line] == [
+        "Page 0", "Page 1", "Page 2"
+    ]
+    assert spooled == [tmp_path]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_extract_prefix_stops_at_budget(tmp_path):
+    pdf = build_pdf([[f"Page {n} " + "experience " * 40] for n in range(10)])
+    parsed = []
+    original = pypdf.PageObject.extract_text
+
+    def counting_extract(page, *args, **kwargs):
+        parsed.append(page)
+        return original(page, *args, **kwargs)
+
+    with patch("pypdf.PageObject.extract_text", counting_extract):
+        text, complete = DocumentParser.extract_prefix(io.BytesIO(pdf), "cv.pdf", 500)
+
+    assert not complete
+    assert len(text) == 500
+    assert text.startswith("Page 0")
+    assert len(parsed) == 2
+
+
+def test_extract_prefix_stops_at_budget_on_pdfplumber_fallback():
+    pdf = build_pdf([[f"Page {n} " + "experience " * 40] for n in range(10)])
+    parsed = []
+    original = pdfplumber.page.Page.extract_text
+
+    def counting_extract(page, *args, **kwargs):
+        parsed.append(page)
+        return original(page, *args, **kwargs)
+
+    with patch("pypdf.PdfReader", side_effect=ValueError("unreadable")), \
+            patch("pdfplumber.page.Page.extract_text", counting_extract):
+        text, complete = DocumentParser.extract_prefix(io.BytesIO(pdf), "cv.pdf", 500)
+
+    assert not complete
+    assert text.startswith("Page 0")
+    assert len(parsed) == 2
+
+
+def test_extract_prefix_reads_short_document_completely(pdf_path):
+    with open(pdf_path, "rb") as stream:
+        text, complete = DocumentParser.extract_prefix(stream, "cv.pdf", 6000)
+
+    assert complete
+    assert "Python and SQL" in text
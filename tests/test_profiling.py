@@ -0,0 +1,98 @@
+import time
+import pytest
+from app.profiling import ProfileStore, SamplingProfiler, _category
+
+
+def _app(make_app, **config):
+    profiling = {
+        "ADMIN_API_TOKEN": "secret",
+        "PROFILING_ENABLED": True,
+        "PROFILE_INTERVAL_MS": 1,
+    }
+    app = make_app(**{**profiling, **config})
+
+    @app.route("/test/slow")
+    def slow():
+        time.sleep(0.05)
+        return "done"
+
+    return app
+
+
+@pytest.fixture
+def app(make_app):
+    return _app(make_app)
+
+
+ADMIN = {"Authorization": "Bearer secret"}
+
+
+def test_disabled_profiling_installs_no_hooks(make_app):
+    app = _app(make_app, PROFILING_ENABLED=False)
+
+    response = app.test_client().get(
+        "/test/slow", headers={"X-Profile-Token": "secret"}
+    )
+
+    assert "X-Profile-Id" not in response.headers
+    hooks = [f.__module__ for f in app.before_request_funcs.get(None, [])]
+    assert "app.profiling" not in hooks
+
+
+def test_only_the_admin_token_profiles_a_request(app):
+    client = app.test_client()
+
+    assert (
+        "X-Profile-Id"
+        not in client.get("/test/slow", headers={"X-Profile-Token": "wrong"}).headers
+    )
+    assert client.get("/admin/profiles", headers=ADMIN).json["profiles"] == []
+
+
+def test_profile_is_served_as_speedscope_json(app):
+    client = app.test_client()
+    profile_id = client.get(
+        "/test/slow", headers={"X-Profile-Token": "secret"}
+    ).headers["X-Profile-Id"]
+
+    [meta] = client.get("/admin/profiles", headers=ADMIN).json["profiles"]
+    assert meta["id"] == profile_id
+    assert meta["endpoint"] == "slow"
+    assert meta["samples"] > 0
+    assert meta["duration_ms"] >= 50
+
+    speedscope = client.get(f"/admin/profiles/{profile_id}", headers=ADMIN).json
+    [profile] = speedscope["profiles"]
+    frames = speedscope["shared"]["frames"]
+    assert profile["type"] == "sampled"
+    assert len(profile["samples"]) == len(profile["weights"]) == meta["samples"]
+    assert any(
+        frames[stack[-1]]["name"].endswith("slow") for stack in profile["samples"]
+    )
+    assert client.get("/admin/profiles/missing", headers=ADMIN).status_code == 404
+    assert client.get(f"/admin/profiles/{profile_id}").status_code == 401
+
+
+def test_time_goes_to_the_innermost_known_library():
+    stack = [
+        ("render", "/app/routes/feedback_routes.py", 1),
+        ("root", "/templates/feedback.html", 1),
+        ("execute", "/site-packages/sqlalchemy/engine/base.py", 1),
+        ("wait", "/lib/threading.py", 1),
+    ]
+
+    assert _category(stack) == "sqlalchemy"
+    assert _category(stack[:2]) == "jinja"
+    assert _category(stack[:1]) == "other"
+
+
+def test_store_keeps_the_newest_profiles_within_retention():
+    store = ProfileStore(max_profiles=2, retention_seconds=60)
+    store.add({"id": "old", "recorded_at": time.time() - 120}, SamplingProfiler(0.001))
+    assert store.list() == []
+
+    for i in range(3):
+        store.add({"id": str(i), "recorded_at": time.time()}, SamplingProfiler(0.001))
+
+    assert [meta["id"] for meta in store.list()] == ["2", "1"]
+    assert store.get("0") is None
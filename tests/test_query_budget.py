@@ -0,0 +1,114 @@
+import io
+import logging
+import time
+import pytest
+from sqlalchemy.exc import OperationalError
+from app import extensions
+from app.exceptions import QueryBudgetExceeded
+from app.models import db, Session
+from app.query_budget import query_budget, track_queries
+from tests.conftest import FakeAIClient
+
+
+@pytest.fixture
+def app(make_app, monkeypatch):
+    app = make_app(
+        OPENROUTER_API_KEY="key", UPLOAD_ASYNC=False, QUERY_BUDGET_RAISE=True
+    )
+    monkeypatch.setattr(extensions, "ai_client", FakeAIClient())
+
+    @app.route("/test/sessions")
+    @query_budget(2)
+    def list_sessions():
+        # One query per session: the pattern the budget exists to catch
+        for session in Session.query.all():
+            db.session.get(Session, session.id, populate_existing=True)
+        return "ok"
+
+    return app
+
+
+def _create(client):
+    response = client.post(
+        "/session/create", data={"job_title": "Engineer", "company_name": "Acme"}
+    )
+    return int(response.location.split("/")[-2])
+
+
+def test_interview_flow_stays_within_route_budgets(app):
+    """Each route raises QueryBudgetExceeded if it goes over its @query_budget"""
+    client = app.test_client()
+    session_id = _create(client)
+    base = f"/session/{session_id}"
+
+    client.post(
+        f"{base}/upload-cv",
+        data={"cv_file": (io.BytesIO(b"Python engineer " * 20), "cv.txt")},
+        content_type="multipart/form-data",
+    )
+    client.post(f"{base}/upload-job", data={"job_description": "Build APIs " * 20})
+    assert client.get(f"{base}/interview").status_code == 200
+    for _ in range(8):
+        client.post(f"{base}/message", data={"answer": "An answer"})
+    client.post(f"{base}/complete")
+    assert client.get(f"{base}/feedback").status_code == 200
+    assert client.get("/dashboard").status_code == 200
+
+
+def test_dashboard_queries_do_not_grow_with_sessions(app, assert_query_budget):
+    client = app.test_client()
+    for _ in range(5):
+        _create(client)
+    client.get("/dashboard")
+
+    with assert_query_budget(app, 4, max_repeats=1):
+        assert client.get("/dashboard").status_code == 200
+
+
+def test_over_budget_view_raises(app):
+    client = app.test_client()
+    for _ in range(3):
+        _create(client)
+
+    with pytest.raises(QueryBudgetExceeded, match="budget of 2"):
+        client.get("/test/sessions")
+
+
+def test_repeated_statement_is_logged_as_n_plus_one(app, caplog):
+    app.config["QUERY_BUDGET_RAISE"] = False
+    client = app.test_client()
+    for _ in range(5):
+        _create(client)
+
+    with caplog.at_level(logging.WARNING, logger="app.query_budget"):
+        response = client.get("/test/sessions")
+
+    assert 'desc="6 queries"' in response.headers["Server-Timing"]
+    assert "Possible N+1 in list_sessions: ran 5 times" in caplog.text
+    assert "over its budget of 2" in caplog.text
+
+
+def test_timing_header_is_only_sent_when_debugging(app, caplog):
+    assert "Server-Timing" in app.test_client().get("/test/sessions").headers
+
+    app.testing = False
+    with caplog.at_level(logging.DEBUG, logger="app.query_budget"):
+        response = app.test_client().get("/test/sessions")
+
+    assert "Server-Timing" not in response.headers
+    assert "GET /test/sessions ran 1 queries" in caplog.text
+
+    app.config["QUERY_TIMING_HEADER"] = True
+    assert "Server-Timing" in app.test_client().get("/test/sessions").headers
+
+
+def test_failed_statement_does_not_skew_later_timings(app):
+    with app.app_context(), track_queries(app) as stats:
+        with pytest.raises(OperationalError):
+            db.session.execute(db.text("SELECT * FROM no_such_table"))
+        db.session.rollback()
+        time.sleep(0.2)
+        db.session.execute(db.text("SELECT 1"))
+
+    assert stats.count == 1
+    assert stats.total_ms < 100
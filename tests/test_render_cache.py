@@ -0,0 +1,101 @@
+import logging
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from app.container import get_container, get_render_cache_memory
+from app.models import db, Feedback, Message, RenderedPage, Session
+from app.repositories.render_cache_repository import RenderCacheMemory
+
+
+@pytest.fixture
+def app(make_app):
+    return make_app(OPENROUTER_API_KEY="key", RENDER_CACHE_SHARED=True)
+
+
+def _session_with_feedback(client, app):
+    response = client.post(
+        "/session/create", data={"job_title": "Engineer", "company_name": "Acme"}
+    )
+    session_id = int(response.location.split("/")[-2])
+    with app.app_context():
+        db.session.add(Message(session_id=session_id, role="assistant", content="Q?"))
+        db.session.add(Feedback(session_id=session_id, interview_score=8))
+        db.session.commit()
+    # Consume the flash from creating the session
+    client.get(f"/session/{session_id}/upload")
+    return session_id
+
+
+def test_memory_discards_only_the_given_sessions():
+    memory = RenderCacheMemory(max_entries=2)
+    memory.put((1, "a"), "one")
+    memory.put((2, "a"), "two")
+    memory.put((3, "a"), "three")
+    memory.discard_sessions({3})
+
+    assert memory.get((1, "a")) is None
+    assert memory.get((2, "a")) == "two"
+    assert memory.get((3, "a")) is None
+
+
+def test_feedback_page_is_rendered_once(app, renders):
+    client = app.test_client()
+    session_id = _session_with_feedback(client, app)
+    url = f"/session/{session_id}/feedback"
+    renders.clear()
+
+    first, second = client.get(url), client.get(url)
+
+    assert first.status_code == second.status_code == 200
+    assert first.data == second.data
+    assert renders == ["feedback.html"]
+    assert get_render_cache_memory(app).stats()["memory_hits"] == 1
+
+
+def test_other_workers_read_the_shared_tier(app, renders):
+    client = app.test_client()
+    session_id = _session_with_feedback(client, app)
+    url = f"/session/{session_id}/feedback"
+    first = client.get(url)
+    renders.clear()
+
+    get_render_cache_memory(app).clear()
+
+    assert client.get(url).data == first.data
+    assert renders == []
+    assert get_render_cache_memory(app).stats()["shared_hits"] == 1
+
+
+def test_deleting_a_session_drops_its_pages(app):
+    client = app.test_client()
+    session_id = _session_with_feedback(client, app)
+    client.get(f"/session/{session_id}/feedback")
+
+    with app.test_request_context():
+        assert db.session.scalar(db.select(db.func.count(RenderedPage.key))) == 1
+        get_container().session_service.delete_session(session_id)
+
+        assert db.session.scalar(db.select(db.func.count(RenderedPage.key))) == 0
+        assert get_render_cache_memory(app).stats()["entries"] == 0
+        assert db.session.get(Session, session_id) is None
+
+
+def test_failing_to_store_a_page_still_serves_it(app, caplog):
+    client = app.test_client()
+    session_id = _session_with_feedback(client, app)
+
+    def locked(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO rendered_pages"):
+            raise OperationalError(statement, None, Exception("database is locked"))
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, "before_cursor_execute", locked)
+    try:
+        with caplog.at_level(logging.WARNING):
+            response = client.get(f"/session/{session_id}/feedback")
+    finally:
+        event.remove(engine, "before_cursor_execute", locked)
+
+    assert response.status_code == 200
+    assert "Could not store rendered page" in caplog.text
@@ -0,0 +1,42 @@
+from app.repositories.request_cache import NullCache, RequestCache
+
+
+class TestRequestCache:
+    def test_loader_runs_once_per_key(self):
+        cache = RequestCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "session"
+
+        assert cache.get_or_load(1, "session", loader) == "session"
+        assert cache.get_or_load(1, "session", loader) == "session"
+        assert len(calls) == 1
+
+    def test_caches_none_results(self):
+        cache = RequestCache()
+        calls = []
+
+        def loader():
+            calls.append(1)
+
+        cache.get_or_load(99, "session", loader)
+        cache.get_or_load(99, "session", loader)
+        assert len(calls) == 1
+
+    def test_invalidate_drops_only_that_session(self):
+        cache = RequestCache()
+        cache.get_or_load(1, ("count", None), lambda: 1)
+        cache.get_or_load(2, ("count", None), lambda: 2)
+
+        cache.invalidate(1)
+
+        assert cache.get_or_load(1, ("count", None), lambda: 10) == 10
+        assert cache.get_or_load(2, ("count", None), lambda: 20) == 2
+
+    def test_null_cache_always_loads(self):
+        cache = NullCache()
+        values = iter([1, 2])
+        assert cache.get_or_load(1, "k", lambda: next(values)) == 1
+        assert cache.get_or_load(1, "k", lambda: next(values)) == 2
@@ -0,0 +1,80 @@
+import pytest
+from app.exceptions import ValidationError
+from app.repositories.search_repository import (
+    HIGHLIGHT_END,
+    HIGHLIGHT_START,
+    SearchRepository,
+    SearchResult,
+)
+from app.services.search_service import SearchService
+
+
+@pytest.fixture
+def mock_search_repo():
+    class MockSearchRepository:
+        def __init__(self):
+            self.calls = []
+            self.total = 23
+
+        def search(self, query, user_id, limit, offset):
+            self.calls.append((query, user_id, limit, offset))
+            result = SearchResult(
+                session_id=1,
+                kind=SearchRepository.KIND_MESSAGE,
+                snippet="snippet",
+                job_title="Engineer",
+                company_name="Acme",
+            )
+            return [result], self.total
+
+    return MockSearchRepository()
+
+
+@pytest.fixture
+def search_service(mock_search_repo):
+    return SearchService(mock_search_repo)
+
+
+class TestSearchService:
+    def test_search_paginates(self, search_service, mock_search_repo):
+        page = search_service.search("  caching  ", 7, page=3, per_page=10)
+
+        assert mock_search_repo.calls == [("caching", 7, 10, 20)]
+        assert page["query"] == "caching"
+        assert page["total"] == 23
+        assert page["page"] == 3
+        assert page["pages"] == 3
+
+    def test_search_clamps_page_to_first(self, search_service, mock_search_repo):
+        page = search_service.search("caching", 7, page=0)
+
+        assert page["page"] == 1
+        assert mock_search_repo.calls[0][3] == 0
+
+    def test_search_empty_query(self, search_service):
+        with pytest.raises(ValidationError, match="cannot be empty"):
+            search_service.search("   ", 7)
+
+    def test_search_query_too_long(self, search_service):
+        with pytest.raises(ValidationError, match="too long"):
+            search_service.search("a" * (SearchService.MAX_QUERY_LENGTH + 1), 7)
+
+    def test_highlight_escapes_snippet(self):
+        snippet = f"<script>x</script> {HIGHLIGHT_START}cache{HIGHLIGHT_END}"
+
+        html = SearchService.highlight(snippet)
+
+        assert "<script>" not in html
+        assert "&lt;script&gt;" in html
+        assert "<mark>cache</mark>" in html
+
+
+class TestFts5Query:
+    def test_quotes_terms_and_prefixes_last(self):
+        assert SearchRepository.to_fts5_query("kafka repl") == '"kafka" "repl"*'
+
+    def test_strips_fts5_syntax(self):
+        assert SearchRepository.to_fts5_query('NEAR(" OR -') == '"NEAR" "OR"*'
+
+    def test_no_terms(self):
+        assert SearchRepository.to_fts5_query("?! --") == ""
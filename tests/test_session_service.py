@@ -1,4 +1,5 @@
 import pytest
+from datetime import datetime, timedelta
 from app.exceptions import ValidationError, NotFoundError
 from app.services.session_service import SessionService
 
@@ -14,8 +15,11 @@ def mock_session_repo():
             self.company_name = company_name
             self.cv_text = cv_text
             self.job_description_text = job_description_text
+            self.has_cv = cv_text is not None
+            self.has_job_description = job_description_text is not None
             self.messages = ["msg1"]
             self.feedback = "positive"
+            self.created_at = datetime.now()
 
     class MockSessionRepository:
         def __init__(self):
@@ -35,12 +39,29 @@ def mock_session_repo():
                 raise NotFoundError("Session not found")
             del self.sessions[session_id]
 
+        def delete_many(self, session_ids):
+            deleted = [sid for sid in session_ids if sid in self.sessions]
+            for sid in deleted:
+                del self.sessions[sid]
+            return len(deleted)
+
+        def get_ids_created_before(self, cutoff, limit):
+            return [
+                sid for sid, s in self.sessions.items() if s.created_at < cutoff
+            ][:limit]
+
         def get_session_with_messages(self, session_id):
             return self.sessions.get(session_id)
 
         def get_session_with_feedback(self, session_id):
             return self.sessions.get(session_id)
 
+        def get_by_ids(self, session_ids):
+            return [self.sessions[sid] for sid in session_ids if sid in self.sessions]
+
+        def get_recent_for_user(self, user_id, limit):
+            return list(self.sessions.values())[:limit]
+
     return MockSessionRepository()
 
 
@@ -49,6 +70,102 @@ def session_service(mock_session_repo):
     return SessionService(mock_session_repo)
 
 
+@pytest.fixture
+def mock_user_repo():
+    class MockUser:
+        def __init__(self, id):
+            self.id = id
+
+    class MockUserRepository:
+        def __init__(self):
+            self.user_ids = {1}
+
+        def create(self):
+            user = MockUser(max(self.user_ids) + 1)
+            self.user_ids.add(user.id)
+            return user
+
+        def exists(self, user_id):
+            return user_id in self.user_ids
+
+    return MockUserRepository()
+
+
+@pytest.fixture
+def mock_archive_repo():
+    class MockArchivedSession:
+        is_archived = True
+
+        def __init__(self, id, created_at):
+            self.id = id
+            self.job_title = "Archived Engineer"
+            self.created_at = created_at
+
+    class MockTranscript:
+        def __init__(self, session):
+            self.session = session
+            self.messages = ["archived msg"]
+            self.feedback = "archived feedback"
+
+    class MockArchiveRepository:
+        def __init__(self):
+            self.archived = {
+                7: MockArchivedSession(7, datetime.now() - timedelta(days=60))
+            }
+
+        def get_summaries(self, session_ids):
+            return [self.archived[sid] for sid in session_ids if sid in self.archived]
+
+        def get_recent_summaries(self, user_id, limit):
+            return list(self.archived.values())[:limit]
+
+        def get_transcript(self, session_id):
+            session = self.archived.get(session_id)
+            return MockTranscript(session) if session else None
+
+    return MockArchiveRepository()
+
+
+@pytest.fixture
+def mock_ownership_repo():
+    class MockOwnershipRepository:
+        def __init__(self):
+            self.browsers = {}
+            self.owners = {1: 1}
+
+        def create_browser_session(self, user_id):
+            token = f"token-{len(self.browsers)}"
+            self.browsers[token] = user_id
+            return token
+
+        def get_user_id(self, token):
+            return self.browsers.get(token)
+
+        def get_owner_id(self, session_id):
+            return self.owners.get(session_id)
+
+        def claim(self, session_ids, user_id):
+            unowned = [sid for sid in session_ids if sid not in self.owners]
+            self.owners.update(dict.fromkeys(unowned, user_id))
+            return len(unowned)
+
+    return MockOwnershipRepository()
+
+
+@pytest.fixture
+def owning_session_service(mock_session_repo, mock_user_repo, mock_ownership_repo):
+    return SessionService(
+        mock_session_repo,
+        user_repository=mock_user_repo,
+        ownership_repository=mock_ownership_repo,
+    )
+
+
+@pytest.fixture
+def archiving_session_service(mock_session_repo, mock_archive_repo):
+    return SessionService(mock_session_repo, mock_archive_repo)
+
+
 class TestSessionService:
     def test_create_session_with_valid_data(self, session_service):
         session = session_service.create_session("Software Engineer", "Google")
@@ -72,6 +189,40 @@ class TestSessionService:
         with pytest.raises(ValidationError, match="Job title too long"):
             session_service.create_session("x" * 201, "Google")
 
+    def test_resolve_user_keeps_existing(self, mock_session_repo, mock_user_repo):
+        service = SessionService(mock_session_repo, user_repository=mock_user_repo)
+        assert service.resolve_user(1) == 1
+
+    def test_resolve_user_creates_when_missing(
+        self, mock_session_repo, mock_user_repo
+    ):
+        service = SessionService(mock_session_repo, user_repository=mock_user_repo)
+        assert service.resolve_user(None) == 2
+        assert service.resolve_user(99) == 3
+
+    # --- OWNERSHIP TESTS ---
+
+    def test_start_browser_session_creates_anonymous_user(self, owning_session_service):
+        token, user_id = owning_session_service.start_browser_session()
+        assert user_id == 2
+        assert owning_session_service.get_browser_user(token) == 2
+
+    def test_start_browser_session_claims_only_unowned_sessions(
+        self, owning_session_service, mock_ownership_repo
+    ):
+        _, user_id = owning_session_service.start_browser_session(None, [1, 5])
+        assert mock_ownership_repo.owners == {1: 1, 5: user_id}
+
+    def test_is_owner(self, owning_session_service):
+        assert owning_session_service.is_owner(1, 1) is True
+        assert owning_session_service.is_owner(1, 2) is False
+        assert owning_session_service.is_owner(99, 1) is False
+        assert owning_session_service.is_owner(1, None) is False
+
+    def test_ownership_requires_repository(self, session_service):
+        with pytest.raises(RuntimeError, match="ownership repository"):
+            session_service.is_owner(1, 1)
+
     # --- RETRIEVE TESTS ---
 
     def test_get_session_returns_existing(self, session_service):
@@ -97,6 +248,25 @@ class TestSessionService:
         with pytest.raises(NotFoundError):
             session_service.delete_session(99)
 
+    def test_delete_sessions_returns_deleted_count(self, session_service, mock_session_repo):
+        assert session_service.delete_sessions([1, 99]) == 1
+        assert mock_session_repo.sessions == {}
+
+    def test_purge_sessions_deletes_only_old_sessions(self, session_service, mock_session_repo):
+        old = mock_session_repo.create("Old", "Acme")
+        old.id = 2
+        old.created_at = datetime.now() - timedelta(days=45)
+        mock_session_repo.sessions[2] = old
+
+        purged = session_service.purge_sessions(30, batch_size=1)
+
+        assert purged == 1
+        assert list(mock_session_repo.sessions) == [1]
+
+    def test_purge_sessions_rejects_negative_retention(self, session_service):
+        with pytest.raises(ValidationError, match="cannot be negative"):
+            session_service.purge_sessions(-1)
+
     # --- READINESS TESTS ---
 
     def test_is_ready_for_interview_false_initially(self, session_service):
@@ -106,6 +276,8 @@ class TestSessionService:
         s = mock_session_repo.sessions[1]
         s.cv_text = "cv"
         s.job_description_text = "desc"
+        s.has_cv = True
+        s.has_job_description = True
         assert session_service.is_ready_for_interview(1) is True
 
     # --- FULL DETAILS TESTS ---
@@ -120,3 +292,35 @@ class TestSessionService:
         mock_session_repo.sessions.pop(1)
         with pytest.raises(NotFoundError, match="not found"):
             session_service.get_full_session_details(1)
+
+
+    # --- ARCHIVE FALLBACK TESTS ---
+
+    def test_get_session_ignores_archive_by_default(self, archiving_session_service):
+        with pytest.raises(NotFoundError):
+            archiving_session_service.get_session(7)
+
+    def test_get_session_falls_back_to_archive(self, archiving_session_service):
+        session = archiving_session_service.get_session(7, include_archived=True)
+        assert session.is_archived
+
+    def test_get_full_session_details_falls_back_to_archive(self, archiving_session_service):
+        details = archiving_session_service.get_full_session_details(7)
+        assert details["messages"] == ["archived msg"]
+        assert details["feedback"] == "archived feedback"
+
+    def test_get_sessions_by_ids_merges_archived_newest_first(self, archiving_session_service):
+        sessions = archiving_session_service.get_sessions_by_ids([7, 1])
+        assert [s.id for s in sessions] == [1, 7]
+
+    def test_get_recent_sessions_merges_archived_newest_first(self, archiving_session_service):
+        sessions = archiving_session_service.get_recent_sessions(1, limit=5)
+        assert [s.id for s in sessions] == [1, 7]
+        assert archiving_session_service.get_recent_sessions(1, limit=1)[0].id == 1
+
+    def test_get_recent_sessions_without_user(self, archiving_session_service):
+        assert archiving_session_service.get_recent_sessions(None) == []
+
+    def test_archive_sessions_rejects_negative_age(self, archiving_session_service):
+        with pytest.raises(ValidationError, match="cannot be negative"):
+            archiving_session_service.archive_sessions(-5)
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from pathlib import Path
+from sqlalchemy import inspect
+from app.models import db
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_create_app_leaves_schema_to_init_db(make_app):
+    app = make_app(CREATE_SCHEMA_ON_STARTUP=False)
+
+    with app.app_context():
+        assert inspect(db.engine).get_table_names() == []
+
+    result = app.test_cli_runner().invoke(args=["init-db"])
+
+    assert result.exit_code == 0
+    with app.app_context():
+        assert "sessions" in inspect(db.engine).get_table_names()
+
+
+def test_init_db_adds_missing_indexes_to_existing_tables(make_app):
+    app = make_app(CREATE_SCHEMA_ON_STARTUP=False)
+    runner = app.test_cli_runner()
+    runner.invoke(args=["init-db"])
+    with app.app_context():
+        db.session.execute(db.text("DROP INDEX ix_sessions_user_id"))
+        db.session.commit()
+
+    result = runner.invoke(args=["init-db"])
+
+    assert result.exit_code == 0
+    with app.app_context():
+        indexes = inspect(db.engine).get_indexes("sessions")
+        assert "ix_sessions_user_id" in [index["name"] for index in indexes]
+
+
+def test_provider_sdks_are_imported_on_first_use():
+    code = (
+        "import sys\n"
+        "from client.gemini_provider import GeminiProvider\n"
+        "from client.openrouter_provider import OpenRouterProvider\n"
+        "GeminiProvider('key'); OpenRouterProvider('key')\n"
+        "print('google.genai' in sys.modules, 'requests' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
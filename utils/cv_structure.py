@@ -0,0 +1,148 @@
+import re
+
+
+class CvStructurer:
+    """Splits CV text into titled sections and picks the ones worth a prompt.
+
+    Structuring runs once at upload time; the result is stored with the
+    document as a list of {'kind', 'title', 'text'} dicts. Text before the
+    first recognised heading (name, contact details) has kind 'header'.
+    """
+
+    SECTION_HEADINGS = {
+        'summary': (
+            'summary', 'profile', 'professional summary', 'personal profile',
+            'career summary', 'about me', 'objective', 'career objective',
+        ),
+        'experience': (
+            'experience', 'work experience', 'professional experience',
+            'relevant experience', 'employment', 'employment history',
+            'work history', 'career history',
+        ),
+        'skills': (
+            'skills', 'technical skills', 'key skills', 'core skills',
+            'skills and tools', 'competencies', 'core competencies',
+            'technologies', 'tech stack', 'tools',
+        ),
+        'projects': (
+            'projects', 'personal projects', 'selected projects', 'side projects',
+            'key projects', 'open source',
+        ),
+        'education': (
+            'education', 'academic background', 'qualifications',
+            'education and training', 'education and qualifications',
+        ),
+        'certifications': (
+            'certifications', 'certificates', 'licenses and certifications',
+            'courses', 'training',
+        ),
+    }
+    # Tie-breaker when sections are equally relevant to the job description
+    PRIORITY = ('header', 'summary', 'experience', 'skills', 'projects',
+                'education', 'certifications')
+    MAX_HEADING_CHARS = 50
+    # A section cut shorter than this says too little to be worth including
+    MIN_SECTION_CHARS = 200
+    SEPARATOR = '\n\n'
+
+    _HEADINGS = {
+        heading: kind for kind, headings in SECTION_HEADINGS.items() for heading in headings
+    }
+    _WORD = re.compile(r'[a-z][a-z0-9+#.]*')
+
+    @classmethod
+    def structure(cls, text: str) -> list[dict]:
+        sections = [{'kind': 'header', 'title': '', 'lines': []}]
+        for line in text.split('\n'):
+            kind = cls._heading_kind(line)
+            if kind:
+                sections.append({'kind': kind, 'title': line.strip(), 'lines': []})
+            else:
+                sections[-1]['lines'].append(line)
+
+        return [
+            {'kind': s['kind'], 'title': s['title'], 'text': '\n'.join(s['lines']).strip()}
+            for s in sections
+            if s['title'] or any(line.strip() for line in s['lines'])
+        ]
+
+    @classmethod
+    def prompt_text(
+        cls,
+        cv_text: str | None,
+        sections: list[dict] | None,
+        job_description: str | None,
+        max_chars: int,
+    ) -> str:
+        """At most `max_chars` of the CV, made of the sections most relevant
+        to the job description, kept in their original order"""
+        if not cv_text:
+            return ''
+        if len(cv_text) <= max_chars:
+            return cv_text
+        if sections is None:
+            # Documents stored before structuring existed
+            sections = cls.structure(cv_text)
+
+        texts = [
+            f"{s['title']}\n{s['text']}".strip() if s['title'] else s['text']
+            for s in sections
+        ]
+        budget = max_chars - len(cls.SEPARATOR) * (len(texts) - 1)
+        ranked, relevant = cls._rank(sections, texts, job_description or '')
+
+        # First the header and sections sharing words with the job, none
+        # taking more than half the budget; then whatever fits, in rank order
+        allotted = [0] * len(texts)
+        for candidates, cap in ((relevant, budget // 2), (ranked, budget)):
+            for i in candidates:
+                take = min(len(texts[i]), cap, allotted[i] + budget) - allotted[i]
+                if take > 0:
+                    allotted[i] += take
+                    budget -= take
+
+        parts = [
+            cls._cut(text, chars)
+            for text, chars in zip(texts, allotted)
+            if chars == len(text) or chars >= cls.MIN_SECTION_CHARS
+        ]
+        return cls.SEPARATOR.join(part for part in parts if part)
+
+    @classmethod
+    def _heading_kind(cls, line: str) -> str | None:
+        if not line or len(line) > cls.MAX_HEADING_CHARS:
+            return None
+        normalized = line.lower().replace('&', ' and ')
+        normalized = ' '.join(re.sub(r'[^a-z ]', ' ', normalized).split())
+        return cls._HEADINGS.get(normalized)
+
+    @classmethod
+    def _rank(
+        cls, sections: list[dict], texts: list[str], job_description: str
+    ) -> tuple[list[int], list[int]]:
+        """Section indexes, most relevant first, and the relevant ones alone"""
+        wanted = set(cls._WORD.findall(job_description.lower()))
+        matches = [len(wanted & set(cls._WORD.findall(text.lower()))) for text in texts]
+
+        def key(i):
+            kind = sections[i]['kind']
+            if kind == 'header':
+                return (0, 0, 0)
+            priority = cls.PRIORITY.index(kind) if kind in cls.PRIORITY else len(cls.PRIORITY)
+            return (1, -matches[i], priority)
+
+        ranked = sorted(range(len(sections)), key=key)
+        relevant = [i for i in ranked if sections[i]['kind'] == 'header' or matches[i]]
+        return ranked, relevant
+
+    @staticmethod
+    def _cut(text: str, chars: int) -> str:
+        if len(text) <= chars:
+            return text
+        cut = text[:chars]
+        # Prefer ending on a line, then a word, unless that loses too much
+        for boundary in ('\n', ' '):
+            index = cut.rfind(boundary)
+            if index >= chars * 0.6:
+                return cut[:index].rstrip()
+        return cut
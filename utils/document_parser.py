@@ -1,9 +1,15 @@
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
+from typing import BinaryIO
 from app.exceptions import DocumentParsingError
 
 
 class DocumentParser:
     SUPPORTED_EXTENSIONS = {'.pdf', '.docx', '.txt'}
+    # Bump whenever extraction output changes; it is part of the parse cache key
+    VERSION = '4'
 
     @classmethod
     def extract_text(cls, file_path: str) -> str:
@@ -11,89 +17,177 @@ class DocumentParser:
         if not path.exists():
             raise DocumentParsingError(f"File not found: {file_path}")
 
-        extension = path.suffix.lower()
+        return cls._extract(file_path, path.suffix.lower())
 
+    @classmethod
+    def extract_text_from_stream(
+        cls,
+        stream: BinaryIO,
+        filename: str,
+        max_pages: int | None = None,
+        spool_dir: str | os.PathLike | None = None,
+    ) -> str:
+        """Parse an in-memory or spooled upload; `filename` only picks the
+        parser. PDFs over `max_pages` (PdfExtractor.MAX_PAGES by default) are
+        rejected, and large ones are copied to `spool_dir` to be parsed in
+        parallel."""
+        return cls._extract(
+            stream, Path(filename).suffix.lower(), max_pages, spool_dir
+        )
+
+    @classmethod
+    def extract_prefix(
+        cls,
+        stream: BinaryIO,
+        filename: str,
+        max_chars: int,
+        max_pages: int | None = None,
+    ) -> tuple[str, bool]:
+        """Parse only until `max_chars` characters of text have been read.
+
+        Returns the cleaned text, cut at `max_chars`, and whether the whole
+        document was read. Pages or paragraphs past the budget are never parsed.
+        """
+        extension = Path(filename).suffix.lower()
+        cls._check_extension(extension)
+
+        with cls._parse_errors():
+            parts = []
+            read = 0
+            complete = True
+            chunks = cls._iter_text(stream, extension, max_pages)
+            for chunk in chunks:
+                parts.append(chunk)
+                read += len(chunk)
+                if read >= max_chars:
+                    complete = False
+                    chunks.close()
+                    break
+
+            text = cls._clean_text('\n'.join(parts))
+            if not text:
+                raise DocumentParsingError("No text content could be extracted from the document")
+            return text[:max_chars], complete
+
+    @classmethod
+    def _iter_text(
+        cls, stream: BinaryIO, extension: str, max_pages: int | None
+    ) -> Iterator[str]:
+        if extension == '.pdf':
+            from utils.pdf_extractor import PdfExtractor
+            yield from PdfExtractor.iter_pages(stream, max_pages)
+        elif extension == '.docx':
+            from utils.docx_extractor import DocxExtractor
+            yield from DocxExtractor.iter_blocks(stream)
+        else:
+            yield cls._extract_from_txt(stream)
+
+    @classmethod
+    def _check_extension(cls, extension: str) -> None:
         if extension not in cls.SUPPORTED_EXTENSIONS:
             raise DocumentParsingError(
                 f"Unsupported file type: {extension}. "
                 f"Supported types: {', '.join(cls.SUPPORTED_EXTENSIONS)}"
             )
-        
+
+    @staticmethod
+    @contextmanager
+    def _parse_errors():
         try:
+            yield
+        except DocumentParsingError:
+            raise
+        except MemoryError:
+            raise DocumentParsingError("Document needs too much memory to parse")
+        except Exception as e:
+            raise DocumentParsingError(f"Failed to parse document: {str(e)}")
+
+    @classmethod
+    def _extract(
+        cls,
+        source: str | os.PathLike | BinaryIO,
+        extension: str,
+        max_pages: int | None = None,
+        spool_dir: str | os.PathLike | None = None,
+    ) -> str:
+        cls._check_extension(extension)
+
+        with cls._parse_errors():
             if extension == '.pdf':
-                text = cls._extract_from_pdf(file_path)
+                text = cls._extract_from_pdf(source, max_pages, spool_dir)
             elif extension == '.docx':
-                text = cls._extract_from_docx(file_path)
+                text = cls._extract_from_docx(source)
             elif extension == '.txt':
-                text = cls._extract_from_txt(file_path)
+                text = cls._extract_from_txt(source)
             else:
                 raise DocumentParsingError(f"No parser for {extension}")
             
             return cls._clean_text(text)
-        
-        except DocumentParsingError:
-            raise
-        except Exception as e:
-            raise DocumentParsingError(f"Failed to parse document: {str(e)}")
-        
 
     @staticmethod
-    def _extract_from_pdf(file_path: str) -> str:
-        import pdfplumber
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                if not pdf.pages:
-                    raise DocumentParsingError("PDF file is empty or corrupted")
-                
-                text_parts = [page.extract_text() for page in pdf.pages if page.extract_text()]
-            
-            full_text = '\n'.join(text_parts)
+    def _extract_from_pdf(
+        source: str | os.PathLike | BinaryIO,
+        max_pages: int | None = None,
+        spool_dir: str | os.PathLike | None = None,
+    ) -> str:
+        from utils.pdf_extractor import PdfExtractor
+        return PdfExtractor.extract(source, max_pages, spool_dir)
 
-            if not full_text.strip():
-                raise DocumentParsingError("No text content could be extracted from the PDF")
-            
-            return full_text
-        except Exception as e:
-            raise DocumentParsingError(f"Failed to read PDF with pdfplumber: {e}")
+    @staticmethod
+    def _extract_from_docx(source: str | os.PathLike | BinaryIO) -> str:
+        from utils.docx_extractor import DocxExtractor
+        return DocxExtractor.extract(source)
 
     @staticmethod
-    def _extract_from_docx(file_path: str) -> str:
-        from docx import Document
+    def _extract_from_txt(source: str | os.PathLike | BinaryIO) -> str:
         try:
-            doc = Document(file_path)
-            paragraphs = [para.text for para in doc.paragraphs]
-            full_text = '\n'.join(paragraphs)
-
-            if not full_text.strip():
-                raise DocumentParsingError("No text content found in DOCX")
-            
-            return full_text
-
+            if isinstance(source, (str, os.PathLike)):
+                with open(source, 'rb') as file:
+                    data = file.read()
+            else:
+                data = source.read()
         except Exception as e:
-            raise DocumentParsingError(f"Invalid DOCX file: {e}")
-        
-    @staticmethod
-    def _extract_from_txt(file_path: str) -> str:
+            raise DocumentParsingError(f"Failed to read text file: {e}")
+
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                text = file.read()
-            
-            if not text.strip():
-                raise DocumentParsingError("Text file is empty")
-            
-            return text
-        
+            text = data.decode('utf-8')
         except UnicodeDecodeError:
-            try:
-                with open(file_path, 'r', encoding='latin-1') as file:
-                    text = file.read()
-                return text
-            except Exception as e:
-                raise DocumentParsingError(f"Failed to read text file: {e}")
+            return data.decode('latin-1')
+
+        if not text.strip():
+            raise DocumentParsingError("Text file is empty")
+
+        return text
             
     @staticmethod
     def _clean_text(text: str) -> str:
-        text = ' '.join(text.split())
-        lines = [line.strip() for line in text.split('\n')]
-        lines = [line for line in lines if line]        
-        return '\n'.join(lines)
\ No newline at end of file
+        # Collapse whitespace within lines only; line breaks carry the
+        # section structure CvStructurer relies on
+        lines = (' '.join(line.split()) for line in text.splitlines())
+        return '\n'.join(line for line in lines if line)
+
+
+class InProcessParser:
+    """DocumentParser with an app's own limits, for apps that parse in the
+    request's process. Same interface as SandboxedParser, so the limits of
+    one app never leak into another through class attributes."""
+
+    VERSION = DocumentParser.VERSION
+
+    def __init__(
+        self, max_pages: int = 100, spool_dir: str | os.PathLike | None = None
+    ):
+        self.max_pages = max_pages
+        self.spool_dir = spool_dir
+
+    def extract_text_from_stream(self, stream: BinaryIO, filename: str) -> str:
+        return DocumentParser.extract_text_from_stream(
+            stream, filename, self.max_pages, self.spool_dir
+        )
+
+    def extract_prefix(
+        self, stream: BinaryIO, filename: str, max_chars: int
+    ) -> tuple[str, bool]:
+        return DocumentParser.extract_prefix(
+            stream, filename, max_chars, self.max_pages
+        )
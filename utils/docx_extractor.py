@@ -0,0 +1,170 @@
+import posixpath
+import zipfile
+from collections.abc import Iterator
+from typing import BinaryIO
+from xml.etree import ElementTree
+from app.exceptions import DocumentParsingError
+
+
+_WORD_NAMESPACES = {
+    'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
+    'http://purl.oclc.org/ooxml/wordprocessingml/main',  # ISO strict
+}
+_FALLBACK_TAG = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+_RELATIONSHIP_TAG = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
+
+class DocxExtractor:
+    """Streaming DOCX text extraction.
+
+    Reads the WordprocessingML parts straight from the zip with iterparse
+    instead of building python-docx's object model, so memory stays bounded
+    by the largest paragraph or table row rather than the document. Emits
+    header text, then body paragraphs and table rows in document order, then
+    footer text; a table row's cells are joined with ' | '.
+    """
+
+    CELL_SEPARATOR = ' | '
+
+    @classmethod
+    def extract(cls, source: str | BinaryIO) -> str:
+        full_text = '\n'.join(cls.iter_blocks(source))
+        if not full_text.strip():
+            raise DocumentParsingError("No text content found in DOCX")
+        return full_text
+
+    @classmethod
+    def iter_blocks(cls, source: str | BinaryIO) -> Iterator[str]:
+        """Paragraph and table row texts, each parsed only when asked for"""
+        try:
+            archive = zipfile.ZipFile(source)
+        except (zipfile.BadZipFile, OSError) as e:
+            raise DocumentParsingError(f"Invalid DOCX file: {e}")
+
+        with archive:
+            document = _main_part(archive)
+            headers, footers = _header_footer_parts(archive, document)
+
+            seen = set()
+            for part in headers:
+                yield from _unique_blocks(cls._iter_part(archive, part), seen)
+            yield from cls._iter_part(archive, document)
+            for part in footers:
+                yield from _unique_blocks(cls._iter_part(archive, part), seen)
+
+    @classmethod
+    def _iter_part(cls, archive: zipfile.ZipFile, name: str) -> Iterator[str]:
+        paragraphs = []  # text boxes nest paragraphs inside paragraphs
+        cells = []
+        rows = []
+        container = None
+        skipping = 0  # inside mc:Fallback, which repeats the mc:Choice content
+
+        try:
+            with archive.open(name) as xml:
+                for event, elem in ElementTree.iterparse(xml, events=('start', 'end')):
+                    if container is None:
+                        container = elem
+                    if elem.tag == _FALLBACK_TAG:
+                        skipping += 1 if event == 'start' else -1
+                        continue
+                    if skipping:
+                        continue
+
+                    namespace, _, tag = elem.tag[1:].partition('}')
+                    if namespace not in _WORD_NAMESPACES:
+                        continue
+
+                    if event == 'start':
+                        if tag == 'body':
+                            container = elem
+                        elif tag == 'p':
+                            paragraphs.append([])
+                        elif tag == 'tc':
+                            cells.append([])
+                        elif tag == 'tr':
+                            rows.append([])
+                        continue
+
+                    if tag == 't' and paragraphs:
+                        paragraphs[-1].append(elem.text or '')
+                    elif tag == 'tab' and paragraphs:
+                        paragraphs[-1].append('\t')
+                    elif tag in ('br', 'cr') and paragraphs:
+                        paragraphs[-1].append('\n')
+                    elif tag == 'p':
+                        text = ''.join(paragraphs.pop())
+                        if paragraphs:
+                            paragraphs[-1].append(text)
+                        elif cells:
+                            cells[-1].append(text)
+                        elif text:
+                            yield text
+                    elif tag == 'tc':
+                        text = '\n'.join(t for t in cells.pop() if t)
+                        if rows:
+                            rows[-1].append(text)
+                    elif tag == 'tr':
+                        text = cls.CELL_SEPARATOR.join(t for t in rows.pop() if t)
+                        if cells:
+                            cells[-1].append(text)  # nested table
+                        elif text:
+                            yield text
+
+                    if not (paragraphs or cells or rows):
+                        # Between top-level blocks: drop everything parsed so far
+                        container.clear()
+        except KeyError:
+            raise DocumentParsingError(f"Invalid DOCX file: missing {name}")
+        except ElementTree.ParseError as e:
+            raise DocumentParsingError(f"Invalid DOCX file: {e}")
+
+
+def _unique_blocks(blocks: Iterator[str], seen: set[str]) -> Iterator[str]:
+    # First-page, even-page and default headers usually repeat each other
+    for block in blocks:
+        if block not in seen:
+            seen.add(block)
+            yield block
+
+
+def _relationships(archive: zipfile.ZipFile, part: str) -> list[tuple[str, str]]:
+    """(type, target part) pairs from the relationships of `part`"""
+    directory, filename = posixpath.split(part)
+    rels = posixpath.join(directory, '_rels', f'{filename}.rels')
+    try:
+        with archive.open(rels) as xml:
+            tree = ElementTree.parse(xml)
+    except KeyError:
+        return []
+    except ElementTree.ParseError as e:
+        raise DocumentParsingError(f"Invalid DOCX file: {e}")
+
+    relationships = []
+    for rel in tree.getroot().iter(_RELATIONSHIP_TAG):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target', '')
+        if target.startswith('/'):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(directory, target))
+        relationships.append((rel.get('Type', ''), target))
+    return relationships
+
+
+def _main_part(archive: zipfile.ZipFile) -> str:
+    for kind, target in _relationships(archive, ''):
+        if kind.endswith('/officeDocument'):
+            return target
+    return 'word/document.xml'
+
+
+def _header_footer_parts(archive: zipfile.ZipFile, document: str):
+    headers, footers = [], []
+    for kind, target in _relationships(archive, document):
+        if kind.endswith('/header'):
+            headers.append(target)
+        elif kind.endswith('/footer'):
+            footers.append(target)
+    return sorted(headers), sorted(footers)
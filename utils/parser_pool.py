@@ -0,0 +1,168 @@
+import io
+import logging
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from contextlib import contextmanager
+from typing import BinaryIO
+from app.exceptions import DocumentParsingError
+from utils.document_parser import DocumentParser
+
+
+logger = logging.getLogger(__name__)
+
+
+class SandboxedParser:
+    """Runs DocumentParser in a pool of resource-limited worker processes.
+
+    Each job gets a wall-clock timeout, enforced inside the worker so a slow
+    document fails without killing the process, each worker an address-space
+    cap (RLIMIT_AS) and a PDF page cap, and workers are replaced after
+    `max_jobs_per_worker` jobs so leaked memory never accumulates. A pool
+    whose worker died, or is stuck where the timeout cannot interrupt it, is
+    retired: jobs already on it finish there, new jobs go to a fresh pool.
+    Drop-in replacement for DocumentParser in DocumentService.
+    """
+
+    VERSION = DocumentParser.VERSION
+    # Extra seconds the caller waits for a worker to report its own timeout
+    TIMEOUT_GRACE = 2
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 30,
+        memory_limit_mb: int = 1024,
+        max_pages: int = 100,
+        max_jobs_per_worker: int = 50,
+    ):
+        self.workers = workers
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_pages = max_pages
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def extract_text_from_stream(self, stream: BinaryIO, filename: str) -> str:
+        return self._run(_parse_in_worker, stream.read(), filename)
+
+    def extract_prefix(
+        self, stream: BinaryIO, filename: str, max_chars: int
+    ) -> tuple[str, bool]:
+        return self._run(_parse_prefix_in_worker, stream.read(), filename, max_chars)
+
+    def _run(self, job, data: bytes, filename: str, *args):
+        pool = self._get_pool()
+        try:
+            future = pool.submit(
+                _run_with_time_limit, self.timeout, job, data, filename, *args
+            )
+        except BrokenProcessPool:
+            self._discard(pool)
+            raise DocumentParsingError("Document parser is restarting, please retry")
+
+        try:
+            return future.result(timeout=self.timeout + self.TIMEOUT_GRACE)
+        except FuturesTimeoutError:
+            logger.warning(
+                f"Parser worker stuck on {filename} past its {self.timeout}s limit"
+            )
+            self._discard(pool)
+            raise DocumentParsingError("Document took too long to parse")
+        except BrokenProcessPool:
+            logger.warning(f"Parser worker died while parsing {filename}")
+            self._discard(pool)
+            raise DocumentParsingError("Document could not be parsed safely")
+        except DocumentParsingError:
+            raise
+        except Exception as e:
+            raise DocumentParsingError(f"Failed to parse document: {e!r}")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    # spawn: never fork a multi-threaded web worker
+                    mp_context=get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.memory_limit_mb, self.max_pages),
+                    max_tasks_per_child=self.max_jobs_per_worker,
+                )
+            return self._pool
+
+    def _discard(self, pool: ProcessPoolExecutor) -> None:
+        """Send new jobs to a fresh pool; the jobs other requests already
+        queued on this one still run, and its workers exit once they are done"""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False)
+
+
+def _init_worker(memory_limit_mb: int, max_pages: int) -> None:
+    from utils.pdf_extractor import PdfExtractor
+
+    try:
+        import resource
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Could not cap parser worker memory: {e}")
+
+    PdfExtractor.MAX_PAGES = max_pages
+    # The sandbox already spreads documents over its workers
+    PdfExtractor.MAX_WORKERS = 1
+
+
+class _JobTimeout(BaseException):
+    # A BaseException, so the parsers' own `except Exception` handlers cannot
+    # swallow it and carry on with the document
+    pass
+
+
+@contextmanager
+def _time_limit(seconds: float):
+    """Interrupt the job with _JobTimeout after `seconds`. Pool workers run
+    jobs on their main thread, where signal handlers run; where there is no
+    SIGALRM, only the caller's timeout applies."""
+    if not hasattr(signal, "setitimer"):
+        yield
+        return
+
+    def expire(signum, frame):
+        raise _JobTimeout
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _run_with_time_limit(seconds: float, job, *args):
+    try:
+        with _time_limit(seconds):
+            return job(*args)
+    except _JobTimeout:
+        raise DocumentParsingError("Document took too long to parse") from None
+
+
+def _parse_in_worker(data: bytes, filename: str) -> str:
+    return DocumentParser.extract_text_from_stream(io.BytesIO(data), filename)
+
+
+def _parse_prefix_in_worker(data: bytes, filename: str, max_chars: int):
+    return DocumentParser.extract_prefix(io.BytesIO(data), filename, max_chars)
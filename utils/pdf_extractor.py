@@ -0,0 +1,264 @@
+import io
+import os
+import re
+import shutil
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import get_context
+from typing import BinaryIO
+from app.exceptions import DocumentParsingError
+
+
+class PdfExtractor:
+    """Single-pass PDF text extraction.
+
+    pypdf reads every page first because it is an order of magnitude cheaper
+    than pdfplumber's layout analysis; only pages that come back empty or
+    garbled are re-read with pdfplumber. Documents with many pages are split
+    into page ranges and extracted in a process pool.
+    """
+
+    MAX_PAGES = 100
+    PARALLEL_MIN_PAGES = 16
+    PAGES_PER_TASK = 8
+    MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+    _pool = None
+
+    @classmethod
+    def extract(
+        cls,
+        source: str | os.PathLike | BinaryIO,
+        max_pages: int | None = None,
+        spool_dir: str | os.PathLike | None = None,
+    ) -> str:
+        """Text of a PDF given as a path or a seekable binary stream, with at
+        most `max_pages` pages (MAX_PAGES by default). A stream extracted in
+        parallel is spooled to `spool_dir`, or the system temp directory."""
+        reader = cls._open(source, max_pages)
+        if reader is None:
+            return cls._join(cls._extract_with_pdfplumber(source, max_pages))
+
+        page_count = len(reader.pages)
+        if page_count < cls.PARALLEL_MIN_PAGES or cls.MAX_WORKERS < 2:
+            pages = extract_page_range(source, 0, page_count, reader)
+        else:
+            with _as_path(source, spool_dir) as path:
+                pages = cls._extract_in_parallel(path, page_count)
+
+        return cls._join(pages)
+
+    @classmethod
+    def iter_pages(
+        cls, source: str | os.PathLike | BinaryIO, max_pages: int | None = None
+    ) -> Iterator[str]:
+        """Page texts in order, each parsed only when the caller asks for it"""
+        reader = cls._open(source, max_pages)
+        if reader is None:
+            yield from cls._iter_with_pdfplumber(source, max_pages)
+            return
+        yield from iter_page_range(source, 0, len(reader.pages), reader)
+
+    @classmethod
+    def _open(cls, source, max_pages: int | None):
+        """A pypdf reader within the page cap, or None if pypdf cannot read it"""
+        try:
+            from pypdf import PdfReader
+            reader = PdfReader(source)
+            page_count = len(reader.pages)
+        except Exception:
+            # pdfplumber is more lenient with broken files
+            if not isinstance(source, (str, os.PathLike)):
+                source.seek(0)
+            return None
+
+        cls._check_page_count(page_count, max_pages)
+        return reader
+
+    @classmethod
+    def _check_page_count(cls, page_count: int, max_pages: int | None) -> None:
+        max_pages = max_pages or cls.MAX_PAGES
+        if page_count == 0:
+            raise DocumentParsingError("PDF file is empty or corrupted")
+        if page_count > max_pages:
+            raise DocumentParsingError(
+                f"PDF has too many pages ({page_count}, max {max_pages})"
+            )
+
+    @classmethod
+    def _extract_in_parallel(cls, path: str | os.PathLike, page_count: int) -> list[str]:
+        ranges = [
+            (start, min(start + cls.PAGES_PER_TASK, page_count))
+            for start in range(0, page_count, cls.PAGES_PER_TASK)
+        ]
+        pool = cls._get_pool()
+        futures = [
+            pool.submit(extract_page_range, path, start, stop)
+            for start, stop in ranges
+        ]
+        pages = []
+        for future in futures:
+            pages.extend(future.result())
+        return pages
+
+    @classmethod
+    def _get_pool(cls) -> ProcessPoolExecutor:
+        # Created on first use so it belongs to the worker process that needs
+        # it; spawn avoids forking a multi-threaded web server
+        if cls._pool is None:
+            cls._pool = ProcessPoolExecutor(
+                max_workers=cls.MAX_WORKERS, mp_context=get_context('spawn')
+            )
+        return cls._pool
+
+    @classmethod
+    def _extract_with_pdfplumber(
+        cls, source: str | os.PathLike | BinaryIO, max_pages: int | None
+    ) -> list[str]:
+        return list(cls._iter_with_pdfplumber(source, max_pages))
+
+    @classmethod
+    def _iter_with_pdfplumber(
+        cls, source: str | os.PathLike | BinaryIO, max_pages: int | None
+    ) -> Iterator[str]:
+        """Page texts in order, each laid out only when the caller asks for it"""
+        import pdfplumber
+        try:
+            with pdfplumber.open(source) as pdf:
+                # Counting pages is cheap; the cap must hold before any layout
+                # analysis, or a large malformed PDF would bypass it
+                cls._check_page_count(len(pdf.pages), max_pages)
+                for page in pdf.pages:
+                    yield page.extract_text() or ''
+        except DocumentParsingError:
+            raise
+        except Exception as e:
+            raise DocumentParsingError(f"Failed to read PDF with pdfplumber: {e}")
+
+    @staticmethod
+    def _join(pages: list[str]) -> str:
+        full_text = '\n'.join(text for text in pages if text)
+        if not full_text.strip():
+            raise DocumentParsingError("No text content could be extracted from the PDF")
+        return full_text
+
+
+_CID_PATTERN = re.compile(r'\(cid:\d+\)')
+
+
+def is_garbled(text: str | None) -> bool:
+    """Heuristic for text pypdf could not decode properly"""
+    if not text or not text.strip():
+        return True
+
+    length = len(text)
+    unreadable = text.count('�') + 8 * len(_CID_PATTERN.findall(text))
+    unreadable += sum(1 for ch in text if not ch.isprintable() and ch not in '\n\t')
+    if unreadable / length > 0.05:
+        return True
+
+    # Missing word spacing: long runs of text with almost no whitespace
+    return length > 200 and sum(ch.isspace() for ch in text) / length < 0.05
+
+
+def extract_page_range(source, start: int, stop: int, reader=None) -> list[str]:
+    """Text of pages [start, stop). Module-level so it can be pickled into the
+    process pool."""
+    return list(iter_page_range(source, start, stop, reader))
+
+
+def iter_page_range(source, start: int, stop: int, reader=None) -> Iterator[str]:
+    """Text of pages [start, stop), each page's layout analysed at most once.
+
+    `source` is a path or a seekable stream. pdfplumber is only opened once
+    a page needs it.
+    """
+    if reader is None:
+        from pypdf import PdfReader
+        reader = PdfReader(source)
+
+    fallback = None
+    try:
+        for index in range(start, stop):
+            try:
+                text = reader.pages[index].extract_text()
+            except Exception:
+                text = None
+
+            if is_garbled(text):
+                if fallback is None:
+                    import pdfplumber
+                    fallback = pdfplumber.open(_separate_handle(source))
+                retry = fallback.pages[index].extract_text()
+                if retry and retry.strip():
+                    text = retry
+
+            yield text or ''
+    finally:
+        if fallback is not None:
+            fallback.close()
+
+
+def _separate_handle(source):
+    """pypdf keeps reading `source` lazily, so pdfplumber gets a view of the
+    same stream with a position of its own"""
+    if isinstance(source, (str, os.PathLike)):
+        return source
+    return io.BufferedReader(_StreamView(source))
+
+
+class _StreamView(io.RawIOBase):
+    """Reads a shared seekable stream from its own position, without copying
+    it. Every read seeks first, as pypdf does, so the two can interleave."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._stream.seek(0, io.SEEK_END)
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer) -> int:
+        self._stream.seek(self._position)
+        data = self._stream.read(len(buffer))
+        buffer[:len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+
+@contextmanager
+def _as_path(
+    source: str | os.PathLike | BinaryIO, spool_dir: str | os.PathLike | None
+) -> Iterator[str | os.PathLike]:
+    """A path pool workers can open. Streams cannot cross process boundaries,
+    so they are spooled to a temporary file in `spool_dir` in chunks, not read
+    into memory."""
+    if isinstance(source, (str, os.PathLike)):
+        yield source
+        return
+
+    source.seek(0)
+    with tempfile.NamedTemporaryFile(
+        suffix='.pdf', dir=spool_dir, delete=False
+    ) as spooled:
+        shutil.copyfileobj(source, spooled)
+    try:
+        yield spooled.name
+    finally:
+        os.unlink(spooled.name)
@@ -1,4 +1,7 @@
 class PromptTemplates:
+    # CV characters per prompt; callers pick the sections that fit
+    CV_CHARS = 2000
+    FOLLOWUP_CV_CHARS = 1500
     
     @staticmethod
     def first_question_generation(
@@ -10,7 +13,7 @@ class PromptTemplates:
         return f"""You are an experienced interviewer starting an interview for {job_title} at {company_name}.
 
     CANDIDATE'S CV:
-    {cv_text[:2000]}
+    {cv_text[:PromptTemplates.CV_CHARS]}
 
     JOB DESCRIPTION:
     {job_description[:2000]}
@@ -41,7 +44,7 @@ class PromptTemplates:
     {conversation_history}
 
     CANDIDATE'S CV (for context):
-    {cv_text[:1500]}
+    {cv_text[:PromptTemplates.FOLLOWUP_CV_CHARS]}
 
     JOB REQUIREMENTS (for context):
     {job_description[:1500]}
@@ -75,7 +78,7 @@ JOB REQUIREMENTS:
 {job_description}
 
 CANDIDATE'S CV:
-{cv_text[:2000]}
+{cv_text[:PromptTemplates.CV_CHARS]}
 
 INTERVIEW TRANSCRIPT:
 {conversation_history}